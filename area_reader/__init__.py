@@ -1,23 +1,43 @@
 """Readers for supported MUD area formats."""
 
-from area_reader.dialects.circle import CircleAreaFile
-from area_reader.dialects.coffeemud import CoffeeMudAreaFile
-from area_reader.dialects.godwars import GodWarsAreaFile
-from area_reader.dialects.medievia import MedieviaAreaFile
-from area_reader.dialects.merc import MercAreaFile
-from area_reader.dialects.rom import RomAreaFile
-from area_reader.dialects.smaug import SmaugAreaFile
-from area_reader.dialects.swr import SwrAreaFile
-from area_reader.dialects.tba import TbaAreaFile
+import importlib
 
-__all__ = (
-    "CircleAreaFile",
-    "CoffeeMudAreaFile",
-    "GodWarsAreaFile",
-    "MedieviaAreaFile",
-    "MercAreaFile",
-    "RomAreaFile",
-    "SmaugAreaFile",
-    "SwrAreaFile",
-    "TbaAreaFile",
-)
+_EXPORTS = {
+    "CircleAreaFile": "area_reader.dialects.circle",
+    "CoffeeMudAreaFile": "area_reader.dialects.coffeemud",
+    "Detection": "area_reader.cli",
+    "GodWarsAreaFile": "area_reader.dialects.godwars",
+    "LoadResult": "area_reader.cli",
+    "MedieviaAreaFile": "area_reader.dialects.medievia",
+    "MercAreaFile": "area_reader.dialects.merc",
+    "ParseCache": "area_reader.cache",
+    "RomAreaFile": "area_reader.dialects.rom",
+    "SmaugAreaFile": "area_reader.dialects.smaug",
+    "SnapshotError": "area_reader.snapshot",
+    "SwrAreaFile": "area_reader.dialects.swr",
+    "TbaAreaFile": "area_reader.dialects.tba",
+    "detect_many": "area_reader.cli",
+    "dump_snapshot": "area_reader.snapshot",
+    "iter_records": "area_reader.cli",
+    "load_area": "area_reader.cli",
+    "load_many": "area_reader.cli",
+    "load_snapshot": "area_reader.snapshot",
+    "unstructure_many": "area_reader.serialization",
+}
+
+__all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the module behind a public name on first use (PEP 562)."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,116 @@
+"""Opt-in on-disk cache of parsed area models."""
+
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import time
+
+CACHE_FORMAT = 2
+MTIME_SLACK_NS = 2 * 10**9
+TRANSIENT_ATTRIBUTES = frozenset({"data", "index", "line_index", "reader_plans", "readers"})
+
+try:
+    LIBRARY_VERSION = importlib.metadata.version("area-reader")
+except importlib.metadata.PackageNotFoundError:
+    LIBRARY_VERSION = "unknown"
+
+
+def fingerprint(path):
+    """Return (size, mtime_ns, sha256) for a file, or None when it is missing."""
+    try:
+        stat = os.stat(path)
+        with open(path, mode="rb") as source_file:
+            digest = hashlib.sha256(source_file.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns, digest
+
+
+def drop_transient_state(area_file):
+    """Remove the source buffer and parsing state a loaded reader no longer needs."""
+    for name in TRANSIENT_ATTRIBUTES.intersection(vars(area_file)):
+        delattr(area_file, name)
+    return area_file
+
+
+class ParseCache:
+    """Store each parsed area next to fingerprints of every file it was read from.
+
+    An entry is reused only while the library version, the reader class and
+    every recorded source file's size, mtime and content hash are unchanged.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+
+    def entry_path(self, area_file_path, area_type):
+        key = "\0".join(
+            (
+                str(CACHE_FORMAT),
+                LIBRARY_VERSION,
+                f"{area_type.__module__}.{area_type.__qualname__}",
+                os.path.abspath(area_file_path),
+            )
+        )
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".pickle")
+
+    def get(self, area_file_path, area_type):
+        try:
+            with open(self.entry_path(area_file_path, area_type), mode="rb") as entry_file:
+                entry = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+            return None
+        if entry.get("version") != (CACHE_FORMAT, LIBRARY_VERSION):
+            return None
+        for path, recorded in entry["sources"]:
+            if fingerprint(path) != recorded:
+                return None
+        area_file = area_type.__new__(area_type)
+        vars(area_file).update(entry["reader"])
+        return area_file
+
+    def fingerprint_sources(self, area_file_path, area_type):
+        """Fingerprint the files a load is about to read, before it reads them.
+
+        Returns the time the fingerprints were taken and a path-to-fingerprint
+        dict to pass to put() once the load has finished.
+        """
+        started = time.time_ns()
+        if os.path.isdir(area_file_path):
+            paths = area_type(area_file_path).source_paths()
+        else:
+            paths = [area_file_path]
+        return started, {os.fspath(path): fingerprint(path) for path in paths}
+
+    def put(self, area_file_path, area_file, sources):
+        """Store a loaded reader under the fingerprints fingerprint_sources() took before the load.
+
+        A file the reader only named during the load (such as a Medievia world
+        file listed by its zone file) is fingerprinted afterwards, and the
+        entry is not stored when that file may have changed since the load began.
+        """
+        started, fingerprints = sources
+        recorded = []
+        for path in map(os.fspath, area_file.source_paths()):
+            if path in fingerprints:
+                recorded.append((path, fingerprints[path]))
+                continue
+            current = fingerprint(path)
+            if current is not None and current[1] >= started - MTIME_SLACK_NS:
+                return
+            recorded.append((path, current))
+        entry = {
+            "version": (CACHE_FORMAT, LIBRARY_VERSION),
+            "sources": recorded,
+            "area": area_file.area,
+            "reader": {name: value for name, value in vars(area_file).items() if name not in TRANSIENT_ATTRIBUTES},
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        entry_path = self.entry_path(area_file_path, type(area_file))
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temporary_path, mode="wb") as entry_file:
+            pickle.dump(entry, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, entry_path)
@@ -1,26 +1,47 @@
 """Command-line interface for area-reader."""
 
+import argparse
+import concurrent.futures
+import functools
+import glob
+import json
+import os
 import re
 import sys
+import time
 from pathlib import Path
 
-import area_reader.dialects.circle
-import area_reader.dialects.coffeemud
-import area_reader.dialects.godwars
-import area_reader.dialects.medievia
-import area_reader.dialects.merc
-import area_reader.dialects.rom
-import area_reader.dialects.smaug
-import area_reader.dialects.swr
-import area_reader.dialects.tba
+from attr import attr, attributes, fields
+
+import area_reader
+import area_reader.cache
 import area_reader.serialization
+from area_reader.native import staged_writes
 
+PREFIX_SIZE = 4 * 1024
 SNIFF_SIZE = 64 * 1024
+SIGNATURE_CONFIDENCE = 1.0
+STRUCTURE_CONFIDENCE = 0.9
+ELIMINATION_CONFIDENCE = 0.75
 COFFEEMUD_ROOT = re.compile(r"<(?:AREA|MOBS?|ITEMS?|AROOMS?)\b", re.IGNORECASE)
-SECTION = re.compile(r"(?m)^[ \t]*#([A-Z]+)\b", re.IGNORECASE)
-AREA_SECTION = re.compile(r"(?m)^[ \t]*#AREA\b", re.IGNORECASE)
-NEXT_NAMED_SECTION = re.compile(r"(?m)^[ \t]*#[A-Z$]+\b", re.IGNORECASE)
-GODWARS_RECORD = re.compile(r"(?m)^[ \t]*[QT][ \t]*$")
+MEDIEVIA_ROOM_HEADER = re.compile(r"\s*#-?\d+[^\r\n]*(?:\r?\n)")
+DETECTION_SCAN = re.compile(
+    r"(?m)\n[ \t]*(?:#(?P<section>(?i:[A-Z]+))\b|(?P<field>(?i:Builders|VNUMs|Security|End))\b|[QT][ \t]*$)"
+)
+GODWARS_FIELDS = frozenset({"builders", "vnums", "security", "end"})
+RECORD_COLLECTIONS = (
+    ("zones", "zones"),
+    ("triggers", "triggers"),
+    ("rooms", "rooms"),
+    ("mobiles", "mobs"),
+    ("objects", "objects"),
+    ("items", "items"),
+    ("shops", "shops"),
+    ("quests", "quests"),
+)
+STREAMED_COLLECTIONS = frozenset(
+    [collection_name for _, collection_name in RECORD_COLLECTIONS] + ["helps", "resets", "specials", "repairs"]
+)
 MEDIEVIA_COMPONENTS = frozenset({"medievia.zon", "medievia.mob", "medievia.obj", "medievia.shp"})
 SMAUG_SECTIONS = frozenset(
     {
@@ -39,18 +60,21 @@ SMAUG_SECTIONS = frozenset(
 )
 
 
-def _looks_like_medievia_room(data):
-    """Return whether the first record has Medievia's 4/4/3 room fields."""
-    header = re.match(r"\s*#-?\d+[^\r\n]*(?:\r?\n)", data)
+def _looks_like_medievia_room(data, complete=True):
+    """Return whether the first record has Medievia's 4/4/3 room fields, or None until enough is read."""
+    header = MEDIEVIA_ROOM_HEADER.match(data)
     if header is None:
-        return False
+        return None if not complete and "\n" not in data and data.lstrip().startswith("#") else False
     cursor = header.end()
     for _ in range(2):
         cursor = data.find("~", cursor)
         if cursor == -1:
-            return False
+            return False if complete else None
         cursor += 1
-    lines = [line.split() for line in data[cursor:].splitlines() if line.strip()][:3]
+    body = data[cursor:] if complete else data[cursor : data.rfind("\n") + 1]
+    lines = [line.split() for line in body.splitlines() if line.strip()][:3]
+    if len(lines) < 3 and not complete:
+        return None
     if [len(line) for line in lines] != [4, 4, 3]:
         return False
     try:
@@ -62,72 +86,412 @@ def _looks_like_medievia_room(data):
     return True
 
 
-def detect_area_type(area_file_path):
-    path = Path(area_file_path)
-    if path.is_dir():
-        direct_medievia = path / "medievia.zon"
-        nested_medievia = path / "lib" / "medievia.zon"
-        if direct_medievia.is_file() or nested_medievia.is_file():
-            return area_reader.dialects.medievia.MedieviaAreaFile
-        direct_index = path / "zon" / "index"
-        nested_index = path / "lib" / "world" / "zon" / "index"
-        if direct_index.is_file() or nested_index.is_file():
-            world_root = path if direct_index.is_file() else path / "lib" / "world"
-            if (world_root / "trg" / "index").is_file() or (world_root / "qst" / "index").is_file():
-                return area_reader.dialects.tba.TbaAreaFile
-            return area_reader.dialects.circle.CircleAreaFile
-        raise ValueError(f"Could not detect area type for {path}")
-
-    with path.open(mode="rt", encoding="latin-1") as area_file:
-        data = area_file.read(SNIFF_SIZE)
-
-    if path.name.lower() in MEDIEVIA_COMPONENTS or _looks_like_medievia_room(data):
-        return area_reader.dialects.medievia.MedieviaAreaFile
+def _classify(path, data, complete):
+    """Return (area type, confidence) for the text read so far, or None when reading more could change it.
 
+    A single DETECTION_SCAN pass collects every section header, GodWars
+    AREADATA field and GodWars Q/T record line in the prefix. The pattern
+    starts with a literal newline, which the regex engine can skip to far
+    faster than it can test a multiline ^ at every position.
+    """
+    if path.name.lower() in MEDIEVIA_COMPONENTS:
+        return area_reader.MedieviaAreaFile, SIGNATURE_CONFIDENCE
+    medievia_room = _looks_like_medievia_room(data, complete)
+    if medievia_room:
+        return area_reader.MedieviaAreaFile, SIGNATURE_CONFIDENCE
     stripped = data.lstrip()
+    if medievia_room is None or (not stripped and not complete):
+        return None
     if stripped.startswith("<?xml") or COFFEEMUD_ROOT.match(stripped):
-        return area_reader.dialects.coffeemud.CoffeeMudAreaFile
+        return area_reader.CoffeeMudAreaFile, SIGNATURE_CONFIDENCE
+
+    sections = {}
+    section_starts = []
+    fields = set()
+    godwars_record = False
+    for match in DETECTION_SCAN.finditer("\n" + data):
+        section = match.group("section")
+        if section is not None:
+            sections.setdefault(section.upper(), match)
+            section_starts.append(match.start())
+        elif match.group("field") is not None:
+            fields.add(match.group("field").lower())
+        else:
+            godwars_record = True
 
-    sections = {match.group(1).upper() for match in SECTION.finditer(data)}
     if "FUSSAREA" in sections:
-        return area_reader.dialects.swr.SwrAreaFile
+        return area_reader.SwrAreaFile, SIGNATURE_CONFIDENCE
     if "AREADATA" in sections:
-        godwars_fields = all(
-            re.search(rf"(?mi)^[ \t]*{field}\b", data) for field in ("Builders", "VNUMs", "Security", "End")
-        )
-        if godwars_fields:
-            return area_reader.dialects.godwars.GodWarsAreaFile
-        return area_reader.dialects.swr.SwrAreaFile
-    if sections.intersection(SMAUG_SECTIONS):
-        return area_reader.dialects.smaug.SmaugAreaFile
-
-    area_section = AREA_SECTION.search(data)
+        if fields == GODWARS_FIELDS:
+            return area_reader.GodWarsAreaFile, SIGNATURE_CONFIDENCE
+        if complete or section_starts[-1] > sections["AREADATA"].start():
+            return area_reader.SwrAreaFile, ELIMINATION_CONFIDENCE
+        return None
+    if not SMAUG_SECTIONS.isdisjoint(sections):
+        return area_reader.SmaugAreaFile, SIGNATURE_CONFIDENCE
+
+    area_section = sections.get("AREA")
     if area_section is not None:
-        area_metadata = data[area_section.end() :]
-        next_section = NEXT_NAMED_SECTION.search(area_metadata)
-        if next_section is not None:
-            area_metadata = area_metadata[: next_section.start()]
-        string_count = area_metadata.count("~")
+        metadata_start = area_section.end() - 1
+        metadata_end = next((start for start in section_starts if start >= metadata_start), None)
+        string_count = data.count("~", metadata_start, metadata_end)
         if string_count >= 3:
-            return area_reader.dialects.rom.RomAreaFile
-        if string_count == 1:
-            if GODWARS_RECORD.search(data):
-                return area_reader.dialects.godwars.GodWarsAreaFile
-            return area_reader.dialects.merc.MercAreaFile
+            return area_reader.RomAreaFile, STRUCTURE_CONFIDENCE
+        if string_count == 1 and godwars_record:
+            return area_reader.GodWarsAreaFile, SIGNATURE_CONFIDENCE
+        if string_count == 1 and complete:
+            return area_reader.MercAreaFile, ELIMINATION_CONFIDENCE
+    if not complete:
+        return None
+    raise ValueError(f"Could not detect area type for {path}")
+
 
+def _detect_directory(path):
+    direct_medievia = path / "medievia.zon"
+    nested_medievia = path / "lib" / "medievia.zon"
+    if direct_medievia.is_file() or nested_medievia.is_file():
+        return area_reader.MedieviaAreaFile
+    direct_index = path / "zon" / "index"
+    nested_index = path / "lib" / "world" / "zon" / "index"
+    if direct_index.is_file() or nested_index.is_file():
+        world_root = path if direct_index.is_file() else path / "lib" / "world"
+        if (world_root / "trg" / "index").is_file() or (world_root / "qst" / "index").is_file():
+            return area_reader.TbaAreaFile
+        return area_reader.CircleAreaFile
     raise ValueError(f"Could not detect area type for {path}")
 
 
-def print_area(area_file_path, area_type=None):
+def _detect(area_file_path):
+    """Return (area type, confidence), reading a growing prefix of the file through one handle."""
+    path = Path(area_file_path)
+    if path.is_dir():
+        return _detect_directory(path), SIGNATURE_CONFIDENCE
+    data = ""
+    size = PREFIX_SIZE
+    with path.open(mode="rt", encoding="latin-1") as area_file:
+        while True:
+            chunk = area_file.read(size - len(data))
+            data += chunk
+            complete = len(data) < size or size >= SNIFF_SIZE
+            detected = _classify(path, data, complete)
+            if detected is not None:
+                return detected
+            size = SNIFF_SIZE
+
+
+def detect_area_type(area_file_path):
+    return _detect(area_file_path)[0]
+
+
+@attributes(frozen=True, slots=True)
+class Detection:
+    path = attr()
+    area_type = attr(default=None)
+    confidence = attr(default=0.0)
+    error = attr(default=None)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def detect_many(paths):
+    """Detect each path's dialect, with a confidence score.
+
+    1.0 means a dialect signature was found, 0.9 a structural match (ROM's
+    area header strings) and 0.75 a match by elimination. A path that cannot
+    be detected or read carries its exception instead.
+    """
+    detections = []
+    for path in paths:
+        try:
+            area_type, confidence = _detect(path)
+        except (OSError, ValueError) as error:
+            detections.append(Detection(path, error=error))
+        else:
+            detections.append(Detection(path, area_type=area_type, confidence=confidence))
+    return detections
+
+
+def load_area(area_file_path, area_type=None, cache=None):
     if area_type is None:
         area_type = detect_area_type(area_file_path)
+    if cache is not None:
+        area_file = cache.get(area_file_path, area_type)
+        if area_file is not None:
+            return area_file
+        sources = cache.fingerprint_sources(area_file_path, area_type)
     area_file = area_type(area_file_path)
     area_file.load_sections()
-    print(area_file.as_json())
+    if cache is not None:
+        cache.put(area_file_path, area_file, sources)
+    return area_file
+
+
+@attributes(frozen=True, slots=True)
+class LoadResult:
+    path = attr()
+    area_file = attr(default=None)
+    error = attr(default=None)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _load_result(area_file_path, cache=None):
+    try:
+        area_file = area_reader.cache.drop_transient_state(load_area(area_file_path, cache=cache))
+        return LoadResult(area_file_path, area_file=area_file)
+    except Exception as error:  # noqa: BLE001 - one malformed file must not abort the whole batch
+        return LoadResult(area_file_path, error=error)
+
+
+def _ordered_map(function, arguments, workers=None):
+    """Call function with each argument tuple across a process pool, returning the results in input order."""
+    arguments = list(arguments)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(arguments))
+    if workers <= 1:
+        return [function(*argument) for argument in arguments]
+    chunksize = max(1, len(arguments) // (workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, *zip(*arguments), chunksize=chunksize))
+
+
+def load_many(paths, workers=None, cache=None):
+    """Detect and load each path across a process pool.
+
+    Results come back in input order as LoadResult values; a file that fails
+    to detect or parse carries its exception instead of aborting the batch.
+    """
+    return _ordered_map(_load_result, [(path, cache) for path in paths], workers)
+
+
+def iter_records(area_file_path, area_type=None, only=None):
+    """Yield (section name, record) pairs from an area file or world tree.
+
+    Diku-family and CoffeeMud readers stream records as they are parsed.
+    Tree readers have no record stream, so their parsed collections are
+    walked after a full load.
+    """
+    if area_type is None:
+        area_type = detect_area_type(area_file_path)
+    yield from _reader_records(area_type(area_file_path), only)
+
+
+def _reader_records(area_file, only=None):
+    if hasattr(area_file, "iter_records"):
+        yield from area_file.iter_records(only)
+        return
+    area_file.load_sections()
+    for section_name, collection_name in RECORD_COLLECTIONS:
+        if only is not None and section_name not in only:
+            continue
+        records = getattr(area_file.area, collection_name, None) or ()
+        if isinstance(records, dict):
+            records = records.values()
+        for record in records:
+            yield section_name, record
+
+
+def print_area(area_file_path, area_type=None):
+    print(load_area(area_file_path, area_type).as_json())
+
+
+def area_header(area):
+    """Unstructure an area's own fields, leaving out the collections streamed as records."""
+    return {
+        field.name: area_reader.serialization.unstructure(getattr(area, field.name))
+        for field in fields(type(area))
+        if field.name not in STREAMED_COLLECTIONS
+    }
+
+
+def print_records(area_file_path, area_type=None, stream=None):
+    """Write one JSON object per line: the area header, then each record as it is parsed.
+
+    The header goes out just before the first record. If a header section
+    follows the records, a final area line carries the completed header.
+    """
+    if area_type is None:
+        area_type = detect_area_type(area_file_path)
+    if stream is None:
+        stream = sys.stdout
+    area_file = area_type(area_file_path)
+    header = None
+    for section_name, record in _reader_records(area_file):
+        if header is None:
+            header = area_header(area_file.area)
+            stream.write(json.dumps({"section": "area", "record": header}) + "\n")
+        record = area_reader.serialization.unstructure(record)
+        stream.write(json.dumps({"section": section_name, "record": record}) + "\n")
+    final_header = area_header(area_file.area)
+    if final_header != header:
+        stream.write(json.dumps({"section": "area", "record": final_header}) + "\n")
+
+
+@attributes(frozen=True, slots=True)
+class ConversionResult:
+    path = attr()
+    error = attr(default=None)
+    skipped = attr(default=False)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def convert_area(area_file_path, output_path):
+    """Load one area and write it as a JSON document, returning a ConversionResult instead of raising.
+
+    A file whose dialect cannot be detected is skipped rather than failed. The
+    document replaces output_path only once it has been written in full.
+    """
+    try:
+        area_type = detect_area_type(area_file_path)
+    except ValueError:
+        return ConversionResult(area_file_path, skipped=True)
+    except OSError as error:
+        return ConversionResult(area_file_path, error=f"{type(error).__name__}: {error}")
+    try:
+        text = load_area(area_file_path, area_type).as_json()
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with staged_writes(encoding="utf-8") as open_output_file, open_output_file(output_path) as output_file:
+            output_file.write(text)
+    except Exception as error:  # noqa: BLE001 - one malformed area must not abort the whole batch
+        return ConversionResult(area_file_path, error=f"{type(error).__name__}: {error}")
+    return ConversionResult(area_file_path)
+
+
+def convert_many(conversions, workers=None):
+    """Run convert_area over (area path, output path) pairs across a process pool, returning results in order."""
+    return _ordered_map(convert_area, conversions, workers)
+
+
+def _is_world(path):
+    try:
+        _detect_directory(path)
+    except ValueError:
+        return False
+    return True
+
+
+def _batch_sources(source_root):
+    """Yield each area file under a directory, and each world tree as one directory without its files."""
+    if _is_world(source_root):
+        yield source_root
+        return
+    for directory, directory_names, file_names in os.walk(source_root):
+        directory = Path(directory)
+        worlds = [name for name in directory_names if _is_world(directory / name)]
+        yield from (directory / name for name in worlds)
+        directory_names[:] = sorted(set(directory_names) - set(worlds))
+        yield from (directory / name for name in file_names)
+
+
+def _glob_sources(pattern):
+    """Return the files matching a glob, replacing any inside a world tree with the innermost tree."""
+    is_world = functools.cache(_is_world)
+    sources = set()
+    for name in glob.glob(pattern, recursive=True):
+        path = Path(name)
+        world = next((candidate for candidate in (path, *path.parents) if is_world(candidate)), None)
+        if world is not None:
+            sources.add(world)
+        elif path.is_file():
+            sources.add(path)
+    return sorted(sources)
+
+
+def batch_conversions(source, output_root):
+    """Pair every area under a directory, or matching a glob, with its JSON path under output_root.
+
+    CircleMUD, tbaMUD and Medievia world trees are converted as one area each,
+    so the files inside them are never treated as standalone areas.
+    """
+    output_root = Path(output_root)
+    source_root = Path(source)
+    if source_root.is_dir():
+        paths = sorted(_batch_sources(source_root))
+    else:
+        paths = _glob_sources(source)
+        source_root = Path(os.path.commonpath([path.parent for path in paths])) if paths else Path()
+    output_directory = output_root.resolve()
+    return [
+        (path, output_root / f"{path.relative_to(source_root) if path != source_root else path.resolve().name}.json")
+        for path in paths
+        if output_directory not in path.resolve().parents
+    ]
+
+
+def _modified_ns(path):
+    if not os.path.isdir(path):
+        return os.stat(path).st_mtime_ns
+    return max(
+        (os.stat(os.path.join(directory, name)).st_mtime_ns for directory, _, names in os.walk(path) for name in names),
+        default=os.stat(path).st_mtime_ns,
+    )
+
+
+def _is_up_to_date(area_file_path, output_path):
+    try:
+        return os.stat(output_path).st_mtime_ns >= _modified_ns(area_file_path)
+    except FileNotFoundError:
+        return False
+
+
+def _add_batch_arguments(parser):
+    parser.add_argument("source", help="a directory of areas or a glob pattern")
+    parser.add_argument("--out", required=True, type=Path, help="directory for the JSON files")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="convert inputs whose output is already newer")
+    return parser
+
+
+def _run_batch(parser, args):
+    start = time.perf_counter()
+    conversions = batch_conversions(args.source, args.out)
+    if not conversions:
+        parser.error(f"no files match {args.source}")
+    pending = [conversion for conversion in conversions if args.force or not _is_up_to_date(*conversion)]
+    results = convert_many(pending, args.jobs)
+    failures = [result for result in results if not result.ok]
+    skipped = sum(result.skipped for result in results)
+    elapsed = time.perf_counter() - start
+
+    converted = len(pending) - len(failures) - skipped
+    unchanged = len(conversions) - len(pending)
+    print(f"{converted} converted, {unchanged} unchanged, {skipped} skipped, {len(failures)} failed in {elapsed:.2f}s")
+    for result in failures:
+        print(f"{result.path}: {result.error}")
+    return 1 if failures else 0
+
+
+def batch_main(arguments):
+    parser = argparse.ArgumentParser(prog="area-reader batch", description="Convert many areas to JSON files.")
+    return _run_batch(parser, _add_batch_arguments(parser).parse_args(arguments))
 
 
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(prog="area-reader", description="Read MUD area files as JSON.")
+    commands = parser.add_subparsers(dest="command")
+    show = commands.add_parser("show", help="print one area as JSON (the default command)")
+    show.add_argument("path", nargs="?", help="an area file or world tree")
+    show.add_argument("--ndjson", action="store_true", help="stream one JSON object per record")
+    batch = _add_batch_arguments(commands.add_parser("batch", help="convert many areas to JSON files"))
+    arguments = sys.argv[1:]
+    if not arguments or arguments[0] not in commands.choices and arguments[0] not in ("-h", "--help"):
+        arguments = ["show", *arguments]
+    args = parser.parse_args(arguments)
+
+    if args.command == "batch":
+        sys.exit(_run_batch(batch, args))
+    if args.path is None:
         print("Must supply an area")
         sys.exit(1)
-    print_area(sys.argv[1])
+    if args.ndjson:
+        print_records(args.path)
+    else:
+        print_area(args.path)
@@ -520,7 +520,7 @@ class APPLY_TYPES(enum.Enum):
     AFFECT = 25
 
 
-@attributes
+@attributes(slots=True)
 class Liquid:
     color = attr(default="", type=str)
     proof = attr(default=0, type=int)
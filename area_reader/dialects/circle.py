@@ -1,11 +1,15 @@
 """CircleMUD area models, codecs, and reader."""
 
+import concurrent.futures
 import enum
+import hashlib
 import json
 import os
+import pickle
 from collections import OrderedDict
+from itertools import repeat
 
-from attr import Factory, attr, attributes
+from attr import Factory, attr, attributes, fields
 
 import area_reader.dialects.rom
 import area_reader.model
@@ -14,13 +18,23 @@ import area_reader.schema
 import area_reader.serialization
 import area_reader.values
 from area_reader.constants import EXIT_FLAGS, WEAR_FLAGS
-from area_reader.native import NativeField, NativeWriteError, render_record
+from area_reader.native import NativeField, NativeWriteError, render_record, staged_writes
 from area_reader.native import flag as native_flag
 from area_reader.native import number as native_number
 from area_reader.native import records as native_records
 from area_reader.native import tilde_string as native_tilde_string
 
 
+def _render_part(part):
+    return part if type(part) is str else render_record(part)
+
+
+def _load_indexed_file(area_type, root, loader_name, path):
+    area_file = area_type(root)
+    getattr(area_file, loader_name)(path)
+    return area_file.area
+
+
 class CircleAreaFile:
     NATIVE_NORMALIZATIONS = (
         "comments",
@@ -30,6 +44,17 @@ class CircleAreaFile:
         "optional-second-shop-window",
         "dice-zero-bonus-spelling",
     )
+    INDEXED_FILE_LOADERS = (
+        ("zon", "load_zone_file"),
+        ("wld", "load_room_file"),
+        ("mob", "load_mobile_file"),
+        ("obj", "load_object_file"),
+        ("shp", "load_shop_file"),
+    )
+    line_index = None
+    fingerprint_files = False
+    fingerprint_root = None
+    file_fingerprints = None
 
     def __init__(self, root):
         self.root = os.fspath(root)
@@ -42,42 +67,145 @@ class CircleAreaFile:
         self.index = 0
 
     def dumps(self):
-        tree = OrderedDict()
-        for family, collection_name, file_end in self.area.NATIVE_COLLECTIONS:
+        return OrderedDict((relative_path, "".join(chunks)) for relative_path, chunks in self.iter_native_files())
+
+    def native_files(self):
+        """Validate the whole tree and map each native file to its parts: literal text and records to render."""
+        grouped = {}
+        for family, collection_name, _ in self.area.NATIVE_COLLECTIONS:
             names = self.area.indexes.get(family, [])
-            tree[f"{family}/index"] = "".join(f"{name}\n" for name in names) + "$\n"
-            records = getattr(self.area, collection_name).values()
-            for record in records:
+            buckets = grouped[family] = {name: [] for name in names}
+            for record in getattr(self.area, collection_name).values():
                 if not record.source_file:
                     raise NativeWriteError(f"{record.__class__.__name__} {record.vnum!r} has no indexed source file")
-                if record.source_file not in names:
+                try:
+                    buckets[record.source_file].append(record)
+                except KeyError:
                     raise NativeWriteError(f"{record.source_file} is not present in the {family} index")
-            for name in names:
-                prefix = ""
-                if family == "shp":
-                    try:
-                        prefix = native_tilde_string(self.area.shop_headers[name], None) + "\n"
-                    except KeyError:
+            if family == "shp":
+                for name in names:
+                    if name not in self.area.shop_headers:
                         raise NativeWriteError(f"Shop file {name} has no version header")
-                body = "".join(render_record(record) for record in records if record.source_file == name)
-                tree[f"{family}/{name}"] = prefix + body + file_end
-        return tree
+        files = OrderedDict()
+        for family, _, file_end in self.area.NATIVE_COLLECTIONS:
+            names = self.area.indexes.get(family, [])
+            files[f"{family}/index"] = [*(f"{name}\n" for name in names), "$\n"]
+            for name in names:
+                prefix = [native_tilde_string(self.area.shop_headers[name], None) + "\n"] if family == "shp" else []
+                files[f"{family}/{name}"] = [*prefix, *grouped[family][name], file_end]
+        return files
+
+    def iter_native_files(self):
+        """Yield (relative path, chunks) pairs that render record by record."""
+        for relative_path, parts in self.native_files().items():
+            yield relative_path, map(_render_part, parts)
+
+    def native_fingerprint(self, relative_path, parts):
+        """Fingerprint a native file's records, or an index file's membership."""
+        if relative_path.endswith("/index"):
+            return tuple(parts)
+        return hashlib.blake2b(pickle.dumps(parts, protocol=pickle.HIGHEST_PROTOCOL)).digest()
+
+    def remember_native_files(self):
+        """Fingerprint each native file's records so an incremental write can skip the unchanged ones."""
+        try:
+            files = self.native_files()
+        except NativeWriteError:
+            files = {}
+        self.file_fingerprints = {path: self.native_fingerprint(path, parts) for path, parts in files.items()}
+        self.fingerprint_root = os.path.abspath(self.world_root)
+
+    def disk_fingerprint(self, path):
+        if not os.path.exists(path):
+            return None
+        with open(path, mode="rb") as native_file:
+            return hashlib.blake2b(native_file.read()).digest()
 
-    def write(self, root):
+    def native_root(self, root):
         root = os.fspath(root)
-        world_root = root if os.path.basename(root) == "world" else os.path.join(root, "lib", "world")
-        for relative_path, text in self.dumps().items():
-            path = os.path.join(world_root, *relative_path.split("/"))
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, mode="wt", encoding="latin-1", newline="\n") as circle_file:
-                circle_file.write(text)
-
-    def load_sections(self):
-        self.load_zones()
-        self.load_rooms()
-        self.load_mobiles()
-        self.load_objects()
-        self.load_shops()
+        return root if os.path.basename(root) == "world" else os.path.join(root, "lib", "world")
+
+    def write(self, root, incremental=False):
+        return self.write_tree(root, incremental)
+
+    def write_tree(self, root, incremental=False):
+        """Write the native tree one record at a time and return the relative paths written.
+
+        Every file is staged next to its target and moved into place only once
+        the whole tree has rendered, so an encoder error leaves the tree as it was.
+
+        With incremental=True, a file whose records (or an index whose
+        membership) match the fingerprints taken at load or at the last write
+        to the same tree is skipped without being rendered. Without
+        fingerprints for that tree, a file is skipped when its rendered text
+        matches what is already on disk.
+        """
+        world_root = self.native_root(root)
+        files = self.native_files()
+        previous = None
+        if self.file_fingerprints is not None and self.fingerprint_root == os.path.abspath(world_root):
+            previous = self.file_fingerprints
+        fingerprints = {}
+        written = []
+        with staged_writes() as open_native_file:
+            for relative_path, parts in files.items():
+                path = os.path.join(world_root, *relative_path.split("/"))
+                fingerprint = fingerprints[relative_path] = self.native_fingerprint(relative_path, parts)
+                chunks = map(_render_part, parts)
+                if incremental and previous is not None:
+                    if previous.get(relative_path) == fingerprint and os.path.exists(path):
+                        continue
+                elif incremental:
+                    text = "".join(chunks)
+                    if self.disk_fingerprint(path) == hashlib.blake2b(text.encode("latin-1")).digest():
+                        continue
+                    chunks = (text,)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open_native_file(path) as native_file:
+                    native_file.writelines(chunks)
+                written.append(relative_path)
+        self.file_fingerprints = fingerprints
+        self.fingerprint_root = os.path.abspath(world_root)
+        return written
+
+    def load_sections(self, workers=None):
+        if workers is not None:
+            self.load_indexed_files(workers)
+        else:
+            self.load_zones()
+            self.load_rooms()
+            self.load_mobiles()
+            self.load_objects()
+            self.load_shops()
+        if self.fingerprint_files:
+            self.remember_native_files()
+
+    def load_indexed_files(self, workers):
+        """Parse each indexed file in its own reader and merge them in index order.
+
+        Merging with update() keeps a duplicate vnum at its first position with
+        the last file's record, exactly as a sequential load leaves it.
+        """
+        loader_names = []
+        paths = []
+        for family, loader_name in self.INDEXED_FILE_LOADERS:
+            for path in self.indexed_paths(family):
+                loader_names.append(loader_name)
+                paths.append(path)
+        arguments = (repeat(type(self)), repeat(self.root), loader_names, paths)
+        workers = min(workers, len(paths))
+        if workers <= 1:
+            self.merge_file_areas(map(_load_indexed_file, *arguments))
+            return
+        chunksize = max(1, len(paths) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            self.merge_file_areas(executor.map(_load_indexed_file, *arguments, chunksize=chunksize))
+
+    def merge_file_areas(self, file_areas):
+        collections = [field.name for field in fields(type(self.area)) if field.name != "indexes"]
+        for file_area in file_areas:
+            for collection in collections:
+                getattr(self.area, collection).update(getattr(file_area, collection))
 
     def load_zones(self):
         for path in self.indexed_paths("zon"):
@@ -100,16 +228,30 @@ class CircleAreaFile:
             self.load_shop_file(path)
 
     def indexed_paths(self, family):
+        names = self.area.indexes[family] = self.read_index(family)
+        base = os.path.join(self.world_root, family)
+        return [os.path.join(base, name) for name in names]
+
+    def read_index(self, family):
         index_path = os.path.join(self.world_root, family, "index")
         if not os.path.exists(index_path):
-            self.area.indexes[family] = []
             return []
-        base = os.path.dirname(index_path)
         with open(index_path, mode="rt", encoding="latin-1") as index_file:
             names = [line.strip() for line in index_file]
-        names = [name for name in names if name and name != "$"]
-        self.area.indexes[family] = names
-        return [os.path.join(base, name) for name in names]
+        return [name for name in names if name and name != "$"]
+
+    def source_paths(self):
+        """Return every index and indexed file a load reads, including missing indexes.
+
+        Before a load, the indexed files are named by reading the index files.
+        """
+        paths = []
+        for family, _ in self.INDEXED_FILE_LOADERS:
+            base = os.path.join(self.world_root, family)
+            paths.append(os.path.join(base, "index"))
+            names = self.area.indexes[family] if family in self.area.indexes else self.read_index(family)
+            paths.extend(os.path.join(base, name) for name in names)
+        return paths
 
     def open_circle_file(self, filename):
         self.filename = filename
@@ -187,10 +329,13 @@ class CircleAreaFile:
             return self.read_string()
         return self.read_line().strip()
 
+    def location(self):
+        if self.line_index is None or self.line_index.data is not self.data:
+            self.line_index = area_reader.parser.LineIndex(self.data)
+        return self.line_index.location(self.index)
+
     def parse_fail(self, message):
-        backwards = self.data[: self.index]
-        lineno = backwards.count("\n") + 1
-        col = backwards[::-1].find("\n")
+        lineno, col = self.location()
         raise area_reader.parser.ParseError(f"{self.filename} line {lineno} col {col}: {message}")
 
     def parse_dice_token(self, token):
@@ -462,7 +607,7 @@ class CircleAreaFile:
         )
 
     def as_dict(self):
-        return area_reader.serialization.EnumNameConverter().unstructure(self.area)
+        return area_reader.serialization.unstructure(self.area)
 
     def as_json(self, indent=None):
         return json.dumps(self.as_dict(), indent=indent)
@@ -613,7 +758,7 @@ class CircleMobFlags(enum.IntFlag):
     NOTDEADYET = 1 << 18
 
 
-@attributes
+@attributes(slots=True)
 class CircleExit:
     door = area_reader.schema.field(default=0, native=NativeField(1, native_number, prefix="D"))
     description = area_reader.schema.field(default="", native=NativeField(2, native_tilde_string))
@@ -628,7 +773,7 @@ class CircleExit:
     destination = area_reader.schema.field(default=-1, native=NativeField(6, native_number))
 
 
-@attributes
+@attributes(slots=True)
 class CircleRoom(area_reader.model.MudBase):
     NATIVE_SUFFIX = "S\n"
 
@@ -651,7 +796,7 @@ class CircleRoom(area_reader.model.MudBase):
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CircleMob(area_reader.dialects.rom.RomCharacter):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(1, native_number, prefix="#")
@@ -692,7 +837,7 @@ class CircleMob(area_reader.dialects.rom.RomCharacter):
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CircleAffectData:
     NATIVE_PREFIX = "A\n"
 
@@ -700,7 +845,7 @@ class CircleAffectData:
     modifier = area_reader.schema.field(default=0, native=NativeField(2, native_number))
 
 
-@attributes
+@attributes(slots=True)
 class CircleItem(area_reader.model.Item):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(1, native_number, prefix="#")
@@ -728,7 +873,7 @@ class CircleItem(area_reader.model.Item):
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CircleReset:
     command = area_reader.schema.field(default="", native=NativeField(1, native_circle_reset_command, suffix=" "))
     if_flag = area_reader.schema.field(default=0, native=NativeField(2, native_number, suffix=" "))
@@ -742,7 +887,7 @@ class CircleReset:
     )
 
 
-@attributes
+@attributes(slots=True)
 class CircleZone:
     NATIVE_SUFFIX = "S\n"
 
@@ -756,7 +901,7 @@ class CircleZone:
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CircleShop:
     vnum = area_reader.schema.field(default=0, native=NativeField(1, native_number, prefix="#", suffix="~\n"))
     products = area_reader.schema.field(
@@ -782,7 +927,7 @@ class CircleShop:
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CircleArea:
     NATIVE_COLLECTIONS = (
         ("zon", "zones", "$\n"),
@@ -1,5 +1,6 @@
 """CoffeeMud area models, codecs, and reader."""
 
+import functools
 import html
 import json
 import os
@@ -12,10 +13,14 @@ from attr import Factory, attr, attributes
 import area_reader.dialects.rom
 import area_reader.schema
 import area_reader.serialization
-from area_reader.native import NativeField, NativeWriteError, render_record
+from area_reader.native import NativeField, NativeWriteError, render_record, staged_writes
 from area_reader.native import number as native_number
 from area_reader.native import raw as native_raw
 
+XML_DECLARATION = re.compile(r"\A<\?xml[^>]*\?>")
+RECORD_SECTIONS = {"MOB": "mobiles", "ITEM": "items", "AROOM": "rooms"}
+RECORD_CONTAINERS = {"MOBS": "MOB", "ITEMS": "ITEM", "AROOMS": "AROOM"}
+
 
 class CoffeeMudAreaFile:
     NATIVE_NORMALIZATIONS = (
@@ -27,47 +32,166 @@ class CoffeeMudAreaFile:
         "mob-rejuvenation-tag-spelling",
     )
 
+    CHUNK_SIZE = 64 * 1024
+
     def __init__(self, filename):
         self.filename = os.fspath(filename)
-        with open(filename, mode="rt", encoding="latin-1") as coffee_file:
-            self.data = coffee_file.read()
-            self.area = CoffeeMudArea()
+        self.area = CoffeeMudArea()
 
     def dumps(self):
+        return "".join(self.iter_native_document())
+
+    def iter_native_document(self):
+        """Yield the canonical document one top-level record at a time."""
         top_level = self.area.top_level
-        if top_level == "MOBS":
-            document = "<MOBS>{}</MOBS>".format("".join(render_record(mob) for mob in self.area.mobs))
-        elif top_level == "MOB":
-            document = "".join(render_record(mob) for mob in self.area.mobs)
-        elif top_level == "ITEMS":
-            document = "<ITEMS>{}</ITEMS>".format("".join(render_record(item) for item in self.area.items))
-        elif top_level == "ITEM":
-            document = "".join(render_record(item) for item in self.area.items)
+        if top_level in ("MOBS", "MOB"):
+            records = self.area.mobs
+        elif top_level in ("ITEMS", "ITEM"):
+            records = self.area.items
+        elif top_level in ("AROOMS", "AROOM"):
+            records = self.area.rooms.values()
         elif top_level == "AREA":
-            document = render_record(self.area)
-        elif top_level == "AROOMS":
-            document = "<AROOMS>{}</AROOMS>".format("".join(render_record(room) for room in self.area.rooms.values()))
-        elif top_level == "AROOM":
-            document = "".join(render_record(room) for room in self.area.rooms.values())
+            records = [self.area]
         else:
             raise NativeWriteError(f"Unsupported CoffeeMud top-level document {top_level!r}")
-        return native_coffee_document(document) + "\n"
+        if top_level not in ("MOBS", "ITEMS", "AROOMS"):
+            yield from (native_coffee_document(render_record(record)) for record in records)
+        elif not records:
+            yield f"<{top_level} />"
+        else:
+            yield f"<{top_level}>"
+            yield from (native_coffee_document(render_record(record)) for record in records)
+            yield f"</{top_level}>"
+        yield "\n"
+
+    def write_to(self, stream):
+        stream.writelines(self.iter_native_document())
 
     def write(self, path):
-        with open(path, mode="wt", encoding="latin-1", newline="\n") as coffee_file:
-            coffee_file.write(self.dumps())
+        with staged_writes() as open_native_file, open_native_file(path) as coffee_file:
+            self.write_to(coffee_file)
 
     def load_sections(self):
-        root = self.parse_document(self.data)
-        self.load_root(root)
+        for section_name, record in self.iter_records():
+            if section_name == "mobiles":
+                self.area.mobs.append(record)
+            elif section_name == "items":
+                self.area.items.append(record)
+            else:
+                self.area.rooms[record.room_id] = record
+
+    def iter_records(self, only=None):
+        """Yield (section name, record) pairs as each <MOB>, <ITEM> and <AROOM> element closes.
+
+        The file is repaired chunk by chunk and fed to an XML pull parser inside
+        a <ROOT> wrapper, so a multi-root catalog is read in one pass. Each
+        record element is detached from the tree once it has been read.
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        parser.feed("<ROOT>")
+        open_elements = []
+        for chunk in self.iter_repaired_chunks():
+            parser.feed(chunk)
+            yield from self.read_events(parser, open_elements, only)
+        parser.feed("</ROOT>")
+        parser.close()
+        yield from self.read_events(parser, open_elements, only)
+
+    def iter_repaired_chunks(self):
+        """Read the file in chunks and repair each one up to its last "<".
+
+        Neither repair can match across a "<", so the text before one never
+        depends on what follows it.
+        """
+        for index, text in enumerate(self.iter_markup_pieces()):
+            if index == 0:
+                text = XML_DECLARATION.sub("", text)
+            yield self.repair_markup(text)
+
+    def iter_markup_pieces(self):
+        with open(self.filename, mode="rt", encoding="latin-1") as coffee_file:
+            pending = ""
+            for chunk in iter(functools.partial(coffee_file.read, self.CHUNK_SIZE), ""):
+                pending += chunk
+                split = pending.rfind("<")
+                if split > 0:
+                    yield pending[:split]
+                    pending = pending[split:]
+        yield pending
+
+    def read_events(self, parser, open_elements, only):
+        for event, element in parser.read_events():
+            if event == "start":
+                open_elements.append(element)
+                if len(open_elements) == 2:
+                    self.start_document(self.clean_tag(element.tag))
+                continue
+            open_elements.pop()
+            if not open_elements:
+                continue
+            section_name = self.record_section(open_elements, element)
+            if section_name is not None:
+                if only is None or section_name in only:
+                    yield section_name, self.read_record(section_name, element)
+                open_elements[-1].remove(element)
+            elif len(open_elements) == 1:
+                self.finish_document(element)
+                open_elements[-1].remove(element)
+
+    def record_section(self, ancestors, element):
+        tag = self.clean_tag(element.tag).upper()
+        if len(ancestors) == 1:
+            return RECORD_SECTIONS.get(tag)
+        document_tag = self.clean_tag(ancestors[1].tag)
+        if len(ancestors) == 2 and RECORD_CONTAINERS.get(document_tag) == tag:
+            return RECORD_SECTIONS[tag]
+        if (
+            len(ancestors) == 3
+            and document_tag == "AREA"
+            and tag == "AROOM"
+            and self.child(ancestors[1], "AROOMS") is ancestors[2]
+        ):
+            return "rooms"
+        return None
+
+    def read_record(self, section_name, element):
+        if section_name == "mobiles":
+            return self.read_mob(element)
+        if section_name == "items":
+            return self.read_item(element)
+        return self.read_room(element)
+
+    def start_document(self, tag):
+        if tag == "AREA":
+            self.area = CoffeeMudArea()
+        elif tag in RECORD_SECTIONS or tag in RECORD_CONTAINERS:
+            self.area.top_level = tag
+            if tag in ("ITEMS", "ITEM"):
+                self.area.objects = self.area.items
+
+    def finish_document(self, element):
+        tag = self.clean_tag(element.tag)
+        if tag == "AREA":
+            area = self.read_area(element)
+            area.top_level = "AREA"
+            area.rooms = self.area.rooms
+            self.area = area
+        elif tag not in RECORD_CONTAINERS:
+            self.area.top_level = tag
+            self.area.raw_data[tag] = self.element_to_data(element)
 
     def parse_document(self, text):
-        text = self.quote_unquoted_attributes(text)
-        text = self.escape_bare_ampersands(text)
-        try:
-            return ET.fromstring(text)
-        except ET.ParseError:
-            return ET.fromstring("<ROOT>" + text + "</ROOT>")
+        """Parse repaired text once inside a <ROOT> wrapper, unwrapping a single-rooted document."""
+        text = XML_DECLARATION.sub("", self.repair_markup(text))
+        root = ET.fromstring("<ROOT>" + text + "</ROOT>")
+        if len(root) != 1 or (root.text or "").strip() or (root[0].tail or "").strip():
+            return root
+        element = root[0]
+        element.tail = None
+        return element
+
+    def repair_markup(self, text):
+        return self.escape_bare_ampersands(self.quote_unquoted_attributes(text))
 
     def quote_unquoted_attributes(self, text):
         return re.sub(r"<[^<>]+>", self.quote_tag_unquoted_attributes, text)
@@ -86,43 +210,6 @@ class CoffeeMudAreaFile:
     def repair_split_entities(self, value):
         return re.sub(r"&\s+(lt|gt|amp|quot|apos);", r"&\1;", value)
 
-    def load_root(self, root):
-        tag = self.clean_tag(root.tag)
-        if tag == "ROOT":
-            for child in root:
-                self.load_root(child)
-            return
-        if tag == "MOBS":
-            self.area.top_level = "MOBS"
-            self.area.mobs.extend(self.read_mobs(root))
-        elif tag == "MOB":
-            self.area.top_level = "MOB"
-            self.area.mobs.append(self.read_mob(root))
-        elif tag == "ITEMS":
-            self.area.top_level = "ITEMS"
-            self.area.items.extend(self.read_items(root))
-            self.area.objects = self.area.items
-        elif tag == "ITEM":
-            self.area.top_level = "ITEM"
-            item = self.read_item(root)
-            self.area.items.append(item)
-            self.area.objects = self.area.items
-        elif tag == "AREA":
-            area = self.read_area(root)
-            area.top_level = "AREA"
-            self.area = area
-        elif tag == "AROOMS":
-            self.area.top_level = "AROOMS"
-            for room in self.read_rooms(root):
-                self.area.rooms[room.room_id] = room
-        elif tag == "AROOM":
-            self.area.top_level = "AROOM"
-            room = self.read_room(root)
-            self.area.rooms[room.room_id] = room
-        else:
-            self.area.top_level = tag
-            self.area.raw_data[tag] = self.element_to_data(root)
-
     def clean_tag(self, tag):
         if "}" in tag:
             return tag.rsplit("}", 1)[1]
@@ -539,8 +626,11 @@ class CoffeeMudAreaFile:
         except ValueError:
             return default
 
+    def source_paths(self):
+        return [self.filename]
+
     def as_dict(self):
-        return area_reader.serialization.EnumNameConverter().unstructure(self.area)
+        return area_reader.serialization.unstructure(self.area)
 
     def as_json(self, indent=None):
         return json.dumps(self.as_dict(), indent=indent)
@@ -691,7 +781,7 @@ def native_coffee_mob_suffix(owner):
     return f"</{owner.native_tag}>"
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudBehavior:
     NATIVE_PREFIX = "<BHAVE>"
     NATIVE_SUFFIX = "</BHAVE>"
@@ -707,7 +797,7 @@ class CoffeeMudBehavior:
     )
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudAffect:
     NATIVE_PREFIX = "<AFF>"
     NATIVE_SUFFIX = "</AFF>"
@@ -723,7 +813,7 @@ class CoffeeMudAffect:
     )
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudAbility:
     NATIVE_PREFIX = "<ABLTY>"
     NATIVE_SUFFIX = "</ABLTY>"
@@ -743,7 +833,7 @@ class CoffeeMudAbility:
     )
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudMob:
     NATIVE_PREFIX = native_coffee_mob_prefix
     NATIVE_SUFFIX = native_coffee_mob_suffix
@@ -809,7 +899,7 @@ class CoffeeMudMob:
     native_tag = attr(default="MOB", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudItem:
     NATIVE_PREFIX = native_coffee_item_prefix
     NATIVE_SUFFIX = native_coffee_item_suffix
@@ -897,7 +987,7 @@ class CoffeeMudItem:
     native_tag = attr(default="ITEM", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudExit:
     NATIVE_PREFIX = "<REXIT>"
     NATIVE_SUFFIX = "</REXIT>"
@@ -917,7 +1007,7 @@ class CoffeeMudExit:
     raw_data = attr(default=Factory(dict), eq=False)
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudRoom:
     NATIVE_PREFIX = "<AROOM>"
     NATIVE_SUFFIX = "</AROOM>"
@@ -958,7 +1048,7 @@ class CoffeeMudRoom:
     raw_data = attr(default=Factory(dict), eq=False)
 
 
-@attributes
+@attributes(slots=True)
 class CoffeeMudArea:
     NATIVE_PREFIX = "<AREA>"
     NATIVE_SUFFIX = "</AREA>"
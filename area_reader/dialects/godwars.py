@@ -1,7 +1,5 @@
 """GodWars Deluxe area models, codecs, and reader."""
 
-from operator import setitem
-
 from attr import Factory, attr, attributes
 
 import area_reader.dialects.merc
@@ -13,7 +11,7 @@ from area_reader.native import records as native_records
 from area_reader.native import tilde_string as native_tilde_string
 
 
-@attributes
+@attributes(slots=True)
 class GodWarsObjectPower:
     wearer_on = area_reader.schema.field(default="", type=str, native=NativeField(1, native_tilde_string, prefix="Q\n"))
     wearer_off = area_reader.schema.field(default="", type=str, native=NativeField(2, native_tilde_string))
@@ -25,7 +23,7 @@ class GodWarsObjectPower:
     spec_power = area_reader.schema.field(default=0, type=int, native=NativeField(8, native_number))
 
 
-@attributes
+@attributes(slots=True)
 class GodWarsRoomText:
     input = area_reader.schema.field(default="", type=str, native=NativeField(1, native_tilde_string, prefix="T\n"))
     output = area_reader.schema.field(default="", type=str, native=NativeField(2, native_tilde_string))
@@ -53,7 +51,7 @@ class GodWarsRoomText:
         )
 
 
-@attributes
+@attributes(slots=True)
 class GodWarsItem(area_reader.dialects.merc.MercItem):
     power = area_reader.schema.field(
         default=None,
@@ -68,7 +66,7 @@ class GodWarsItem(area_reader.dialects.merc.MercItem):
         return super().read_metadata_record(reader, letter)
 
 
-@attributes
+@attributes(slots=True)
 class GodWarsRoom(area_reader.dialects.merc.MercRoom):
     texts = area_reader.schema.field(
         default=Factory(list),
@@ -83,7 +81,7 @@ class GodWarsRoom(area_reader.dialects.merc.MercRoom):
         return super().read_metadata_record(reader, letter)
 
 
-@attributes
+@attributes(slots=True)
 class GodWarsArea(area_reader.dialects.merc.MercArea):
     NATIVE_SECTIONS = (
         NativeSection("AREA", owner_section="area", when=lambda area: area.header_format == "area"),
@@ -156,10 +154,8 @@ class GodWarsAreaFile(area_reader.dialects.merc.MercAreaFile):
             else:
                 self.parse_fail(f"Unknown GodWars area metadata field {field!r}")
 
-    def load_objects(self):
-        for item in self.load_vnum_section(GodWarsItem):
-            setitem(self.area.objects, item.vnum, item)
+    def iter_objects(self):
+        return self.load_vnum_section(GodWarsItem)
 
-    def load_rooms(self):
-        for room in self.load_vnum_section(GodWarsRoom):
-            setitem(self.area.rooms, room.vnum, room)
+    def iter_rooms(self):
+        return self.load_vnum_section(GodWarsRoom)
@@ -156,7 +156,7 @@ def native_room_mapping(value, owner):
     return "".join(render_record(record) for record in value.values())
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaExit:
     door = area_reader.schema.field(default=0, native=NativeField(1, native_number, prefix="D"))
     description = area_reader.schema.field(default="", native=NativeField(2, native_tilde_string))
@@ -168,7 +168,7 @@ class MedieviaExit:
     destination = area_reader.schema.field(default=0, native=NativeField(8, native_number))
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaRoom(area_reader.model.MudBase):
     NATIVE_SUFFIX = "S\n"
 
@@ -199,7 +199,7 @@ class MedieviaRoom(area_reader.model.MudBase):
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaReset:
     command = area_reader.schema.field(default="", native=NativeField(1, lambda value, owner: str(value), suffix=" "))
     if_flag = area_reader.schema.field(default=0, native=NativeField(2, native_number, suffix=" "))
@@ -219,7 +219,7 @@ class MedieviaReset:
     comment = area_reader.schema.field(default="", native=NativeField(7, native_medievia_reset_comment, prefix=" "))
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaZone:
     NATIVE_SUFFIX = "S\n"
 
@@ -236,7 +236,7 @@ class MedieviaZone:
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaMob(area_reader.model.MudBase):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(1, native_number, prefix="#")
@@ -344,13 +344,13 @@ class MedieviaMob(area_reader.model.MudBase):
     source_file = attr(default="medievia.mob", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaAffect:
     location = attr(default=0, type=int)
     modifier = attr(default=0, type=int)
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaItem(area_reader.model.Item):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(1, native_number, prefix="#")
@@ -386,7 +386,7 @@ class MedieviaItem(area_reader.model.Item):
     source_file = attr(default="medievia.obj", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaShop:
     vnum = area_reader.schema.field(default=0, native=NativeField(1, native_number, prefix="#", suffix="~\n"))
     producing = area_reader.schema.field(default=Factory(lambda: [-1] * 6), native=NativeField(2, native_fixed_ints(6)))
@@ -406,7 +406,7 @@ class MedieviaShop:
     source_file = attr(default="medievia.shp", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class MedieviaArea:
     zones = attr(default=Factory(OrderedDict))
     rooms = attr(default=Factory(OrderedDict))
@@ -461,6 +461,8 @@ class MedieviaAreaFile(area_reader.dialects.circle.CircleAreaFile):
         self.load_mobiles()
         self.load_objects()
         self.load_shops()
+        if self.fingerprint_files:
+            self.remember_native_files()
 
     def read_token(self):
         self.skip_whitespace()
@@ -819,37 +821,42 @@ class MedieviaAreaFile(area_reader.dialects.circle.CircleAreaFile):
                 )
             )
 
-    def dumps(self):
-        tree = OrderedDict()
-        tree["medievia.zon"] = "".join(render_record(zone) for zone in self.area.zones.values())
-        tree["medievia.zon"] += f"#{self.area.zone_terminal}\n$~\n"
-
+    def source_paths(self):
+        if self.component_path is not None:
+            return [self.component_path]
+        room_files = OrderedDict.fromkeys(zone.source_file for zone in self.area.zones.values())
+        return [
+            os.path.join(self.lib_root, "medievia.zon"),
+            *(os.path.join(self.lib_root, "wld", source_file) for source_file in room_files),
+            os.path.join(self.lib_root, "medievia.mob"),
+            os.path.join(self.lib_root, "medievia.obj"),
+            os.path.join(self.lib_root, "medievia.shp"),
+        ]
+
+    def native_files(self):
+        """Validate the tree and map each native file to its parts: literal text and records to render."""
         source_files = [zone.source_file for zone in self.area.zones.values()]
         if len(source_files) != len(set(source_files)):
             raise NativeWriteError("Medievia zone names do not map to unique world filenames")
-        known_files = set(source_files)
+        rooms_by_file = {source_file: [] for source_file in source_files}
         for room in self.area.rooms.values():
             if not room.source_file:
                 raise NativeWriteError(f"MedieviaRoom {room.vnum!r} has no source_file")
-            if room.source_file not in known_files:
+            try:
+                rooms_by_file[room.source_file].append(room)
+            except KeyError:
                 raise NativeWriteError(f"MedieviaRoom {room.vnum!r} uses unknown world file {room.source_file!r}")
-        for source_file in source_files:
-            terminal = self.area.room_terminals.get(source_file, 19999)
-            body = "".join(render_record(room) for room in self.area.rooms.values() if room.source_file == source_file)
-            tree[f"wld/{source_file}"] = body + f"#{terminal}\n$~\n"
 
-        tree["medievia.mob"] = "".join(render_record(mob) for mob in self.area.mobs.values())
-        tree["medievia.mob"] += f"#{self.area.mobile_terminal}\n$~\n"
-        tree["medievia.obj"] = "".join(render_record(item) for item in self.area.objects.values())
-        tree["medievia.obj"] += f"#{self.area.object_terminal}\n$~\n"
-        tree["medievia.shp"] = "".join(render_record(shop) for shop in self.area.shops) + "$~\n"
-        return tree
+        files = OrderedDict()
+        files["medievia.zon"] = [*self.area.zones.values(), f"#{self.area.zone_terminal}\n$~\n"]
+        for source_file, rooms in rooms_by_file.items():
+            terminal = self.area.room_terminals.get(source_file, 19999)
+            files[f"wld/{source_file}"] = [*rooms, f"#{terminal}\n$~\n"]
+        files["medievia.mob"] = [*self.area.mobs.values(), f"#{self.area.mobile_terminal}\n$~\n"]
+        files["medievia.obj"] = [*self.area.objects.values(), f"#{self.area.object_terminal}\n$~\n"]
+        files["medievia.shp"] = [*self.area.shops, "$~\n"]
+        return files
 
-    def write(self, root):
+    def native_root(self, root):
         root = os.fspath(root)
-        lib_root = root if os.path.basename(os.path.normpath(root)).lower() == "lib" else os.path.join(root, "lib")
-        for relative_path, text in self.dumps().items():
-            path = os.path.join(lib_root, *relative_path.split("/"))
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, mode="wt", encoding="latin-1", newline="\n") as medievia_file:
-                medievia_file.write(text)
+        return root if os.path.basename(os.path.normpath(root)).lower() == "lib" else os.path.join(root, "lib")
@@ -2,7 +2,6 @@
 
 import logging
 from collections import OrderedDict
-from operator import setitem
 
 from attr import Factory, attr, attributes
 
@@ -23,7 +22,14 @@ from area_reader.constants import (
     PARTS,
     WEAR_FLAGS,
 )
-from area_reader.native import NativeField, NativeSection, NativeWriteError, render_document
+from area_reader.native import (
+    NativeField,
+    NativeSection,
+    NativeWriteError,
+    iter_document,
+    render_document,
+    staged_writes,
+)
 from area_reader.native import flag as native_flag
 from area_reader.native import nested as native_nested
 from area_reader.native import number as native_number
@@ -38,25 +44,24 @@ class MercAreaFile(area_reader.parser.AreaFile):
     def dumps(self):
         return render_document(self.area, self.area.NATIVE_SECTIONS, self.skipped_sections)
 
+    def write_to(self, stream):
+        stream.writelines(iter_document(self.area, self.area.NATIVE_SECTIONS, self.skipped_sections))
+
     def write(self, path):
-        with open(path, mode="wt", encoding="latin-1", newline="\n") as area_file:
-            area_file.write(self.dumps())
+        with staged_writes() as open_native_file, open_native_file(path) as area_file:
+            self.write_to(area_file)
 
-    def load_mobiles(self):
-        for mob in self.load_vnum_section(MercMob):
-            setitem(self.area.mobs, mob.vnum, mob)
+    def iter_mobiles(self):
+        return self.load_vnum_section(MercMob)
 
-    def load_objects(self):
-        for item in self.load_vnum_section(MercItem):
-            setitem(self.area.objects, item.vnum, item)
+    def iter_objects(self):
+        return self.load_vnum_section(MercItem)
 
-    def load_rooms(self):
-        for room in self.load_vnum_section(MercRoom):
-            setitem(self.area.rooms, room.vnum, room)
+    def iter_rooms(self):
+        return self.load_vnum_section(MercRoom)
 
-    def load_resets(self):
-        for reset in self.read_flat_section(MercReset):
-            self.area.resets.append(reset)
+    def iter_resets(self):
+        return self.read_flat_section(MercReset)
 
     def read_area_metadata(self):
         self.area.metadata = self.read_string()
@@ -88,7 +93,7 @@ def native_merc_reset_arg2_suffix(owner):
     return "" if owner.command in ("G", "R") else " "
 
 
-@attributes
+@attributes(slots=True)
 class MercAffectData:
     type = attr(default=-1)
     duration = attr(default=-1)
@@ -97,7 +102,7 @@ class MercAffectData:
     bitvector = attr(default=0)
 
 
-@attributes
+@attributes(slots=True)
 class MercExit(area_reader.model.Exit):
     exit_info = area_reader.schema.field(
         default=0,
@@ -107,7 +112,7 @@ class MercExit(area_reader.model.Exit):
     )
 
 
-@attributes
+@attributes(slots=True)
 class MercReset:
     command = area_reader.schema.field(
         default=None,
@@ -151,7 +156,7 @@ class MercReset:
         return cls(command=command, if_flag=if_flag, arg1=arg1, arg2=arg2, arg3=arg3, comment=comment)
 
 
-@attributes
+@attributes(slots=True)
 class MercRoom(area_reader.model.Room):
     owner = attr(default=None, type=str)
     clan = attr(default="", type=str)
@@ -186,7 +191,7 @@ class MercRoom(area_reader.model.Room):
         return True
 
 
-@attributes
+@attributes(slots=True)
 class MercMob(area_reader.dialects.rom.RomMob):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(0, native_number, prefix="#")
@@ -279,7 +284,7 @@ class MercMob(area_reader.dialects.rom.RomMob):
         )
 
 
-@attributes
+@attributes(slots=True)
 class MercItem(area_reader.model.Item):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(0, native_number, prefix="#")
@@ -360,7 +365,7 @@ class MercItem(area_reader.model.Item):
         return True
 
 
-@attributes
+@attributes(slots=True)
 class MercArea:
     NATIVE_SECTIONS = (
         NativeSection("AREA", owner_section="area"),
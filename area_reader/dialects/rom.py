@@ -2,7 +2,6 @@
 
 import logging
 from collections import OrderedDict
-from operator import setitem
 
 from attr import Factory, attr, attributes
 
@@ -21,7 +20,14 @@ from area_reader.constants import (
     WEAR_FLAGS,
     remove_bit,
 )
-from area_reader.native import NativeField, NativeSection, NativeWriteError, render_document
+from area_reader.native import (
+    NativeField,
+    NativeSection,
+    NativeWriteError,
+    iter_document,
+    render_document,
+    staged_writes,
+)
 from area_reader.native import flag as native_flag
 from area_reader.native import nested as native_nested
 from area_reader.native import number as native_number
@@ -37,17 +43,18 @@ class RomAreaFile(area_reader.parser.AreaFile):
     def dumps(self):
         return render_document(self.area, self.area.NATIVE_SECTIONS, self.skipped_sections)
 
+    def write_to(self, stream):
+        stream.writelines(iter_document(self.area, self.area.NATIVE_SECTIONS, self.skipped_sections))
+
     def write(self, path):
-        with open(path, mode="wt", encoding="latin-1", newline="\n") as area_file:
-            area_file.write(self.dumps())
+        with staged_writes() as open_native_file, open_native_file(path) as area_file:
+            self.write_to(area_file)
 
-    def load_mobiles(self):
-        for mob in self.load_vnum_section(RomMob):
-            setitem(self.area.mobs, mob.vnum, mob)
+    def iter_mobiles(self):
+        return self.load_vnum_section(RomMob)
 
-    def load_objects(self):
-        for item in self.load_vnum_section(RomItem):
-            setitem(self.area.objects, item.vnum, item)
+    def iter_objects(self):
+        return self.load_vnum_section(RomItem)
 
     def read_area_metadata(self):
         self.area.original_filename = self.read_string()
@@ -127,7 +134,7 @@ def native_affect_modifier_suffix(owner):
     return "\n" if owner.where == "TO_OBJECT" else " "
 
 
-@attributes
+@attributes(slots=True)
 class RomAffectData:
     where = attr(default=None)
     type = attr(default=None)
@@ -149,7 +156,7 @@ class RomAffectData:
     )
 
 
-@attributes
+@attributes(slots=True)
 class RomItem(area_reader.model.Item):
     @staticmethod
     def convert_condition(letter):
@@ -315,7 +322,7 @@ class RomItem(area_reader.model.Item):
         )
 
 
-@attributes
+@attributes(slots=True)
 class RomArmorClass:
     pierce = area_reader.schema.field(
         default=0, type=int, on_read=multiply_10, native=NativeField(1, native_divide_by_ten)
@@ -331,7 +338,7 @@ class RomArmorClass:
     )
 
 
-@attributes
+@attributes(slots=True)
 class RomMobprog:
     trig_type = area_reader.schema.field(
         default=None, type=area_reader.values.Word, native=NativeField(1, native_word, prefix="M ", suffix=" ")
@@ -342,7 +349,7 @@ class RomMobprog:
     trig_phrase = area_reader.schema.field(default=None, type=str, native=NativeField(3, native_tilde_string))
 
 
-@attributes
+@attributes(slots=True)
 class RomCharacter(area_reader.model.MudBase):
     short_desc = area_reader.schema.field(default="", type=str)
     long_desc = attr(default="", type=str)
@@ -360,7 +367,7 @@ class RomCharacter(area_reader.model.MudBase):
     affected_by = attr(default=0, type=AFFECTED_BY, converter=AFFECTED_BY)
 
 
-@attributes
+@attributes(slots=True)
 class RomMob(RomCharacter):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(0, native_number, prefix="#")
@@ -516,7 +523,7 @@ class RomMob(RomCharacter):
         )
 
 
-@attributes
+@attributes(slots=True)
 class RomArea:
     NATIVE_SECTIONS = (
         NativeSection("AREA", owner_section="area"),
@@ -1,8 +1,8 @@
 """SMAUG area models, codecs, and reader."""
 
 import logging
+import re
 from collections import OrderedDict
-from operator import setitem
 
 from attr import Factory, attr, attributes
 
@@ -30,6 +30,8 @@ from area_reader.native import records as native_records
 from area_reader.native import tilde_string as native_tilde_string
 from area_reader.native import word as native_word
 
+SMAUG_PROGRAM = re.compile(r"\s*(?:>\s*([^\s\0'\"][^\s\0]*)\s*([^~]*)~\s*([^~]*)~|(\|))")
+
 
 class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
     MAX_FIX = 3
@@ -55,22 +57,28 @@ class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
 
     def read_smaug_programs(self):
         programs = []
-        self.skip_whitespace()
-        while self.current_char == ">":
-            self.read_and_verify_letter(">")
-            programs.append(
-                SmaugProgram(
-                    trigger=self.read_word(),
-                    argument=self.read_string(),
-                    commands=self.read_string(),
-                )
-            )
-            self.skip_whitespace()
-        self.read_and_verify_letter("|")
-        return programs
-
-    def load_sections(self):
-        readers = {
+        data = self.data
+        while True:
+            match = SMAUG_PROGRAM.match(data, self.index)
+            if match is None:
+                self.skip_whitespace()
+                if self.current_char != ">":
+                    self.read_and_verify_letter("|")
+                    return programs
+                programs.append(self.read_smaug_program())
+                continue
+            self.index = match.end()
+            trigger, argument, commands, end = match.groups()
+            if end:
+                return programs
+            programs.append(SmaugProgram(trigger=trigger, argument=argument, commands=commands))
+
+    def read_smaug_program(self):
+        self.read_and_verify_letter(">")
+        return SmaugProgram(trigger=self.read_word(), argument=self.read_string(), commands=self.read_string())
+
+    def section_readers(self):
+        return {
             "area": self.read_area_metadata,
             "author": self.load_author,
             "credits": self.load_credits,
@@ -91,6 +99,16 @@ class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
             "climate": self.load_climate,
             "spelllimit": self.load_spelllimit,
         }
+
+    def record_readers(self):
+        readers = super().record_readers()
+        readers["repairs"] = self.iter_repairs
+        return readers
+
+    def section_names(self, only=None):
+        if only is not None:
+            yield from super().section_names(only)
+            return
         while True:
             self.skip_whitespace()
             if self.index >= len(self.data):
@@ -99,17 +117,7 @@ class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
             self.current_section_name = section_name
             if section_name == "$":
                 return
-            reader = readers.get(section_name)
-            if reader is None:
-                self.skip_section(section_name)
-            else:
-                logger.info(f"Processing section {section_name}")
-                try:
-                    reader()
-                except area_reader.parser.ParseError:
-                    raise
-                except Exception as error:  # noqa: BLE001 - add parser source context to arbitrary model errors
-                    self.parse_fail(f"Error reading section {section_name!r}: {error!r}")
+            yield section_name
 
     def read_area_metadata(self):
         self.area.name = self.read_string()
@@ -144,17 +152,14 @@ class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
     def load_spelllimit(self):
         self.area.spelllimit = self.read_number()
 
-    def load_mobiles(self):
-        for mob in self.load_smaug_vnum_section(SmaugMob):
-            setitem(self.area.mobs, mob.vnum, mob)
+    def iter_mobiles(self):
+        return self.load_smaug_vnum_section(SmaugMob)
 
-    def load_objects(self):
-        for item in self.load_smaug_vnum_section(SmaugItem):
-            setitem(self.area.objects, item.vnum, item)
+    def iter_objects(self):
+        return self.load_smaug_vnum_section(SmaugItem)
 
-    def load_rooms(self):
-        for room in self.load_smaug_vnum_section(SmaugRoom):
-            setitem(self.area.rooms, room.vnum, room)
+    def iter_rooms(self):
+        return self.load_smaug_vnum_section(SmaugRoom)
 
     def load_smaug_vnum_section(self, section_object_type):
         while True:
@@ -171,11 +176,14 @@ class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
                 break
             yield self.read_object(section_object_type, vnum=vnum)
 
-    def load_resets(self):
-        for reset in self.read_flat_section(area_reader.dialects.merc.MercReset):
-            self.area.resets.append(reset)
+    def iter_resets(self):
+        return self.read_flat_section(area_reader.dialects.merc.MercReset)
 
     def load_repairs(self):
+        for repair in self.iter_repairs():
+            self.area.repairs.append(repair)
+
+    def iter_repairs(self):
         while True:
             keeper = self.read_number()
             if keeper == 0:
@@ -186,16 +194,14 @@ class SmaugAreaFile(area_reader.dialects.rom.RomAreaFile):
             open_hour = self.read_number()
             close_hour = self.read_number()
             comment = self.read_to_eol()
-            self.area.repairs.append(
-                SmaugRepair(
-                    keeper=keeper,
-                    fix_type=fix_type,
-                    profit_fix=profit_fix,
-                    shop_type=shop_type,
-                    open_hour=open_hour,
-                    close_hour=close_hour,
-                    comment=comment,
-                )
+            yield SmaugRepair(
+                keeper=keeper,
+                fix_type=fix_type,
+                profit_fix=profit_fix,
+                shop_type=shop_type,
+                open_hour=open_hour,
+                close_hour=close_hour,
+                comment=comment,
             )
 
     def load_resetmsg(self):
@@ -251,7 +257,7 @@ def native_dice_inline(value, owner):
     return f"{value.number}d{value.sides}{value.bonus:+d}"
 
 
-@attributes
+@attributes(slots=True)
 class SmaugProgram:
     trigger = area_reader.schema.field(
         default="", type=area_reader.values.Word, native=NativeField(1, native_word, prefix="> ", suffix=" ")
@@ -260,7 +266,7 @@ class SmaugProgram:
     commands = area_reader.schema.field(default="", type=str, native=NativeField(3, native_tilde_string))
 
 
-@attributes
+@attributes(slots=True)
 class SmaugMap:
     vnum = area_reader.schema.field(default=0, type=int, native=NativeField(1, native_number, prefix="M ", suffix=" "))
     x = area_reader.schema.field(default=0, type=int, native=NativeField(2, native_number, suffix=" "))
@@ -268,7 +274,7 @@ class SmaugMap:
     entry = area_reader.schema.field(default="", type=area_reader.values.Letter, native=NativeField(4, native_word))
 
 
-@attributes
+@attributes(slots=True)
 class SmaugRepair:
     keeper = area_reader.schema.field(default=0, type=int, native=NativeField(1, native_number, suffix=" "))
     fix_type = area_reader.schema.field(
@@ -281,7 +287,7 @@ class SmaugRepair:
     comment = area_reader.schema.field(default="", type=str, native=NativeField(7, area_reader.model.native_comment))
 
 
-@attributes
+@attributes(slots=True)
 class SmaugExit(area_reader.model.Exit):
     door = area_reader.schema.field(default=None, type=int, native=NativeField(1, native_number, prefix="D"))
     description = area_reader.schema.field(default="", type=str, native=NativeField(2, native_tilde_string))
@@ -299,7 +305,7 @@ class SmaugExit(area_reader.model.Exit):
     pull = area_reader.schema.field(default=0, type=int, native=NativeField(9, native_number))
 
 
-@attributes
+@attributes(slots=True)
 class SmaugMob(area_reader.dialects.rom.RomMob):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(0, native_number, prefix="#")
@@ -435,7 +441,7 @@ class SmaugMob(area_reader.dialects.rom.RomMob):
         )
 
 
-@attributes
+@attributes(slots=True)
 class SmaugItem(area_reader.model.Item):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(0, native_number, prefix="#")
@@ -538,7 +544,7 @@ class SmaugItem(area_reader.model.Item):
         )
 
 
-@attributes
+@attributes(slots=True)
 class SmaugRoom(area_reader.model.Room):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(0, native_number, prefix="#")
@@ -652,7 +658,7 @@ class SmaugRoom(area_reader.model.Room):
         )
 
 
-@attributes
+@attributes(slots=True)
 class SmaugArea(area_reader.dialects.rom.RomArea):
     NATIVE_SECTIONS = (
         NativeSection("AREA", owner_section="area"),
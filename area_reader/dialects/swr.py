@@ -1,7 +1,10 @@
 """SWR/FUSS area models, codecs, and reader."""
 
+import functools
+import re
 from collections import OrderedDict
 from operator import setitem
+from types import MappingProxyType
 
 from attr import Factory, attr, attributes
 
@@ -11,15 +14,148 @@ import area_reader.model
 import area_reader.schema
 import area_reader.serialization
 import area_reader.values
-from area_reader.native import NativeField, NativeSection, NativeWriteError, render_document
+from area_reader.native import (
+    NativeField,
+    NativeSection,
+    NativeWriteError,
+    iter_document,
+    render_document,
+    staged_writes,
+)
 from area_reader.native import number as native_number
 from area_reader.native import raw as native_raw
 from area_reader.native import records as native_records
 from area_reader.native import tilde_string as native_tilde_string
 from area_reader.native import word as native_word
 
+FUSS_KEY = re.compile(r"\s*([^\s\0'\"][^\s\0]*)")
+
+
+def fuss_field(attribute, method):
+    """Declare a FUSS key whose value reader.method() reads into the record's attribute."""
+    return setattr, attribute, method
+
+
+def fuss_record(attribute, method):
+    """Declare a FUSS key that opens a nested record for reader.method() to read onto a list."""
+    return fuss_append, attribute, method
+
+
+def fuss_handler(method):
+    """Declare a FUSS key that reader.method(record) reads itself."""
+    return None, None, method
+
+
+def fuss_append(record, attribute, value):
+    getattr(record, attribute).append(value)
+
 
 class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
+    FUSS_SECTIONS = MappingProxyType({"areadata": "area", "mobile": "mobiles", "object": "objects", "room": "rooms"})
+    RECORD_COLLECTIONS = MappingProxyType({"mobiles": "mobs", "objects": "objects", "rooms": "rooms"})
+    FUSS_PROGRAM_KEYS = MappingProxyType(
+        {
+            "Progtype": fuss_field("progtype", "read_string"),
+            "Arglist": fuss_field("argument", "read_string"),
+            "Comlist": fuss_field("commands", "read_string"),
+        }
+    )
+    FUSS_AREADATA_KEYS = MappingProxyType(
+        {
+            "Author": fuss_field("author", "read_string"),
+            "Economy": fuss_handler("read_fuss_economy"),
+            "Flags": fuss_field("flags", "read_string"),
+            "Name": fuss_field("name", "read_string"),
+            "Ranges": fuss_handler("read_fuss_ranges"),
+            "ResetMsg": fuss_field("resetmsg", "read_string"),
+            "ResetFreq": fuss_field("reset_frequency", "read_number"),
+            "Version": fuss_field("version", "read_number"),
+        }
+    )
+    FUSS_MOBILE_KEYS = MappingProxyType(
+        {
+            "#MUDPROG": fuss_record("programs", "read_fuss_program"),
+            "Vnum": fuss_field("vnum", "read_number"),
+            "Keywords": fuss_field("name", "read_string"),
+            "Short": fuss_field("short_desc", "read_string"),
+            "Long": fuss_field("long_desc", "read_string"),
+            "Desc": fuss_field("description", "read_string"),
+            "Race": fuss_field("race", "read_string"),
+            "Position": fuss_field("position", "read_string"),
+            "DefPos": fuss_field("default_position", "read_string"),
+            "Gender": fuss_field("gender", "read_string"),
+            "Stats1": fuss_field("stats1", "read_fuss_numbers"),
+            "Stats2": fuss_field("stats2", "read_fuss_numbers"),
+            "Stats3": fuss_field("stats3", "read_fuss_numbers"),
+            "Stats4": fuss_field("stats4", "read_fuss_numbers"),
+            "Attribs": fuss_field("attribs", "read_fuss_numbers"),
+            "Saves": fuss_field("saves", "read_fuss_numbers"),
+            "ShopData": fuss_field("shop_data", "read_fuss_numbers"),
+            "RepairData": fuss_field("repair_data", "read_fuss_numbers"),
+            "Specfun": fuss_field("specfun", "read_string"),
+            "Specfun2": fuss_field("specfun2", "read_string"),
+            "Actflags": fuss_field("actflags", "read_string"),
+            "Affected": fuss_field("affected", "read_string"),
+            "Speaks": fuss_field("speaks", "read_string"),
+            "Speaking": fuss_field("speaking", "read_string"),
+            "Bodyparts": fuss_field("bodyparts", "read_string"),
+            "Resist": fuss_field("resist", "read_string"),
+            "Immune": fuss_field("immune", "read_string"),
+            "Suscept": fuss_field("suscept", "read_string"),
+            "Attacks": fuss_field("attacks", "read_string"),
+            "Defenses": fuss_field("defenses", "read_string"),
+            "VIPFlags": fuss_field("vip_flags", "read_string"),
+        }
+    )
+    FUSS_OBJECT_KEYS = MappingProxyType(
+        {
+            "#EXDESC": fuss_record("extra_descriptions", "read_fuss_extra_description"),
+            "#MUDPROG": fuss_record("programs", "read_fuss_program"),
+            "Vnum": fuss_field("vnum", "read_number"),
+            "Keywords": fuss_field("name", "read_string"),
+            "Short": fuss_field("short_desc", "read_string"),
+            "Long": fuss_field("description", "read_string"),
+            "Type": fuss_field("type_name", "read_string"),
+            "Action": fuss_field("action_description", "read_string"),
+            "Flags": fuss_field("flags", "read_string"),
+            "WFlags": fuss_field("wflags", "read_string"),
+            "Values": fuss_field("value", "read_fuss_numbers"),
+            "Stats": fuss_field("stats", "read_fuss_numbers"),
+            "Spells": fuss_field("spells", "read_fuss_line"),
+        }
+    )
+    FUSS_ROOM_KEYS = MappingProxyType(
+        {
+            "#EXIT": fuss_record("exits", "read_fuss_exit"),
+            "#EXDESC": fuss_record("extra_descriptions", "read_fuss_extra_description"),
+            "#MUDPROG": fuss_record("programs", "read_fuss_program"),
+            "Vnum": fuss_field("vnum", "read_number"),
+            "Name": fuss_field("name", "read_string"),
+            "Desc": fuss_field("description", "read_string"),
+            "Sector": fuss_field("sector", "read_string"),
+            "Stats": fuss_field("stats", "read_fuss_numbers"),
+            "Reset": fuss_handler("read_fuss_reset"),
+            "Flags": fuss_field("flags", "read_string"),
+        }
+    )
+    FUSS_EXIT_KEYS = MappingProxyType(
+        {
+            "Desc": fuss_field("description", "read_string"),
+            "Direction": fuss_field("door", "read_string"),
+            "Distance": fuss_field("distance", "read_number"),
+            "Key": fuss_field("key", "read_number"),
+            "Keywords": fuss_field("keyword", "read_string"),
+            "ToRoom": fuss_field("destination", "read_number"),
+            "Flags": fuss_field("flags", "read_string"),
+        }
+    )
+    FUSS_EXTRA_DESCRIPTION_KEYS = MappingProxyType(
+        {
+            "ExDescKey": fuss_field("keyword", "read_string"),
+            "ExDesc": fuss_field("description", "read_string"),
+        }
+    )
+
     def create_area(self):
         return SwrArea()
 
@@ -31,38 +167,56 @@ class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
     def dumps(self):
         return render_document(self.area, self.area.NATIVE_SECTIONS, self.skipped_sections)
 
+    def write_to(self, stream):
+        stream.writelines(iter_document(self.area, self.area.NATIVE_SECTIONS, self.skipped_sections))
+
     def write(self, path):
-        with open(path, mode="wt", encoding="latin-1", newline="\n") as area_file:
-            area_file.write(self.dumps())
+        with staged_writes() as open_native_file, open_native_file(path) as area_file:
+            self.write_to(area_file)
 
-    def load_sections(self):
-        self.skip_whitespace()
-        if self.data.startswith("#FUSSAREA", self.index):
-            self.read_section_name()
-            self.load_fuss_area()
+    def load_sections(self, only=None):
+        if not self.is_fuss_area() and not self.is_mobile_list():
+            super().load_sections(only)
             return
-        if self.current_char == "#":
-            start = self.index
-            self.advance()
-            word = self.read_word()
-            self.index = start
-            if word.isdigit():
+        for section_name, record in self.iter_records(only):
+            if section_name == "resets":
+                self.area.resets.append(record)
+            else:
+                setitem(getattr(self.area, self.RECORD_COLLECTIONS[section_name]), record.vnum, record)
+
+    def iter_records(self, only=None):
+        if self.is_fuss_area():
+            self.read_section_name()
+            yield from self.iter_fuss_records(only)
+        elif self.is_mobile_list():
+            if only is None or "mobiles" in {name.lower() for name in only}:
                 for mob in self.load_smaug_vnum_section(area_reader.dialects.smaug.SmaugMob):
-                    setitem(self.area.mobs, mob.vnum, mob)
-                return
-        super().load_sections()
+                    yield "mobiles", mob
+        else:
+            yield from super().iter_records(only)
 
-    def load_mobiles(self):
-        for mob in self.load_swr_vnum_section(area_reader.dialects.smaug.SmaugMob):
-            setitem(self.area.mobs, mob.vnum, mob)
+    def is_fuss_area(self):
+        self.skip_whitespace()
+        return self.data.startswith("#FUSSAREA", self.index)
 
-    def load_objects(self):
-        for item in self.load_swr_vnum_section(area_reader.dialects.smaug.SmaugItem):
-            setitem(self.area.objects, item.vnum, item)
+    def is_mobile_list(self):
+        self.skip_whitespace()
+        if self.current_char != "#":
+            return False
+        start = self.index
+        self.advance()
+        word = self.read_word()
+        self.index = start
+        return word.isdigit()
 
-    def load_rooms(self):
-        for room in self.load_swr_vnum_section(area_reader.dialects.smaug.SmaugRoom):
-            setitem(self.area.rooms, room.vnum, room)
+    def iter_mobiles(self):
+        return self.load_swr_vnum_section(area_reader.dialects.smaug.SmaugMob)
+
+    def iter_objects(self):
+        return self.load_swr_vnum_section(area_reader.dialects.smaug.SmaugItem)
+
+    def iter_rooms(self):
+        return self.load_swr_vnum_section(area_reader.dialects.smaug.SmaugRoom)
 
     def load_swr_vnum_section(self, section_object_type):
         while True:
@@ -80,27 +234,46 @@ class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
                 break
             yield self.read_object(section_object_type, vnum=vnum)
 
-    def load_fuss_area(self):
+    def fuss_section_names(self, only=None):
+        if only is not None:
+            wanted = {fuss_name for fuss_name, name in self.FUSS_SECTIONS.items() if name in only}
+            if "resets" in only:
+                wanted.add("room")
+            for span in self.table_of_contents():
+                if span.name == "endarea":
+                    return
+                if span.name in wanted:
+                    self.index = span.body
+                    self.current_section_name = span.name
+                    yield span.name
+            return
         while True:
             self.skip_whitespace()
             if self.index >= len(self.data):
                 return
             section_name = self.read_section_name()
             self.current_section_name = section_name
+            if section_name == "endarea":
+                return
+            yield section_name
+
+    def iter_fuss_records(self, only=None):
+        if only is not None:
+            only = {name.lower() for name in only}
+        for section_name in self.fuss_section_names(only):
             if section_name == "areadata":
                 self.load_fuss_areadata()
             elif section_name == "mobile":
-                mob = self.read_fuss_mobile()
-                setitem(self.area.mobs, mob.vnum, mob)
+                yield "mobiles", self.read_fuss_mobile()
             elif section_name == "object":
-                item = self.read_fuss_object()
-                setitem(self.area.objects, item.vnum, item)
+                yield "objects", self.read_fuss_object()
             elif section_name == "room":
                 room = self.read_fuss_room()
-                setitem(self.area.rooms, room.vnum, room)
-                self.area.resets.extend(room.resets)
-            elif section_name == "endarea":
-                return
+                if only is None or "rooms" in only:
+                    yield "rooms", room
+                if only is None or "resets" in only:
+                    for reset in room.resets:
+                        yield "resets", reset
             else:
                 self.skip_fuss_value()
 
@@ -118,126 +291,59 @@ class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
     def read_fuss_numbers(self):
         return [int(value) for value in self.read_to_eol().split()]
 
-    def read_fuss_program(self):
-        program = SwrProgram()
+    @classmethod
+    @functools.cache
+    def fuss_key_table(cls, name):
+        """Resolve a declared FUSS key table against this class's reader methods, once per class."""
+        declared = getattr(cls, name)
+        return {key: (store, attribute, getattr(cls, method)) for key, (store, attribute, method) in declared.items()}
+
+    def read_fuss_keys(self, record, table_name, end):
+        """Read keyed lines into record until the end marker, keeping unknown keys as SwrUnknown."""
+        keys = self.fuss_key_table(table_name)
+        data = self.data
         while True:
-            word = self.read_word()
-            if word == "#ENDPROG":
-                return program
-            if word == "Progtype":
-                program.progtype = self.read_string()
-            elif word == "Arglist":
-                program.argument = self.read_string()
-            elif word == "Comlist":
-                program.commands = self.read_string()
+            match = FUSS_KEY.match(data, self.index)
+            if match is None:
+                word = self.read_word()
             else:
-                program.unknown.append(self.read_fuss_unknown(word))
+                self.index = match.end()
+                word = match.group(1)
+            if word == end:
+                return record
+            entry = keys.get(word)
+            if entry is None:
+                record.unknown.append(self.read_fuss_unknown(word))
+                continue
+            store, attribute, read = entry
+            if store is None:
+                read(self, record)
+            else:
+                store(record, attribute, read(self))
+
+    def read_fuss_line(self):
+        return self.read_to_eol().strip()
+
+    def read_fuss_program(self):
+        return self.read_fuss_keys(SwrProgram(), "FUSS_PROGRAM_KEYS", "#ENDPROG")
 
     def load_fuss_areadata(self):
-        while True:
-            word = self.read_word()
-            if word == "#ENDAREADATA":
-                return
-            if word == "Author":
-                self.area.author = self.read_string()
-            elif word == "Economy":
-                self.area.high_economy = self.read_number()
-                self.area.low_economy = self.read_number()
-            elif word == "Flags":
-                self.area.flags = self.read_string()
-            elif word == "Name":
-                self.area.name = self.read_string()
-            elif word == "Ranges":
-                values = self.read_fuss_numbers()
-                if len(values) >= 4:
-                    self.area.low_soft_range = values[0]
-                    self.area.high_soft_range = values[1]
-                    self.area.low_hard_range = values[2]
-                    self.area.high_hard_range = values[3]
-            elif word == "ResetMsg":
-                self.area.resetmsg = self.read_string()
-            elif word == "ResetFreq":
-                self.area.reset_frequency = self.read_number()
-            elif word == "Version":
-                self.area.version = self.read_number()
-            else:
-                self.area.unknown.append(self.read_fuss_unknown(word))
+        self.read_fuss_keys(self.area, "FUSS_AREADATA_KEYS", "#ENDAREADATA")
+
+    def read_fuss_economy(self, area):
+        area.high_economy = self.read_number()
+        area.low_economy = self.read_number()
+
+    def read_fuss_ranges(self, area):
+        values = self.read_fuss_numbers()
+        if len(values) >= 4:
+            area.low_soft_range = values[0]
+            area.high_soft_range = values[1]
+            area.low_hard_range = values[2]
+            area.high_hard_range = values[3]
 
     def read_fuss_mobile(self):
-        mob = SwrMobile()
-        while True:
-            word = self.read_word()
-            if word == "#ENDMOBILE":
-                break
-            if word == "#MUDPROG":
-                mob.programs.append(self.read_fuss_program())
-            elif word == "Vnum":
-                mob.vnum = self.read_number()
-            elif word == "Keywords":
-                mob.name = self.read_string()
-            elif word == "Short":
-                mob.short_desc = self.read_string()
-            elif word == "Long":
-                mob.long_desc = self.read_string()
-            elif word == "Desc":
-                mob.description = self.read_string()
-            elif word == "Race":
-                mob.race = self.read_string()
-            elif word == "Position":
-                mob.position = self.read_string()
-            elif word == "DefPos":
-                mob.default_position = self.read_string()
-            elif word == "Gender":
-                mob.gender = self.read_string()
-            elif word == "Stats1":
-                mob.stats1 = self.read_fuss_numbers()
-            elif word == "Stats2":
-                mob.stats2 = self.read_fuss_numbers()
-            elif word == "Stats3":
-                mob.stats3 = self.read_fuss_numbers()
-            elif word == "Stats4":
-                mob.stats4 = self.read_fuss_numbers()
-            elif word == "Attribs":
-                mob.attribs = self.read_fuss_numbers()
-            elif word == "Saves":
-                mob.saves = self.read_fuss_numbers()
-            elif word == "ShopData":
-                mob.shop_data = self.read_fuss_numbers()
-            elif word == "RepairData":
-                mob.repair_data = self.read_fuss_numbers()
-            elif word in (
-                "Specfun",
-                "Specfun2",
-                "Actflags",
-                "Affected",
-                "Speaks",
-                "Speaking",
-                "Bodyparts",
-                "Resist",
-                "Immune",
-                "Suscept",
-                "Attacks",
-                "Defenses",
-                "VIPFlags",
-            ):
-                attribute = {
-                    "Specfun": "specfun",
-                    "Specfun2": "specfun2",
-                    "Actflags": "actflags",
-                    "Affected": "affected",
-                    "Speaks": "speaks",
-                    "Speaking": "speaking",
-                    "Bodyparts": "bodyparts",
-                    "Resist": "resist",
-                    "Immune": "immune",
-                    "Suscept": "suscept",
-                    "Attacks": "attacks",
-                    "Defenses": "defenses",
-                    "VIPFlags": "vip_flags",
-                }[word]
-                setattr(mob, attribute, self.read_string())
-            else:
-                mob.unknown.append(self.read_fuss_unknown(word))
+        mob = self.read_fuss_keys(SwrMobile(), "FUSS_MOBILE_KEYS", "#ENDMOBILE")
         stats1 = list(mob.stats1)
         stats2 = list(mob.stats2)
         stats3 = list(mob.stats3)
@@ -271,39 +377,7 @@ class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
         return mob
 
     def read_fuss_object(self):
-        item = SwrObject()
-        while True:
-            word = self.read_word()
-            if word == "#ENDOBJECT":
-                break
-            if word == "#EXDESC":
-                item.extra_descriptions.append(self.read_fuss_extra_description())
-            elif word == "#MUDPROG":
-                item.programs.append(self.read_fuss_program())
-            elif word == "Vnum":
-                item.vnum = self.read_number()
-            elif word == "Keywords":
-                item.name = self.read_string()
-            elif word == "Short":
-                item.short_desc = self.read_string()
-            elif word == "Long":
-                item.description = self.read_string()
-            elif word == "Type":
-                item.type_name = self.read_string()
-            elif word == "Action":
-                item.action_description = self.read_string()
-            elif word == "Flags":
-                item.flags = self.read_string()
-            elif word == "WFlags":
-                item.wflags = self.read_string()
-            elif word == "Values":
-                item.value = self.read_fuss_numbers()
-            elif word == "Stats":
-                item.stats = self.read_fuss_numbers()
-            elif word == "Spells":
-                item.spells = self.read_to_eol().strip()
-            else:
-                item.unknown.append(self.read_fuss_unknown(word))
+        item = self.read_fuss_keys(SwrObject(), "FUSS_OBJECT_KEYS", "#ENDOBJECT")
         if len(item.stats) > 0:
             item.weight = item.stats[0]
         if len(item.stats) > 1:
@@ -317,34 +391,7 @@ class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
         return item
 
     def read_fuss_room(self):
-        room = SwrRoom()
-        while True:
-            word = self.read_word()
-            if word == "#ENDROOM":
-                break
-            if word == "#EXIT":
-                room.exits.append(self.read_fuss_exit())
-            elif word == "#EXDESC":
-                room.extra_descriptions.append(self.read_fuss_extra_description())
-            elif word == "#MUDPROG":
-                room.programs.append(self.read_fuss_program())
-            elif word == "Vnum":
-                room.vnum = self.read_number()
-            elif word == "Name":
-                room.name = self.read_string()
-            elif word == "Desc":
-                room.description = self.read_string()
-            elif word == "Sector":
-                room.sector = self.read_string()
-            elif word == "Stats":
-                room.stats = self.read_fuss_numbers()
-            elif word == "Reset":
-                letter = self.read_letter()
-                room.resets.append(SwrReset.read(reader=self, letter=letter))
-            elif word == "Flags":
-                room.flags = self.read_string()
-            else:
-                room.unknown.append(self.read_fuss_unknown(word))
+        room = self.read_fuss_keys(SwrRoom(), "FUSS_ROOM_KEYS", "#ENDROOM")
         if len(room.stats) > 0:
             room.tele_delay = room.stats[0]
         if len(room.stats) > 1:
@@ -353,41 +400,15 @@ class SwrAreaFile(area_reader.dialects.smaug.SmaugAreaFile):
             room.tunnel = room.stats[2]
         return room
 
+    def read_fuss_reset(self, room):
+        letter = self.read_letter()
+        room.resets.append(SwrReset.read(reader=self, letter=letter))
+
     def read_fuss_exit(self):
-        exit = SwrExit()
-        while True:
-            word = self.read_word()
-            if word == "#ENDEXIT":
-                return exit
-            if word == "Desc":
-                exit.description = self.read_string()
-            elif word == "Direction":
-                exit.door = self.read_string()
-            elif word == "Distance":
-                exit.distance = self.read_number()
-            elif word == "Key":
-                exit.key = self.read_number()
-            elif word == "Keywords":
-                exit.keyword = self.read_string()
-            elif word == "ToRoom":
-                exit.destination = self.read_number()
-            elif word == "Flags":
-                exit.flags = self.read_string()
-            else:
-                exit.unknown.append(self.read_fuss_unknown(word))
+        return self.read_fuss_keys(SwrExit(), "FUSS_EXIT_KEYS", "#ENDEXIT")
 
     def read_fuss_extra_description(self):
-        extra = SwrExtraDescription()
-        while True:
-            word = self.read_word()
-            if word == "#ENDEXDESC":
-                return extra
-            if word == "ExDescKey":
-                extra.keyword = self.read_string()
-            elif word == "ExDesc":
-                extra.description = self.read_string()
-            else:
-                extra.unknown.append(self.read_fuss_unknown(word))
+        return self.read_fuss_keys(SwrExtraDescription(), "FUSS_EXTRA_DESCRIPTION_KEYS", "#ENDEXDESC")
 
     def skip_fuss_program(self):
         self.read_fuss_program()
@@ -416,7 +437,7 @@ def native_swr_dice(value, owner):
     return f"{value.number} {value.sides} {value.bonus}"
 
 
-@attributes
+@attributes(slots=True)
 class SwrUnknown:
     key = area_reader.schema.field(
         default="", type=area_reader.values.Word, native=NativeField(1, native_word, suffix=" ")
@@ -425,7 +446,7 @@ class SwrUnknown:
     tilde = attr(default=False, type=bool)
 
 
-@attributes
+@attributes(slots=True)
 class SwrProgram:
     NATIVE_PREFIX = "#MUDPROG\n"
     NATIVE_SUFFIX = "#ENDPROG\n\n"
@@ -446,7 +467,7 @@ class SwrProgram:
     )
 
 
-@attributes
+@attributes(slots=True)
 class SwrExtraDescription:
     NATIVE_PREFIX = "#EXDESC\n"
     NATIVE_SUFFIX = "#ENDEXDESC\n\n"
@@ -464,7 +485,7 @@ class SwrExtraDescription:
     )
 
 
-@attributes
+@attributes(slots=True)
 class SwrExit:
     NATIVE_PREFIX = "#EXIT\n"
     NATIVE_SUFFIX = "#ENDEXIT\n\n"
@@ -503,7 +524,7 @@ class SwrExit:
     )
 
 
-@attributes
+@attributes(slots=True)
 class SwrReset:
     NATIVE_PREFIX = "Reset "
 
@@ -531,7 +552,7 @@ class SwrReset:
         return cls(command=letter, if_flag=if_flag, arg1=arg1, arg2=arg2, arg3=arg3, comment=reader.read_to_eol())
 
 
-@attributes
+@attributes(slots=True)
 class SwrMobile(area_reader.dialects.rom.RomCharacter):
     NATIVE_PREFIX = "#MOBILE\n"
     NATIVE_SUFFIX = "#ENDMOBILE\n\n"
@@ -708,7 +729,7 @@ class SwrMobile(area_reader.dialects.rom.RomCharacter):
     sex = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class SwrObject(area_reader.model.Item):
     NATIVE_PREFIX = "#OBJECT\n"
     NATIVE_SUFFIX = "#ENDOBJECT\n\n"
@@ -778,7 +799,7 @@ class SwrObject(area_reader.model.Item):
     )
 
 
-@attributes
+@attributes(slots=True)
 class SwrRoom(area_reader.model.MudBase):
     NATIVE_PREFIX = "#ROOM\n"
     NATIVE_SUFFIX = "#ENDROOM\n\n"
@@ -843,7 +864,7 @@ class SwrRoom(area_reader.model.MudBase):
     )
 
 
-@attributes
+@attributes(slots=True)
 class SwrArea(area_reader.dialects.smaug.SmaugArea):
     NATIVE_END = "#ENDAREA\n"
     NATIVE_SECTIONS = (
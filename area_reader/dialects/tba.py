@@ -131,7 +131,7 @@ def native_tba_exit_lock(value, owner):
     return str(code)
 
 
-@attributes
+@attributes(slots=True)
 class TbaExit:
     door = area_reader.schema.field(default=0, native=NativeField(1, native_number, prefix="D"))
     description = area_reader.schema.field(default="", native=NativeField(2, native_tilde_string))
@@ -147,7 +147,7 @@ class TbaExit:
     destination = area_reader.schema.field(default=-1, native=NativeField(6, native_number))
 
 
-@attributes
+@attributes(slots=True)
 class TbaRoom(area_reader.model.MudBase):
     NATIVE_SUFFIX = native_tba_room_suffix
 
@@ -174,7 +174,7 @@ class TbaRoom(area_reader.model.MudBase):
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class TbaMob(area_reader.model.MudBase):
     NATIVE_SUFFIX = native_tba_mobile_suffix
 
@@ -225,12 +225,12 @@ class TbaMob(area_reader.model.MudBase):
         return combine_flag_banks(self.affected_flags)
 
 
-@attributes
+@attributes(slots=True)
 class TbaAffectData(area_reader.dialects.circle.CircleAffectData):
     pass
 
 
-@attributes
+@attributes(slots=True)
 class TbaItem(area_reader.model.MudBase):
     vnum = area_reader.schema.field(
         default=0, type=area_reader.values.VNum, read=False, native=NativeField(1, native_number, prefix="#")
@@ -281,7 +281,7 @@ class TbaItem(area_reader.model.MudBase):
         return combine_flag_banks(self.affect_flag_banks)
 
 
-@attributes
+@attributes(slots=True)
 class TbaReset:
     command = area_reader.schema.field(default="", type=str, native=NativeField(1, native_tba_reset))
     if_flag = attr(default=0, type=int)
@@ -292,7 +292,7 @@ class TbaReset:
     sarg2 = attr(default=None, type=str | None)
 
 
-@attributes
+@attributes(slots=True)
 class TbaZone:
     NATIVE_SUFFIX = "S\n"
 
@@ -312,7 +312,7 @@ class TbaZone:
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class TbaTrigger:
     vnum = area_reader.schema.field(default=0, type=int, native=NativeField(1, native_number, prefix="#"))
     name = area_reader.schema.field(default="", type=str, native=NativeField(2, native_tilde_string))
@@ -324,7 +324,7 @@ class TbaTrigger:
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class TbaQuest:
     NATIVE_SUFFIX = "S\n"
 
@@ -352,7 +352,7 @@ class TbaQuest:
     source_file = attr(default="", type=str)
 
 
-@attributes
+@attributes(slots=True)
 class TbaArea:
     NATIVE_COLLECTIONS = (
         ("zon", "zones", "$\n"),
@@ -381,19 +381,33 @@ class TbaAreaFile(area_reader.dialects.circle.CircleAreaFile):
         "unused-zone-reset-arguments",
         "empty-shop-headers",
     )
+    INDEXED_FILE_LOADERS = (
+        ("zon", "load_zone_file"),
+        ("trg", "load_trigger_file"),
+        ("wld", "load_room_file"),
+        ("mob", "load_mobile_file"),
+        ("obj", "load_object_file"),
+        ("shp", "load_shop_file"),
+        ("qst", "load_quest_file"),
+    )
 
     def __init__(self, root):
         super().__init__(root)
         self.area = TbaArea()
 
-    def load_sections(self):
-        self.load_zones()
-        self.load_triggers()
-        self.load_rooms()
-        self.load_mobiles()
-        self.load_objects()
-        self.load_shops()
-        self.load_quests()
+    def load_sections(self, workers=None):
+        if workers is not None:
+            self.load_indexed_files(workers)
+        else:
+            self.load_zones()
+            self.load_triggers()
+            self.load_rooms()
+            self.load_mobiles()
+            self.load_objects()
+            self.load_shops()
+            self.load_quests()
+        if self.fingerprint_files:
+            self.remember_native_files()
 
     def read_string(self):
         while self.current_char in ("\r", "\n"):
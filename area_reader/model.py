@@ -53,28 +53,30 @@ def native_reset_command(value, owner):
     return "*" if value is None else str(value)
 
 
+EXIT_LOCKS = {
+    int(EXIT_FLAGS.NONE): "0",
+    int(EXIT_FLAGS.ISDOOR): "1",
+    int(EXIT_FLAGS.ISDOOR | EXIT_FLAGS.PICKPROOF): "2",
+    int(EXIT_FLAGS.ISDOOR | EXIT_FLAGS.NOPASS): "3",
+    int(EXIT_FLAGS.ISDOOR | EXIT_FLAGS.NOPASS | EXIT_FLAGS.PICKPROOF): "4",
+}
+
+
 def native_exit_lock(value, owner):
     del owner
-    locks = {
-        int(EXIT_FLAGS.NONE): 0,
-        int(EXIT_FLAGS.ISDOOR): 1,
-        int(EXIT_FLAGS.ISDOOR | EXIT_FLAGS.PICKPROOF): 2,
-        int(EXIT_FLAGS.ISDOOR | EXIT_FLAGS.NOPASS): 3,
-        int(EXIT_FLAGS.ISDOOR | EXIT_FLAGS.NOPASS | EXIT_FLAGS.PICKPROOF): 4,
-    }
     try:
-        return str(locks[int(value)])
+        return EXIT_LOCKS[int(value)]
     except KeyError:
         raise NativeWriteError(f"ROM exit flags {value!r} have no native lock code")
 
 
-@attributes
+@attributes(slots=True)
 class ExtraDescription:
     keyword = field(default="", type=str, native=NativeField(1, native_tilde_string, prefix="E\n"))
     description = field(default="", type=str, native=NativeField(2, native_tilde_string))
 
 
-@attributes
+@attributes(slots=True)
 class MudBase:
     vnum = field(default=0, type=VNum, read=False)
     name = field(default="", type=str)
@@ -82,7 +84,7 @@ class MudBase:
     extra_descriptions = attr(default=Factory(list), type=list[ExtraDescription])
 
 
-@attributes
+@attributes(slots=True)
 class Item(MudBase):
     short_desc = field(default="", type=str)
     item_type = field(default=-1, type=int)
@@ -95,7 +97,7 @@ class Item(MudBase):
     value = attr(default=Factory(list), type=list)
 
 
-@attributes
+@attributes(slots=True)
 class Dice:
     number = field(default=0, type=int, native=NativeField(1, native_number, suffix=""))
     sides = field(default=0, type=int, native=NativeField(2, native_number, prefix="d", suffix=""))
@@ -120,14 +122,14 @@ class Dice:
         return score
 
 
-@attributes
+@attributes(slots=True)
 class Help:
     level = field(default=0, type=int, native=NativeField(1, native_number, suffix=" "))
     keyword = field(default="", type=Word, native=NativeField(2, native_tilde_string))
     text = field(default="", type=str, native=NativeField(3, native_tilde_string))
 
 
-@attributes
+@attributes(slots=True)
 class Exit:
     keyword = field(default="", type=Word, native=NativeField(3, native_tilde_string))
     description = field(default="", type=str, native=NativeField(2, native_tilde_string))
@@ -170,7 +172,7 @@ class Exit:
         )
 
 
-@attributes
+@attributes(slots=True)
 class Special:
     command = field(default=None, native=NativeField(1, native_reset_command, suffix=native_reset_command_suffix))
     arg1 = field(
@@ -192,7 +194,7 @@ class Special:
         return cls(command=command, arg1=arg1, arg2=arg2, comment=comment)
 
 
-@attributes
+@attributes(slots=True)
 class Reset:
     command = field(default=None, native=NativeField(1, native_reset_command, suffix=native_reset_command_suffix))
     if_flag = field(
@@ -245,7 +247,7 @@ class Reset:
         )
 
 
-@attributes
+@attributes(slots=True)
 class Room(MudBase):
     NATIVE_SUFFIX = "S\n"
 
@@ -325,7 +327,7 @@ class Room(MudBase):
                 reader.parse_fail(f"Don't know how to process room attribute: {letter}")
 
 
-@attributes
+@attributes(slots=True)
 class RomShop:
     keeper = field(default=0, type=int, native=NativeField(1, native_number, suffix=" "))
     buy_type = field(default=Factory(list), type=list, native=NativeField(2, native_trade_types, suffix=" "))
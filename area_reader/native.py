@@ -1,4 +1,8 @@
+import contextlib
 import enum
+import functools
+import os
+import re
 from collections.abc import Callable
 
 from attr import attr, attributes, fields
@@ -8,6 +12,7 @@ class NativeWriteError(ValueError):
     pass
 
 
+WHITESPACE = re.compile(r"\s")
 Encoder = Callable[[object, object], str]
 Condition = Callable[[object], bool]
 Decoration = Callable[[object], str]
@@ -48,6 +53,8 @@ def _scalar(value):
 
 def number(value, owner):
     del owner
+    if type(value) is int:
+        return str(value)
     value = _scalar(value)
     if not isinstance(value, int):
         raise NativeWriteError(f"Expected an integer, got {value!r}")
@@ -69,7 +76,7 @@ def flag(value, owner):
 def word(value, owner):
     del owner
     text = str(_scalar(value))
-    if text and not any(char.isspace() for char in text):
+    if text and not WHITESPACE.search(text):
         return text
     if "'" not in text:
         return f"'{text}'"
@@ -103,51 +110,144 @@ def records(value, owner):
     return "".join(render_record(item) for item in value)
 
 
-def render_record(instance, section=None):
+@attributes(frozen=True, slots=True)
+class RenderPlan:
+    """The native fields of one record class and section, in order, with a compiled renderer."""
+
+    record_type = attr(type=type)
+    section = attr(type=str | None)
+    steps = attr(type=tuple)
+    prefix = attr(type=object)
+    suffix = attr(type=object)
+    conditional = attr(type=bool)
+    render = attr(type=Callable[[object], str])
+
+    def render_checked(self, instance):
+        """Render step by step, naming the field whose encoder fails."""
+        chunks = [_decoration(self.prefix, instance)]
+        for name, native in self.steps:
+            if native.when is not None and not native.when(instance):
+                continue
+            chunks.append(_decoration(native.prefix, instance))
+            try:
+                chunks.append(native.encode(getattr(instance, name), instance))
+            except NativeWriteError as error:
+                raise NativeWriteError(f"{self.record_type.__name__}.{name}: {error}") from error
+            chunks.append(_decoration(native.suffix, instance))
+        chunks.append(_decoration(self.suffix, instance))
+        return "".join(chunks)
+
+
+def _plan_term(namespace, label, value):
+    if callable(value):
+        namespace[label] = value
+        return f"{label}(instance)"
+    if value == "":
+        return None
+    namespace[label] = value
+    return label
+
+
+@functools.cache
+def render_plan(record_type, section=None):
+    """Compile the render plan of a record class for one native section."""
     annotated = []
-    for attribute in fields(instance.__class__):
+    for attribute in fields(record_type):
         native = attribute.metadata.get("native")
         if native is None or native.section != section:
             continue
-        annotated.append((native.order, attribute, native))
+        annotated.append((native.order, attribute.name, native))
     annotated.sort(key=lambda item: item[0])
+    steps = tuple((name, native) for _, name, native in annotated)
+    prefix = getattr(record_type, "NATIVE_PREFIX", "") if section is None else ""
+    suffix = getattr(record_type, "NATIVE_SUFFIX", "") if section is None else ""
+
+    namespace = {}
+    terms = [_plan_term(namespace, "record_prefix", prefix)]
+    for position, (name, native) in enumerate(steps):
+        namespace[f"encode_{position}"] = native.encode
+        parts = [
+            _plan_term(namespace, f"prefix_{position}", native.prefix),
+            f"encode_{position}(instance.{name}, instance)",
+            _plan_term(namespace, f"suffix_{position}", native.suffix),
+        ]
+        term = " + ".join(part for part in parts if part is not None)
+        if native.when is not None:
+            namespace[f"when_{position}"] = native.when
+            term = f"({term} if when_{position}(instance) else '')"
+        terms.append(term)
+    terms.append(_plan_term(namespace, "record_suffix", suffix))
+    body = "".join(f"        {term},\n" for term in terms if term is not None)
+    source = f"def render(instance):\n    return ''.join((\n{body}    ))\n"
+    exec(source, namespace)  # noqa: S102 - the source holds only the field names of the record's attrs class
+    return RenderPlan(
+        record_type=record_type,
+        section=section,
+        steps=steps,
+        prefix=prefix,
+        suffix=suffix,
+        conditional=any(native.when is not None for _, native in steps),
+        render=namespace["render"],
+    )
 
-    chunks = []
-    if section is None:
-        chunks.append(_decoration(getattr(instance.__class__, "NATIVE_PREFIX", ""), instance))
-    for _, attribute, native in annotated:
-        if native.when is not None and not native.when(instance):
-            continue
-        value = getattr(instance, attribute.name)
-        chunks.append(_decoration(native.prefix, instance))
-        try:
-            chunks.append(native.encode(value, instance))
-        except NativeWriteError as error:
-            raise NativeWriteError(f"{instance.__class__.__name__}.{attribute.name}: {error}") from error
-        chunks.append(_decoration(native.suffix, instance))
-    if section is None:
-        chunks.append(_decoration(getattr(instance.__class__, "NATIVE_SUFFIX", ""), instance))
-    return "".join(chunks)
 
+def render_record(instance, section=None):
+    plan = render_plan(instance.__class__, section)
+    try:
+        return plan.render(instance)
+    except NativeWriteError:
+        return plan.render_checked(instance)
 
-def render_document(area, sections, native_sections=(), document_end=None):
-    chunks = []
+
+def iter_document(area, sections, native_sections=(), document_end=None):
+    """Yield a native document one record at a time."""
     for section in sections:
         if section.when is not None and not section.when(area):
             continue
         if section.emit_header:
-            chunks.append(f"#{section.name}\n")
+            yield f"#{section.name}\n"
         if section.owner_section is not None:
-            chunks.append(render_record(area, section=section.owner_section))
+            yield render_record(area, section=section.owner_section)
         else:
             values = getattr(area, section.collection)
             if section.mapping:
                 values = values.values()
-            chunks.extend(render_record(value) for value in values)
-        chunks.append(section.end)
+            yield from map(render_record, values)
+        yield section.end
     for name, body in native_sections:
-        chunks.append(f"#{name.upper()}{body}")
+        yield f"#{name.upper()}{body}"
     if document_end is None:
         document_end = getattr(area.__class__, "NATIVE_END", "#$\n")
-    chunks.append(document_end)
-    return "".join(chunks)
+    yield document_end
+
+
+def render_document(area, sections, native_sections=(), document_end=None):
+    return "".join(iter_document(area, sections, native_sections, document_end))
+
+
+@contextlib.contextmanager
+def staged_writes(encoding="latin-1"):
+    """Yield an opener for native files that replace their targets only once the whole block succeeds.
+
+    Each file is written to a temporary sibling. If the block raises, the
+    temporaries are removed and no target is touched.
+    """
+    staged = []
+
+    @contextlib.contextmanager
+    def open_native_file(path):
+        path = os.fspath(path)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, mode="wt", encoding=encoding, newline="\n") as native_file:
+            staged.append((temporary_path, path))
+            yield native_file
+
+    try:
+        yield open_native_file
+    except BaseException:
+        for temporary_path, _ in staged:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporary_path)
+        raise
+    for temporary_path, path in staged:
+        os.replace(temporary_path, path)
@@ -1,12 +1,17 @@
 """Shared parsing mechanics for text area formats."""
 
+import bisect
+import contextlib
 import enum
+import functools
 import json
 import logging
 import os
+import re
+import string
 from operator import setitem
 
-from attr import fields
+from attr import attr, attributes, fields
 
 import area_reader.model
 import area_reader.serialization
@@ -15,13 +20,67 @@ from area_reader.constants import flag_convert
 
 logger = logging.getLogger("area_reader")
 
+# Anchored token patterns for AreaFile. Each is applied with
+# ``pattern.match(data, index)`` so a token costs one C-level scan instead of
+# a Python method call per character. ``\s`` matches exactly the characters
+# ``str.isspace`` accepts, which keeps positions identical to the fread_*
+# routines these readers mirror.
+WHITESPACE = re.compile(r"\s*")
+NUMBER = re.compile(r"\s*([+-]?)([0-9]*)")
+FLAG_TERM = re.compile(r"\s*\+?(-?)([A-Za-z]*)([0-9]*)([|&]?)")
+WORD = re.compile(r"\s*(?:(['\"])|([^\s\0]*))")
+STRING = re.compile(r"\s*([^~]*)(~?)")
+NEWLINE = re.compile(r"\n")
+SECTION_HEADER = re.compile(r"(?m)^[ \t]*#([A-Za-z]\w*|\$)")
+FLAG_BITS = {letter: flag_convert(letter) for letter in string.ascii_letters}
+
+
+@functools.cache
+def field_plan(object_type):
+    """Return the (name, reader type, only_if, on_read) read steps for object_type."""
+    plan = []
+    for field in fields(object_type):
+        if field.metadata.get("read") == False:
+            continue
+        field_type = field.metadata.get("original_type", field.type)
+        if issubclass(field_type, enum.IntFlag):
+            field_type = enum.IntFlag
+        plan.append((field.name, field_type, field.metadata.get("only_if"), field.metadata.get("on_read")))
+    return tuple(plan)
+
 
 class ParseError(Exception):
     pass
 
 
+@attributes(frozen=True, slots=True)
+class SectionSpan:
+    name = attr(type=str)
+    start = attr(type=int)
+    end = attr(type=int)
+
+    @property
+    def body(self):
+        return self.start + len(self.name) + 1
+
+
+class LineIndex:
+    """Newline offsets of one buffer, for bisecting a cursor into line and column."""
+
+    def __init__(self, data):
+        self.data = data
+        self.newlines = [match.start() for match in NEWLINE.finditer(data)]
+
+    def location(self, index):
+        index = min(index, len(self.data))
+        line = bisect.bisect_left(self.newlines, index)
+        col = index - self.newlines[line - 1] - 1 if line else -1
+        return line + 1, col
+
+
 class AreaFile:
     MAX_TRADES = 5
+    line_index = None
 
     def __init__(self, filename):
         super().__init__()
@@ -32,6 +91,7 @@ class AreaFile:
         self.area = self.create_area()
         self.skipped_sections = []
         self.current_section_name = "N/A"
+        self.reader_plans = {}
         self.readers = {
             area_reader.values.Word: self.read_word,
             area_reader.values.Letter: self.read_letter,
@@ -45,61 +105,48 @@ class AreaFile:
     def create_area(self):
         return None
 
+    def source_paths(self):
+        return [self.filename]
+
     def read_letter(self):
         self.skip_whitespace()
         result = self.current_char
-        self.advance()
+        self.index += 1
         return result
 
     def read_word(self):
-        self.skip_whitespace()
-        word = ""
-        end = ""
-        if self.current_char == "'" or self.current_char == '"':
-            end = self.current_char
-            self.advance()
-            word = self.read_until(end)
-            if self.current_char != end:
-                self.parse_fail("Unterminated quoted word")
-            self.advance()
-            return word
-        while self.current_char != "\0" and not self.current_char.isspace():
-            word += self.current_char
-            self.advance()
+        match = WORD.match(self.data, self.index)
+        quote = match.group(1)
+        if quote is None:
+            self.index = match.end()
+            return match.group(2)
+        self.index = match.end()
+        word = self.read_until(quote)
+        if self.index >= len(self.data):
+            self.parse_fail("Unterminated quoted word")
+        self.index += 1
         return word
 
     def read_string(self):
-        self.skip_whitespace()
-        res = self.read_until("~")
-        if self.current_char != "~":
+        match = STRING.match(self.data, self.index)
+        self.index = match.end()
+        if not match.group(2):
             self.parse_fail("Unterminated string")
-        self.advance()
-        return res
+        return match.group(1)
 
     def read_number(self):
-        self.skip_whitespace()
-        while self.current_char.isspace():
-            self.advance()
         number = 0
-        sign = False
-        while self.current_char.isspace():
-            self.advance()
-        if self.current_char == "+":
-            self.advance()
-        elif self.current_char == "-":
-            sign = True
-            self.advance()
-        if not self.current_char.isdigit():
-            self.parse_fail("Expected number")
-        while self.current_char.isdigit():
-            number = number * 10 + int(self.current_char)
-            self.advance()
-        if sign:
-            number *= -1
-        if self.current_char == "|":
-            self.advance()
-            number += self.read_number()
-        return number
+        data = self.data
+        while True:
+            match = NUMBER.match(data, self.index)
+            sign, digits = match.groups()
+            self.index = match.end()
+            if not digits:
+                self.parse_fail("Expected number")
+            number += -int(digits) if sign == "-" else int(digits)
+            if data[self.index : self.index + 1] != "|":
+                return number
+            self.index += 1
 
     def read_to_eol(self):
         return self.read_until("\n")
@@ -129,42 +176,34 @@ class AreaFile:
         self.index += 1
 
     def skip_whitespace(self):
-        while self.index < len(self.data) and self.current_char.isspace():
-            self.advance()
+        if self.index < len(self.data):
+            self.index = WHITESPACE.match(self.data, self.index).end()
 
     def read_flag(self):
+        data = self.data
         words = []
+        components = []
         while True:
-            components = []
-            while True:
-                negative = False
-                self.skip_whitespace()
-                if self.current_char == "+":
-                    self.advance()
-                if self.current_char == "-":
-                    negative = True
-                    self.advance()
-                number = 0
-                if not self.current_char.isdigit():
-                    while self.current_char.isalpha():
-                        number += flag_convert(self.current_char)
-                        self.advance()
-                while self.current_char.isdigit():
-                    number = number * 10 + int(self.current_char)
-                    self.advance()
-                components.append((negative, number))
-                if self.current_char != "|":
-                    break
-                self.advance()
+            match = FLAG_TERM.match(data, self.index)
+            self.index = match.end()
+            negative, letters, digits, delimiter = match.groups()
+            number = 0
+            for letter in letters:
+                number += FLAG_BITS[letter]
+            if digits:
+                number = number * 10 ** len(digits) + int(digits)
+            components.append((negative, number))
+            if delimiter == "|":
+                continue
             word = 0
             for negative, number in reversed(components):
                 word += number
                 if negative:
                     word *= -1
             words.append(word)
-            if self.current_char != "&":
+            if delimiter != "&":
                 break
-            self.advance()
+            components = []
         if len(words) == 1:
             return words[0]
         number = 0
@@ -191,33 +230,27 @@ class AreaFile:
         return self.read_object_by_fields(object_type, **kwargs)
 
     def read_object_by_fields(self, object_type, **kwargs):
-        f = fields(object_type)
         read = {}
-
-        def always_read(**_context):
-            return True
-
-        def unchanged(value):
-            return value
-
-        for field in f:
-            field_type = field.metadata.get("original_type", field.type)
-            if field.metadata.get("read") == False:
-                continue
-            if issubclass(field_type, enum.IntFlag):
-                field_type = enum.IntFlag
-            reader = self.readers.get(field_type)
-            if reader is None:
-                self.parse_fail(f"Could not find a reader for field type {field_type!r}")
-            only_if = field.metadata.get("only_if", always_read)
-            should_read = only_if(context=read)
-            if not should_read:
+        for name, reader, only_if, on_read in self.reader_plan(object_type):
+            if only_if is not None and not only_if(context=read):
                 continue
-            on_read = field.metadata.get("on_read", unchanged)
-            read[field.name] = on_read(reader())
+            read[name] = reader() if on_read is None else on_read(reader())
         read.update(kwargs)
         return object_type(**read)
 
+    def reader_plan(self, object_type):
+        """Return the field plan for object_type bound to this file's readers."""
+        plan = self.reader_plans.get(object_type)
+        if plan is None:
+            steps = []
+            for name, field_type, only_if, on_read in field_plan(object_type):
+                reader = self.readers.get(field_type)
+                if reader is None:
+                    self.parse_fail(f"Could not find a reader for field type {field_type!r}")
+                steps.append((name, reader, only_if, on_read))
+            plan = self.reader_plans[object_type] = tuple(steps)
+        return plan
+
     def read_vnum(self):
         self.skip_whitespace()
         self.read_and_verify_letter("#")
@@ -255,24 +288,88 @@ class AreaFile:
             "mobprogs": self.load_mobprogs,
         }
 
-    def load_sections(self):
-        readers = self.section_readers()
+    def record_readers(self):
+        return {
+            "mobiles": self.iter_mobiles,
+            "objects": self.iter_objects,
+            "rooms": self.iter_rooms,
+            "resets": self.iter_resets,
+            "shops": self.iter_shops,
+            "specials": self.iter_specials,
+            "helps": self.iter_helps,
+        }
+
+    def section_names(self, only=None):
+        """Yield each section name with the cursor positioned at its body."""
+        if only is not None:
+            only = {name.lower() for name in only}
+            for span in self.table_of_contents():
+                if span.name in only:
+                    self.index = span.body
+                    self.current_section_name = span.name
+                    yield span.name
+            return
         while True:
             section_name = self.read_section_name()
             self.current_section_name = section_name
             if section_name == "$":
                 return
+            yield section_name
+
+    def load_sections(self, only=None):
+        readers = self.section_readers()
+        for section_name in self.section_names(only):
             reader = readers.get(section_name)
             if reader is None:
                 self.skip_section(section_name)
             else:
                 logger.info("Processing section %s", section_name)
-                try:
-                    readers[section_name]()
-                except ParseError:
-                    raise
-                except Exception as error:  # noqa: BLE001 - add parser source context to arbitrary model errors
-                    self.parse_fail(f"Error reading section {section_name!r}: {error!r}")
+                with self.section_errors(section_name):
+                    reader()
+
+    def iter_records(self, only=None):
+        """Yield (section name, record) pairs without storing them on the area.
+
+        Header sections such as #AREA still fill in the area metadata; record
+        sections are handed to the caller one record at a time.
+        """
+        readers = self.section_readers()
+        record_readers = self.record_readers()
+        for section_name in self.section_names(only):
+            record_reader = record_readers.get(section_name)
+            reader = readers.get(section_name)
+            if record_reader is None and reader is None:
+                self.skip_section(section_name)
+                continue
+            logger.info("Processing section %s", section_name)
+            with self.section_errors(section_name):
+                if record_reader is None:
+                    reader()
+                    continue
+                for record in record_reader():
+                    yield section_name, record
+
+    @contextlib.contextmanager
+    def section_errors(self, section_name):
+        try:
+            yield
+        except ParseError:
+            raise
+        except Exception as error:  # noqa: BLE001 - add parser source context to arbitrary model errors
+            self.parse_fail(f"Error reading section {section_name!r}: {error!r}")
+
+    def table_of_contents(self):
+        """Return a SectionSpan for each #NAME header before the #$ terminator."""
+        spans = []
+        for match in SECTION_HEADER.finditer(self.data):
+            start = match.start(1) - 1
+            if spans:
+                spans[-1] = SectionSpan(spans[-1].name, spans[-1].start, start)
+            name = match.group(1).lower()
+            if name == "$":
+                break
+            spans.append(SectionSpan(name, start, len(self.data)))
+        return spans
 
     def load_mobprogs(self):
         while True:
@@ -290,23 +387,50 @@ class AreaFile:
         name = self.read_word()
         return name.lower()
 
+    def load_mobiles(self):
+        for mob in self.iter_mobiles():
+            setitem(self.area.mobs, mob.vnum, mob)
+
     def load_rooms(self):
-        for item in self.load_vnum_section(area_reader.model.Room):
-            setitem(self.area.rooms, item.vnum, item)
+        for room in self.iter_rooms():
+            setitem(self.area.rooms, room.vnum, room)
 
     def load_objects(self):
-        for item in self.load_vnum_section(area_reader.model.Item):
+        for item in self.iter_objects():
             setitem(self.area.objects, item.vnum, item)
 
     def load_resets(self):
-        for reset in self.read_flat_section(area_reader.model.Reset):
+        for reset in self.iter_resets():
             self.area.resets.append(reset)
 
     def load_specials(self):
-        for special in self.read_flat_section(area_reader.model.Special):
+        for special in self.iter_specials():
             self.area.specials.append(special)
 
     def load_shops(self):
+        for shop in self.iter_shops():
+            self.area.shops.append(shop)
+
+    def load_helps(self):
+        for help in self.iter_helps():
+            self.area.helps.append(help)
+
+    def iter_mobiles(self):
+        raise NotImplementedError
+
+    def iter_rooms(self):
+        return self.load_vnum_section(area_reader.model.Room)
+
+    def iter_objects(self):
+        return self.load_vnum_section(area_reader.model.Item)
+
+    def iter_resets(self):
+        return self.read_flat_section(area_reader.model.Reset)
+
+    def iter_specials(self):
+        return self.read_flat_section(area_reader.model.Special)
+
+    def iter_shops(self):
         while True:
             keeper = self.read_number()
             if keeper == 0:
@@ -319,10 +443,10 @@ class AreaFile:
             shop.profit_sell = self.read_number()
             shop.open_hour = self.read_number()
             shop.close_hour = self.read_number()
-            self.area.shops.append(shop)
             shop.comment = self.read_to_eol()
+            yield shop
 
-    def load_helps(self):
+    def iter_helps(self):
         while True:
             level = self.read_number()
             keyword = self.read_string()
@@ -331,15 +455,23 @@ class AreaFile:
             logger.debug("Reading help with keyword %s", keyword)
             help = area_reader.model.Help(level=level, keyword=keyword)
             help.text = self.read_string()
-            self.area.helps.append(help)
+            yield help
 
     def jump_to_section(self, section_name):
-        self.index = self.data.find("#" + section_name.upper()) + len(section_name) + 1
+        section_name = section_name.lower()
+        for span in self.table_of_contents():
+            if span.name == section_name:
+                self.index = span.body
+                return
+        self.parse_fail(f"No #{section_name.upper()} section")
+
+    def location(self):
+        if self.line_index is None or self.line_index.data is not self.data:
+            self.line_index = LineIndex(self.data)
+        return self.line_index.location(self.index)
 
     def parse_fail(self, message):
-        backwards = self.data[: self.index]
-        lineno = backwards.count("\n") + 1
-        col = backwards[::-1].find("\n")
+        lineno, col = self.location()
         message = (
             str(self.filename)
             + " line "
@@ -354,10 +486,10 @@ class AreaFile:
         raise ParseError(message)
 
     def surrounding_text(self, window=50):
-        return self.data[self.index - window : self.index + window]
+        return self.data[max(self.index - window, 0) : self.index + window]
 
     def as_dict(self):
-        return area_reader.serialization.EnumNameConverter().unstructure(self.area)
+        return area_reader.serialization.unstructure(self.area)
 
     def as_json(self, indent=None):
         return json.dumps(self.as_dict(), indent=indent)
@@ -1,6 +1,7 @@
 """Serialization of parsed area models."""
 
 import enum
+import functools
 
 from cattr import converters
 
@@ -14,23 +15,49 @@ class EnumNameConverter(converters.Converter):
         )
 
     def _unstructure_enum(self, obj):
-        # Composite Flag values have no .name before Python 3.11; decompose
-        # into single-bit member names in ascending bit order, matching the
-        # names 3.11+ produces, so JSON output is identical on every version.
-        name = obj.name
-        if name is None and isinstance(obj, enum.Flag):
-            bits = {
-                member.value: member.name
-                for member in type(obj).__members__.values()
-                if member.value and not member.value & (member.value - 1)
-            }
-            names = [bits[bit] for bit in sorted(bits) if obj.value & bit]
-            covered = 0
-            for bit in bits:
-                if obj.value & bit:
-                    covered |= bit
-            if names and covered == obj.value:
-                name = "|".join(names)
-        if name is None:
-            name = str(obj.value)
-        return obj.__class__.__name__ + "." + name
+        return enum_name(type(obj), obj.value)
+
+
+@functools.cache
+def flag_bits(flag_type):
+    """Return the (bit, name) pairs of a flag type's single-bit members in ascending bit order."""
+    bits = {
+        member.value: member.name
+        for member in flag_type.__members__.values()
+        if member.value and not member.value & (member.value - 1)
+    }
+    return tuple(sorted(bits.items()))
+
+
+@functools.lru_cache(maxsize=4096)
+def enum_name(enum_type, value):
+    # Composite Flag values have no .name before Python 3.11; decompose
+    # into single-bit member names in ascending bit order, matching the
+    # names 3.11+ produces, so JSON output is identical on every version.
+    name = enum_type(value).name
+    if name is None and issubclass(enum_type, enum.Flag):
+        names = []
+        covered = 0
+        for bit, bit_name in flag_bits(enum_type):
+            if value & bit:
+                names.append(bit_name)
+                covered |= bit
+        if names and covered == value:
+            name = "|".join(names)
+    if name is None:
+        name = str(value)
+    return enum_type.__name__ + "." + name
+
+
+# One shared converter keeps the unstructure hooks cattrs generates for each
+# model class, so they are built once per process instead of once per call.
+CONVERTER = EnumNameConverter()
+
+
+def unstructure(value):
+    return CONVERTER.unstructure(value)
+
+
+def unstructure_many(values):
+    """Unstructure a sequence of areas (or any models) with the shared converter."""
+    return [CONVERTER.unstructure(value) for value in values]
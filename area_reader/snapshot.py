@@ -0,0 +1,340 @@
+"""Versioned binary snapshots of parsed area models.
+
+A snapshot stores a model column by column. All values that share a
+position in the tree (every room's vnum, every exit's flags, ...) form one
+column. Integer, flag and vnum columns are packed arrays. String columns
+index one deduplicated string table. Loading rebuilds each column with
+C-level map calls, and records come from a compiled per-class builder.
+"""
+
+import array
+import enum
+import functools
+import importlib
+import os
+import struct
+import sys
+from collections import OrderedDict
+from itertools import accumulate, islice, repeat
+
+from attr import fields, has
+
+MAGIC = b"ARSNAP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<6sH")
+COUNT = struct.Struct("<Q")
+NONE, BOOL, INT, BIG_INT, FLOAT, STR, ENUM, ATTRS, LIST, TUPLE, DICT, MIXED = range(12)
+INT_RANGE = (-(1 << 63), 1 << 63)
+PACKED_TYPECODES = tuple(
+    (typecode, -(1 << (array.array(typecode).itemsize * 8 - 1)), 1 << (array.array(typecode).itemsize * 8 - 1))
+    for typecode in "bhiq"
+)
+TRUSTED_CLASSES = {"builtins:dict": dict, "collections:OrderedDict": OrderedDict}
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def is_enum(cls):
+    return issubclass(cls, enum.Enum)
+
+
+def is_dict(cls):
+    return cls is dict or cls is OrderedDict
+
+
+@functools.cache
+def record_builder(cls):
+    """Compile a function that creates a record from its field values without running __init__."""
+    names = [field.name for field in fields(cls)]
+    arguments = ", ".join(f"value_{position}" for position in range(len(names)))
+    if cls.__setattr__ is object.__setattr__:
+        stores = "".join(f"    record.{name} = value_{position}\n" for position, name in enumerate(names))
+    else:
+        stores = "".join(f"    setattr(record, {name!r}, value_{position})\n" for position, name in enumerate(names))
+    namespace = {"cls": cls, "new": object.__new__, "setattr": object.__setattr__}
+    source = f"def build({arguments}):\n    record = new(cls)\n{stores}    return record\n"
+    exec(source, namespace)  # noqa: S102 - the source holds only the field names of a resolved attrs class
+    return namespace["build"]
+
+
+def value_kind(value):
+    value_type = type(value)
+    if value is None:
+        return (NONE,)
+    if value_type is bool:
+        return (BOOL,)
+    if value_type is int:
+        return (INT,) if INT_RANGE[0] <= value < INT_RANGE[1] else (BIG_INT,)
+    if value_type is float:
+        return (FLOAT,)
+    if value_type is str:
+        return (STR,)
+    if isinstance(value, enum.Enum):
+        return (ENUM, value_type)
+    if has(value_type):
+        return (ATTRS, value_type)
+    if value_type is list:
+        return (LIST,)
+    if value_type is tuple:
+        return (TUPLE,)
+    if value_type is dict or value_type is OrderedDict:
+        return (DICT, value_type)
+    raise SnapshotError(f"Cannot snapshot {value_type.__name__} values")
+
+
+class SnapshotWriter:
+    def __init__(self):
+        self.strings = {}
+        self.body = bytearray()
+
+    def snapshot(self, value):
+        self.column([value])
+        body, self.body = self.body, bytearray(HEADER.pack(MAGIC, FORMAT_VERSION))
+        self.packed([len(string) for string in self.strings])
+        blob = "".join(self.strings).encode("utf-8", "surrogatepass")
+        self.count(len(blob))
+        self.body += blob
+        self.body += body
+        return bytes(self.body)
+
+    def count(self, value):
+        self.body += COUNT.pack(value)
+
+    def string(self, value):
+        return self.strings.setdefault(value, len(self.strings))
+
+    def class_ref(self, cls):
+        self.count(self.string(f"{cls.__module__}:{cls.__qualname__}"))
+
+    def packed(self, values):
+        low, high = (min(values), max(values)) if values else (0, 0)
+        typecode = next(code for code, minimum, maximum in PACKED_TYPECODES if minimum <= low and high < maximum)
+        packed = array.array(typecode, values)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        self.body.append(ord(typecode))
+        self.count(len(packed))
+        self.body += packed.tobytes()
+
+    def column(self, values):
+        kinds = list(map(value_kind, values))
+        distinct = list(dict.fromkeys(kinds))
+        if len(distinct) <= 1:
+            self.homogeneous(distinct[0] if distinct else (NONE,), values)
+            return
+        tags = {kind: tag for tag, kind in enumerate(distinct)}
+        self.body.append(MIXED)
+        self.count(len(distinct))
+        self.packed([tags[kind] for kind in kinds])
+        for kind in distinct:
+            self.homogeneous(kind, [value for value, value_kind in zip(values, kinds) if value_kind == kind])
+
+    def homogeneous(self, kind, values):
+        code = kind[0]
+        self.body.append(code)
+        if code == BOOL or code == INT:
+            self.packed([int(value) for value in values])
+        elif code == BIG_INT:
+            self.packed([self.string(str(value)) for value in values])
+        elif code == FLOAT:
+            floats = array.array("d", values)
+            if sys.byteorder == "big":
+                floats.byteswap()
+            self.body += floats.tobytes()
+        elif code == STR:
+            self.packed([self.string(value) for value in values])
+        elif code == ENUM:
+            self.class_ref(kind[1])
+            self.column([value.value for value in values])
+        elif code == ATTRS:
+            self.class_ref(kind[1])
+            names = [field.name for field in fields(kind[1])]
+            self.packed([self.string(name) for name in names])
+            for name in names:
+                self.column([getattr(value, name) for value in values])
+        elif code == LIST or code == TUPLE:
+            self.packed([len(value) for value in values])
+            self.column([item for value in values for item in value])
+        elif code == DICT:
+            self.class_ref(kind[1])
+            self.packed([len(value) for value in values])
+            self.column([key for value in values for key in value])
+            self.column([item for value in values for item in value.values()])
+
+
+class SnapshotReader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.position = 0
+        self.classes = {}
+        self.readers = {
+            NONE: self.read_none,
+            BOOL: self.read_bool,
+            INT: self.read_int,
+            BIG_INT: self.read_big_int,
+            FLOAT: self.read_float,
+            STR: self.read_str,
+            ENUM: self.read_enum,
+            ATTRS: self.read_attrs,
+            LIST: self.read_list,
+            TUPLE: self.read_tuple,
+            DICT: self.read_dict,
+            MIXED: self.read_mixed,
+        }
+
+    def snapshot(self):
+        if len(self.data) < HEADER.size:
+            raise SnapshotError("Truncated snapshot header")
+        magic, version = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise SnapshotError("Not an area snapshot")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot format version {version}")
+        self.position = HEADER.size
+        ends = list(accumulate(self.packed()))
+        text = self.take(self.count()).decode("utf-8", "surrogatepass")
+        self.strings = list(map(text.__getitem__, map(slice, [0] + ends[:-1], ends)))
+        (value,) = self.column(1)
+        if self.position != len(self.data):
+            raise SnapshotError("Trailing data after snapshot")
+        return value
+
+    def take(self, size):
+        end = self.position + size
+        if end > len(self.data):
+            raise SnapshotError("Truncated snapshot")
+        chunk = self.data[self.position : end]
+        self.position = end
+        return bytes(chunk)
+
+    def count(self):
+        (value,) = COUNT.unpack(self.take(COUNT.size))
+        return value
+
+    def code(self):
+        return self.take(1)[0]
+
+    def packed(self):
+        typecode = chr(self.code())
+        if typecode not in "bhiq":
+            raise SnapshotError(f"Unknown packed array type {typecode!r}")
+        values = array.array(typecode)
+        size = self.count()
+        values.frombytes(self.take(size * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+
+    def class_ref(self, accepts, kind):
+        """Resolve a class name to a top-level class of an area_reader module that accepts() approves."""
+        name = self.strings[self.count()]
+        if name in self.classes:
+            cls = self.classes[name]
+        else:
+            cls = TRUSTED_CLASSES.get(name)
+            if cls is None:
+                module_name, _, qualname = name.partition(":")
+                if module_name != "area_reader" and not module_name.startswith("area_reader."):
+                    raise SnapshotError(f"Snapshot refers to untrusted class {name}")
+                if not qualname.isidentifier():
+                    raise SnapshotError(f"Snapshot refers to a nested name {name}")
+                try:
+                    cls = getattr(importlib.import_module(module_name), qualname, None)
+                except ImportError:
+                    cls = None
+                if not isinstance(cls, type) or cls.__module__ != module_name or cls.__qualname__ != qualname:
+                    raise SnapshotError(f"Snapshot refers to {name}, which is not an area_reader class")
+            self.classes[name] = cls
+        if not accepts(cls):
+            raise SnapshotError(f"Snapshot uses {name} as a {kind} class")
+        return cls
+
+    def column(self, size):
+        code = self.code()
+        try:
+            reader = self.readers[code]
+        except KeyError:
+            raise SnapshotError(f"Unknown snapshot column kind {code}")
+        return reader(size)
+
+    def read_none(self, size):
+        return [None] * size
+
+    def read_bool(self, size):
+        return list(map(bool, self.packed()))
+
+    def read_int(self, size):
+        return self.packed()
+
+    def read_big_int(self, size):
+        return list(map(int, map(self.strings.__getitem__, self.packed())))
+
+    def read_float(self, size):
+        floats = array.array("d")
+        floats.frombytes(self.take(size * floats.itemsize))
+        if sys.byteorder == "big":
+            floats.byteswap()
+        return floats.tolist()
+
+    def read_str(self, size):
+        return list(map(self.strings.__getitem__, self.packed()))
+
+    def read_enum(self, size):
+        cls = self.class_ref(is_enum, "enum")
+        values = self.column(size)
+        members = {value: cls(value) for value in set(values)}
+        return list(map(members.__getitem__, values))
+
+    def read_attrs(self, size):
+        cls = self.class_ref(has, "attrs")
+        names = list(map(self.strings.__getitem__, self.packed()))
+        if names != [field.name for field in fields(cls)]:
+            raise SnapshotError(f"Snapshot fields for {cls.__qualname__} do not match the model")
+        if not names:
+            return [record_builder(cls)() for _ in range(size)]
+        return list(map(record_builder(cls), *[self.column(size) for _ in names]))
+
+    def read_list(self, size):
+        lengths = self.packed()
+        items = iter(self.column(sum(lengths)))
+        return list(map(list, map(islice, repeat(items), lengths)))
+
+    def read_tuple(self, size):
+        lengths = self.packed()
+        items = iter(self.column(sum(lengths)))
+        return list(map(tuple, map(islice, repeat(items), lengths)))
+
+    def read_dict(self, size):
+        cls = self.class_ref(is_dict, "dict")
+        lengths = self.packed()
+        total = sum(lengths)
+        keys = iter(self.column(total))
+        values = iter(self.column(total))
+        return list(map(cls, map(zip, map(islice, repeat(keys), lengths), map(islice, repeat(values), lengths))))
+
+    def read_mixed(self, size):
+        kinds = self.count()
+        tags = self.packed()
+        columns = [iter(self.column(tags.count(tag))) for tag in range(kinds)]
+        return list(map(next, map(columns.__getitem__, tags)))
+
+
+def dumps_snapshot(area):
+    """Return the binary snapshot of an area model (or any list or dict of them)."""
+    return SnapshotWriter().snapshot(area)
+
+
+def loads_snapshot(data):
+    return SnapshotReader(data).snapshot()
+
+
+def dump_snapshot(area, path):
+    with open(os.fspath(path), mode="wb") as snapshot_file:
+        snapshot_file.write(dumps_snapshot(area))
+
+
+def load_snapshot(path):
+    with open(os.fspath(path), mode="rb") as snapshot_file:
+        return loads_snapshot(snapshot_file.read())
@@ -1,4 +1,7 @@
 import os
+from pathlib import Path
+
+HALL_ROOM = "#100\nHall~\nA hall.\n~\n1 0 0\nS\n$\n"
 
 
 def pytest_generate_tests(metafunc):
@@ -12,3 +15,24 @@ def files_in_directory(directory):
     for f in os.listdir(directory):
         path = os.path.join(directory, f)
         yield path
+
+
+def write_circle_family(
+    tmp_path: Path,
+    family: str,
+    text: str,
+    *,
+    direct_world_root: bool = False,
+    empty_families: tuple[str, ...] = (),
+) -> Path:
+    root = tmp_path / "world"
+    world_root = root if direct_world_root else root / "lib" / "world"
+    family_root = world_root / family
+    family_root.mkdir(parents=True)
+    filename = f"1.{family}"
+    (family_root / filename).write_text(text, encoding="latin-1")
+    (family_root / "index").write_text(f"{filename}\n$\n", encoding="ascii")
+    for empty_family in empty_families:
+        (world_root / empty_family).mkdir()
+        (world_root / empty_family / "index").write_text("$\n", encoding="ascii")
+    return root
@@ -0,0 +1,82 @@
+import argparse
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import area_reader.dialects.coffeemud
+
+MOB = (
+    "<MOB><MCLAS>GenMob</MCLAS><MLEVL>{number}</MLEVL><MABLE>10</MABLE><MREJV>100</MREJV><MTEXT>"
+    "&lt;NAME&gt;mob {number}&lt;/NAME&gt;&lt;DISP&gt;Mob {number} is here.&lt;/DISP&gt;"
+    "&lt;MRACE&gt;Human&lt;/MRACE&gt;&lt;MONEY&gt;{number}&lt;/MONEY&gt;"
+    "&lt;BEHAVES&gt;&lt;BHAVE&gt;&lt;BCLASS&gt;Mobile&lt;/BCLASS&gt;&lt;BPARMS&gt;&lt;/BPARMS&gt;"
+    "&lt;/BHAVE&gt;&lt;/BEHAVES&gt;</MTEXT></MOB>"
+)
+ITEM = (
+    "<ITEM><ICLAS>GenItem</ICLAS><IUSES>-1</IUSES><ILEVL>{number}</ILEVL><IABLE>0</IABLE><IREJV>0</IREJV>"
+    "<ITEXT>&lt;NAME&gt;item {number}&lt;/NAME&gt;&lt;DISP&gt;Item {number} lies here.&lt;/DISP&gt;"
+    "&lt;VALUE&gt;{number}&lt;/VALUE&gt;</ITEXT></ITEM>"
+)
+
+
+def write_catalog(path, records):
+    mobs = "".join(MOB.format(number=number) for number in range(records))
+    items = "".join(ITEM.format(number=number) for number in range(records))
+    path.write_text(f"<MOBS>{mobs}</MOBS>\n<ITEMS>{items}</ITEMS>\n", encoding="latin-1")
+
+
+def count_parses(path):
+    reader_class = area_reader.dialects.coffeemud.CoffeeMudAreaFile
+    parse_document = reader_class.parse_document
+    fromstring = ET.fromstring
+    counts = {"documents": 0, "parses": 0}
+
+    def counted_parse_document(self, text):
+        counts["documents"] += 1
+        return parse_document(self, text)
+
+    def counted_fromstring(text, parser=None):
+        counts["parses"] += 1
+        return fromstring(text, parser)
+
+    reader_class.parse_document = counted_parse_document
+    ET.fromstring = counted_fromstring
+    try:
+        reader_class(path).load_sections()
+    finally:
+        reader_class.parse_document = parse_document
+        ET.fromstring = fromstring
+    return counts["documents"], counts["parses"]
+
+
+def load_time(path, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        area_reader.dialects.coffeemud.CoffeeMudAreaFile(path).load_sections()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Count XML parses while loading a multi-root CoffeeMud catalog.")
+    parser.add_argument("--records", type=int, nargs="*", default=[1000, 4000, 16000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for records in args.records:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "catalog.cmare"
+            write_catalog(path, records)
+            documents, parses = count_parses(path)
+            elapsed = load_time(path, args.repeat)
+        print(
+            f"{records:6} mobs + {records:6} items: {documents:6} payload documents, {parses:6} parses "
+            f"({parses / documents:.2f} per document), {elapsed * 1000:8.1f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import area_reader.dialects.swr
+
+MOBILE = """#MOBILE
+Vnum       {vnum}
+Keywords   mob {vnum}~
+Short      mob {vnum}~
+Long       Mob {vnum} waits here.
+~
+Desc       A generated SWR mobile.
+~
+Race       Human~
+Position   standing~
+DefPos     standing~
+Gender     neuter~
+Specfun    spec_guard~
+Actflags   npc sentinel~
+Affected   detect_invis~
+Stats1     0 {level} 0 0 100 0
+Stats2     5 10 25
+Stats3     1 4 2
+Stats4     0 0 0 3 3
+Attribs    10 10 10 10 10 10 10 0
+Saves      0 0 0 0 0
+Speaks     common~
+Speaking   common~
+Bodyparts  head arms legs~
+Resist     fire~
+Immune     poison~
+Suscept    cold~
+Attacks    kick~
+Defenses   parry~
+ShopData   5 0 0 0 0 120 90 0 23
+Mystery    kept as an unknown key
+#MUDPROG
+Progtype  greet_prog~
+Arglist   100~
+Comlist   say Hello.
+~
+#ENDPROG
+
+#ENDMOBILE
+
+"""
+OBJECT = """#OBJECT
+Vnum     {vnum}
+Keywords object {vnum}~
+Type     trash~
+Short    object {vnum}~
+Long     Object {vnum} lies here.~
+Action   ~
+Flags    glow~
+WFlags   take~
+Values   1 2 3 4 5 6
+Stats    7 8 9 {level} 0
+Spells   'armor' 'bless'
+#EXDESC
+ExDescKey    object~
+ExDesc       A generated object.
+~
+#ENDEXDESC
+
+#ENDOBJECT
+
+"""
+ROOM = """#ROOM
+Vnum     {vnum}
+Name     Room {vnum}~
+Sector   city~
+Flags    indoors~
+Stats    0 0 0
+Desc     A generated SWR room.
+~
+#EXIT
+Direction north~
+ToRoom    {next_vnum}
+Desc      A corridor.
+~
+Keywords  door~
+Flags     isdoor~
+Key       -1
+Distance  1
+#ENDEXIT
+
+Reset M 0 {vnum} 1 {vnum}
+Reset G 1 {vnum} 1
+#ENDROOM
+
+"""
+
+
+def write_area(path, records):
+    header = (
+        "#FUSSAREA\n#AREADATA\nVersion      1\nName         Generated~\nAuthor       Benchmark~\n"
+        "Ranges       1 50 0 60\nEconomy      0 10000\nResetFreq    15\n#ENDAREADATA\n\n"
+    )
+    chunks = [header]
+    for section in (MOBILE, OBJECT, ROOM):
+        for vnum in range(1, records + 1):
+            chunks.append(section.format(vnum=vnum, next_vnum=vnum % records + 1, level=vnum % 50))
+    chunks.append("#ENDAREA\n")
+    path.write_text("".join(chunks), encoding="latin-1")
+
+
+def load_time(path, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        area_reader.dialects.swr.SwrAreaFile(path).load_sections()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show how keyed SWR/FUSS section reading scales with area size.")
+    parser.add_argument("--records", type=int, nargs="*", default=[250, 500, 1000, 2000, 4000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for records in args.records:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "generated.are"
+            write_area(path, records)
+            elapsed = load_time(path, args.repeat)
+        total = records * 3
+        print(f"{total:6} records: {elapsed * 1000:8.1f} ms ({elapsed / total * 1e6:.1f} us per record)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
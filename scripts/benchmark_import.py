@@ -0,0 +1,39 @@
+import argparse
+import subprocess
+import sys
+import time
+
+DIALECTS = ("circle", "coffeemud", "godwars", "medievia", "merc", "rom", "smaug", "swr", "tba")
+CASES = (
+    ("python startup", "pass"),
+    ("import area_reader", "import area_reader"),
+    ("import area_reader.cli", "import area_reader.cli"),
+    ("import every dialect", "".join(f"import area_reader.dialects.{dialect}\n" for dialect in DIALECTS)),
+)
+
+
+def best_of(repeat, command):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time fresh interpreter startups that import area_reader.")
+    parser.add_argument("area", nargs="?", default="test/merc/limbo.are")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    commands = [(label, [sys.executable, "-c", code]) for label, code in CASES]
+    cli = "from area_reader.cli import main\nmain()\n"
+    commands.append((f"area-reader {args.area}", [sys.executable, "-c", cli, args.area]))
+    for label, command in commands:
+        print(f"{label:40} {best_of(args.repeat, command) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
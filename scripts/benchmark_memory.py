@@ -0,0 +1,33 @@
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+
+import area_reader.cli
+
+
+def retained_bytes(paths):
+    gc.collect()
+    tracemalloc.start()
+    results = area_reader.cli.load_many(paths, workers=1)
+    areas = [result.area_file.area for result in results if result.ok]
+    del results
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(areas), retained
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report the memory retained by the parsed models of area corpora.")
+    parser.add_argument("directories", type=Path, nargs="*", default=[Path("test/rom"), Path("test/merc")])
+    args = parser.parse_args()
+
+    for directory in args.directories:
+        count, retained = retained_bytes(sorted(directory.glob("*.are")))
+        print(f"{directory}: {count} areas retain {retained / 1024 / 1024:.2f} MiB of models")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
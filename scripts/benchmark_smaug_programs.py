@@ -0,0 +1,84 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import area_reader.dialects.smaug
+
+PROGRAM = "> {trigger} {chance}~\nif rand(50)\n  say Record {vnum} heard you.\nelse\n  emote ignores you.\nendif\n~\n"
+TRIGGERS = ("greet_prog", "speech_prog", "rand_prog", "act_prog")
+MOBILE = """#{vnum}
+mob {vnum}~
+mob {vnum}~
+Mob {vnum} is here.~
+A generated mobile.~
+1 0 0 S
+10 0 0 1d4+5 2d6+7
+100 0
+8 8 0
+{programs}|
+"""
+OBJECT = """#{vnum}
+object {vnum}~
+object {vnum}~
+Object {vnum} is here.~
+~
+13 0 1
+0 0 0 0 0 0
+1 10 0
+{programs}|
+"""
+ROOM = """#{vnum}
+Room {vnum}~
+A generated room.
+~
+0 0 1 0 0 0 0
+{programs}|
+S
+"""
+
+
+def write_area(path, records, programs):
+    chunks = ["#AREA\nGenerated~\n"]
+    for section, template in (("MOBILES", MOBILE), ("OBJECTS", OBJECT), ("ROOMS", ROOM)):
+        chunks.append(f"#{section}\n")
+        for vnum in range(1, records + 1):
+            blocks = "".join(
+                PROGRAM.format(trigger=TRIGGERS[number % len(TRIGGERS)], chance=number + 1, vnum=vnum)
+                for number in range(programs)
+            )
+            chunks.append(template.format(vnum=vnum, programs=blocks))
+        chunks.append("#0\n")
+    chunks.append("#$\n")
+    path.write_text("".join(chunks), encoding="latin-1")
+
+
+def load_time(path, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        area_file = area_reader.dialects.smaug.SmaugAreaFile(path)
+        area_file.load_sections()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time loading program-heavy SMAUG areas.")
+    parser.add_argument("--records", type=int, nargs="*", default=[250, 1000, 4000])
+    parser.add_argument("--programs", type=int, default=6, help="programs per mobile, object and room")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for records in args.records:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "programs.are"
+            write_area(path, records, args.programs)
+            elapsed = load_time(path, args.repeat)
+        programs = records * 3 * args.programs
+        print(f"{programs:7} programs: {elapsed * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+import argparse
+import time
+from pathlib import Path
+
+import area_reader.cli
+import area_reader.snapshot
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare parsing area text with loading a binary snapshot.")
+    parser.add_argument("directory", type=Path, nargs="?", default=Path("test/rom"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    paths = sorted(args.directory.glob("*.are"))
+    parse_time, results = best_of(args.repeat, lambda: area_reader.cli.load_many(paths, workers=1))
+    areas = [result.area_file.area for result in results if result.ok]
+    dump_time, data = best_of(args.repeat, lambda: area_reader.snapshot.dumps_snapshot(areas))
+    load_time, loaded = best_of(args.repeat, lambda: area_reader.snapshot.loads_snapshot(data))
+    if loaded != areas:
+        raise SystemExit("snapshot did not load equal models")
+
+    print(f"{len(areas)} areas, {len(data)} snapshot bytes")
+    print(f"parse text:    {parse_time * 1000:8.1f} ms")
+    print(f"dump snapshot: {dump_time * 1000:8.1f} ms")
+    print(f"load snapshot: {load_time * 1000:8.1f} ms ({parse_time / load_time:.1f}x faster than parsing)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import area_reader.dialects.circle
+
+ROOM = "#{vnum}\nRoom {vnum}~\nA plain room.\n~\n1 0 0\nS\n"
+
+
+def write_world(root, files, rooms_per_file):
+    world = root / "lib" / "world"
+    for family in ("zon", "mob", "obj", "shp"):
+        (world / family).mkdir(parents=True)
+        (world / family / "index").write_text("$\n", encoding="latin-1")
+    (world / "wld").mkdir()
+    names = [f"{number}.wld" for number in range(files)]
+    (world / "wld" / "index").write_text("".join(f"{name}\n" for name in names) + "$\n", encoding="latin-1")
+    for number, name in enumerate(names):
+        first = number * rooms_per_file
+        rooms = "".join(ROOM.format(vnum=vnum) for vnum in range(first, first + rooms_per_file))
+        (world / "wld" / name).write_text(rooms + "$\n", encoding="latin-1")
+
+
+def dumps_time(files, rooms_per_file, repeat):
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        write_world(root, files, rooms_per_file)
+        world = area_reader.dialects.circle.CircleAreaFile(root)
+        world.load_sections()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        world.dumps()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show how CircleMUD tree rendering scales with the number of files.")
+    parser.add_argument("--files", type=int, nargs="*", default=[50, 100, 200, 400, 800])
+    parser.add_argument("--rooms-per-file", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for files in args.files:
+        elapsed = dumps_time(files, args.rooms_per_file, args.repeat)
+        rooms = files * args.rooms_per_file
+        print(f"{files:5} files, {rooms:6} rooms: {elapsed * 1000:8.1f} ms ({elapsed / rooms * 1e6:.2f} us per room)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,4 @@
+import itertools
 import json
 import tempfile
 from pathlib import Path
@@ -138,6 +139,42 @@ def test_loading_merc_area(merc_path):
     assert_jsonifies(af)
 
 
+def test_loading_only_requested_rom_sections_matches_a_full_load(rom_path):
+    full = area_reader.dialects.rom.RomAreaFile(rom_path)
+    full.load_sections()
+    partial = area_reader.dialects.rom.RomAreaFile(rom_path)
+
+    partial.load_sections(only={"rooms", "RESETS"})
+
+    assert partial.area.rooms == full.area.rooms
+    assert partial.area.resets == full.area.resets
+    assert not partial.area.mobs
+    assert not partial.area.objects
+    assert not partial.area.helps
+
+
+def test_table_of_contents_lists_merc_sections_in_file_order(merc_path):
+    reader = area_reader.dialects.merc.MercAreaFile(merc_path)
+    spans = reader.table_of_contents()
+
+    assert spans[0].start == reader.data.index("#")
+    for span, following in itertools.pairwise(spans):
+        assert reader.data[span.start] == "#"
+        assert span.end == following.start
+    assert reader.data[spans[-1].end :].lstrip().startswith("#$")
+
+
+def test_jump_to_section_positions_the_cursor_after_the_header():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_area(directory, "#AREA x~\n#HELPS\n0 ROOMS~\n#ROOMS~\n0 $~\n#$\n")
+        reader = area_reader.dialects.rom.RomAreaFile(path)
+
+        reader.jump_to_section("helps")
+        assert reader.read_number() == 0
+        with pytest.raises(area_reader.parser.ParseError, match="No #SHOPS section"):
+            reader.jump_to_section("shops")
+
+
 def test_help_with_empty_keyword_loads():
     with tempfile.TemporaryDirectory() as directory:
         path = write_area(
@@ -498,6 +535,11 @@ $
         assert af.area.high_economy == 123
         assert af.area.low_economy == 456
 
+        ranges_only = area_reader.dialects.smaug.SmaugAreaFile(path)
+        ranges_only.load_sections(only={"ranges"})
+        assert ranges_only.area.high_hard_range == high_hard
+        assert ranges_only.area.author == ""
+
 
 @given(
     act=st.integers(min_value=0, max_value=2_000_000),
@@ -817,6 +859,12 @@ Reset M 0 {mob_vnum} 1 {room_vnum}
         af = area_reader.dialects.swr.SwrAreaFile(path)
         af.load_sections()
         assert_jsonifies(af)
+        rooms_only = area_reader.dialects.swr.SwrAreaFile(path)
+        rooms_only.load_sections(only={"rooms"})
+        assert rooms_only.area.rooms == af.area.rooms
+        assert not rooms_only.area.resets
+        assert not rooms_only.area.mobs
+        assert rooms_only.area.name == ""
 
         assert af.area.name == "SWR Test"
         assert af.area.version == version
@@ -1333,3 +1381,48 @@ def test_loading_actual_swr_are_file_when_available(swr_path):
     af = area_reader.dialects.swr.SwrAreaFile(swr_path)
     af.load_sections()
     assert af.area
+
+
+def test_read_object_by_fields_compiles_one_plan_per_class(tmp_path, monkeypatch):
+    path = write_area(tmp_path, "E\nsign~\nA sign.\n~\nE\nplaque~\nA plaque.\n~\n")
+    reader = area_reader.dialects.rom.RomAreaFile(path)
+    compiled = []
+    original_fields = area_reader.parser.fields
+
+    def counting_fields(object_type):
+        compiled.append(object_type)
+        return original_fields(object_type)
+
+    area_reader.parser.field_plan.cache_clear()
+    monkeypatch.setattr(area_reader.parser, "fields", counting_fields)
+
+    reader.read_and_verify_letter("E")
+    first = reader.read_object(area_reader.model.ExtraDescription)
+    reader.read_and_verify_letter("E")
+    second = reader.read_object(area_reader.model.ExtraDescription)
+
+    assert first == area_reader.model.ExtraDescription(keyword="sign", description="A sign.\n")
+    assert second == area_reader.model.ExtraDescription(keyword="plaque", description="A plaque.\n")
+    assert compiled == [area_reader.model.ExtraDescription]
+    assert reader.reader_plan(area_reader.model.ExtraDescription) is reader.reader_plan(
+        area_reader.model.ExtraDescription
+    )
+
+
+def test_parsed_models_are_slotted():
+    reader = area_reader.dialects.rom.RomAreaFile(Path("test/rom/midgaard.are"))
+    reader.load_sections()
+    pending = [reader.area]
+    seen = 0
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+        elif hasattr(type(value), "__attrs_attrs__"):
+            assert not hasattr(value, "__dict__"), type(value).__name__
+            pending.extend(getattr(value, field.name) for field in type(value).__attrs_attrs__)
+            seen += 1
+
+    assert seen > 1000
@@ -0,0 +1,130 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import area_reader.cache
+import area_reader.cli
+import area_reader.dialects.circle
+import area_reader.dialects.rom
+from conftest import HALL_ROOM, write_circle_family
+
+
+def refuse_to_parse(self, *args, **kwargs):
+    raise AssertionError("a warm cache must not parse")
+
+
+def test_warm_load_returns_the_cached_model_without_parsing(tmp_path, monkeypatch):
+    area_path = tmp_path / "midgaard.are"
+    shutil.copy(Path("test/rom/midgaard.are"), area_path)
+    cache = area_reader.cache.ParseCache(tmp_path / "cache")
+    cold = area_reader.cli.load_area(area_path, cache=cache)
+
+    monkeypatch.setattr(area_reader.dialects.rom.RomAreaFile, "load_sections", refuse_to_parse)
+    warm = area_reader.cli.load_area(area_path, cache=cache)
+
+    assert isinstance(warm, area_reader.dialects.rom.RomAreaFile)
+    assert warm.area == cold.area
+    assert warm.dumps() == cold.dumps()
+
+
+def test_changed_content_invalidates_an_entry_even_with_the_same_size_and_mtime(tmp_path):
+    area_path = tmp_path / "midgaard.are"
+    shutil.copy(Path("test/rom/midgaard.are"), area_path)
+    cache = area_reader.cache.ParseCache(tmp_path / "cache")
+    area_reader.cli.load_area(area_path, cache=cache)
+    stat = area_path.stat()
+
+    area_path.write_bytes(area_path.read_bytes().replace(b"Midgaard~", b"Midgaarx~", 1))
+    os.utime(area_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert area_reader.cli.load_area(area_path, cache=cache).area.name == "Midgaarx"
+
+
+def test_an_edit_during_the_load_is_not_cached_as_current(tmp_path, monkeypatch):
+    area_path = tmp_path / "midgaard.are"
+    shutil.copy(Path("test/rom/midgaard.are"), area_path)
+    cache = area_reader.cache.ParseCache(tmp_path / "cache")
+    load_sections = area_reader.dialects.rom.RomAreaFile.load_sections
+
+    def load_then_edit(self, *args, **kwargs):
+        load_sections(self, *args, **kwargs)
+        area_path.write_bytes(area_path.read_bytes().replace(b"Midgaard~", b"Midgaarx~", 1))
+
+    monkeypatch.setattr(area_reader.dialects.rom.RomAreaFile, "load_sections", load_then_edit)
+    assert area_reader.cli.load_area(area_path, cache=cache).area.name == "Midgaard"
+    monkeypatch.undo()
+
+    assert cache.get(area_path, area_reader.dialects.rom.RomAreaFile) is None
+    assert area_reader.cli.load_area(area_path, cache=cache).area.name == "Midgaarx"
+
+
+def test_a_hit_does_not_read_the_source_and_keeps_the_reader_state(tmp_path, monkeypatch):
+    world = write_circle_world(tmp_path)
+    cache = area_reader.cache.ParseCache(tmp_path / "cache")
+    cold = area_reader.cli.load_area(tmp_path / "world", cache=cache)
+    cold.file_fingerprints = {"wld/1.wld": b"recorded"}
+    cache.put(tmp_path / "world", cold, cache.fingerprint_sources(tmp_path / "world", type(cold)))
+
+    monkeypatch.setattr(type(cold), "__init__", refuse_to_parse)
+    warm = cache.get(tmp_path / "world", type(cold))
+
+    assert warm.area == cold.area
+    assert warm.world_root == str(world)
+    assert warm.file_fingerprints == {"wld/1.wld": b"recorded"}
+
+
+def test_library_version_is_part_of_the_key(tmp_path, monkeypatch):
+    cache = area_reader.cache.ParseCache(tmp_path)
+    area_reader.cli.load_area(Path("test/rom/midgaard.are"), cache=cache)
+
+    monkeypatch.setattr(area_reader.cache, "LIBRARY_VERSION", "another version")
+
+    assert cache.get(Path("test/rom/midgaard.are"), area_reader.dialects.rom.RomAreaFile) is None
+
+
+def test_corrupt_entries_are_treated_as_misses(tmp_path):
+    cache = area_reader.cache.ParseCache(tmp_path)
+    area_path = Path("test/rom/midgaard.are")
+    Path(cache.entry_path(area_path, area_reader.dialects.rom.RomAreaFile)).write_bytes(b"not a pickle")
+
+    assert cache.get(area_path, area_reader.dialects.rom.RomAreaFile) is None
+    assert area_reader.cli.load_area(area_path, cache=cache).area.name == "Midgaard"
+
+
+def write_circle_world(tmp_path):
+    root = write_circle_family(tmp_path, "wld", HALL_ROOM, empty_families=("zon", "mob", "obj"))
+    return root / "lib" / "world"
+
+
+@pytest.mark.parametrize(
+    ("relative_path", "text"),
+    [
+        ("wld/1.wld", "#100\nAtrium~\nA hall.\n~\n1 0 0\nS\n$\n"),
+        ("mob/index", "$\n\n"),
+        ("shp/index", "$\n"),
+    ],
+)
+def test_directory_entries_cover_every_index_and_indexed_file(tmp_path, relative_path, text):
+    world = write_circle_world(tmp_path)
+    cache = area_reader.cache.ParseCache(tmp_path / "cache")
+    cold = area_reader.cli.load_area(tmp_path / "world", cache=cache)
+    assert cache.get(tmp_path / "world", type(cold)).area == cold.area
+
+    (world / relative_path).parent.mkdir(exist_ok=True)
+    (world / relative_path).write_text(text, encoding="latin-1")
+
+    assert cache.get(tmp_path / "world", type(cold)) is None
+
+
+def test_load_many_shares_the_cache_with_its_workers(tmp_path, monkeypatch):
+    cache = area_reader.cache.ParseCache(tmp_path)
+    paths = [Path("test/rom/midgaard.are"), Path("test/rom/social.are")]
+    cold = area_reader.cli.load_many(paths, workers=2, cache=cache)
+
+    monkeypatch.setattr(area_reader.dialects.rom.RomAreaFile, "load_sections", refuse_to_parse)
+    warm = area_reader.cli.load_many(paths, workers=1, cache=cache)
+
+    assert warm[0].area_file.area == cold[0].area_file.area
+    assert isinstance(warm[1].error, ValueError)
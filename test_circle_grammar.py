@@ -1,27 +1,10 @@
-from pathlib import Path
-
 import pytest
 
 import area_reader.dialects.circle
 import area_reader.parser
 from area_reader import constants
-
-
-def write_circle_family(
-    tmp_path: Path,
-    family: str,
-    text: str,
-    *,
-    direct_world_root: bool = False,
-) -> Path:
-    root = tmp_path / "world"
-    world_root = root if direct_world_root else root / "lib" / "world"
-    family_root = world_root / family
-    family_root.mkdir(parents=True)
-    filename = f"1.{family}"
-    (family_root / filename).write_text(text, encoding="latin-1")
-    (family_root / "index").write_text(f"{filename}\n$\n", encoding="ascii")
-    return root
+from area_reader.native import NativeWriteError
+from conftest import write_circle_family
 
 
 def test_circle_reader_accepts_a_direct_world_root(tmp_path):
@@ -208,3 +191,107 @@ def test_circle_unterminated_string_reports_parse_location(tmp_path):
 
     with pytest.raises(area_reader.parser.ParseError, match=r"broken\.wld line 1 col -1: Unterminated string"):
         reader.read_string()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_circle_parallel_load_merges_indexed_files_in_index_order(tmp_path, workers):
+    world_root = tmp_path / "lib" / "world"
+    for family in ("zon", "mob", "obj", "shp"):
+        (world_root / family).mkdir(parents=True)
+        (world_root / family / "index").write_text("$\n", encoding="ascii")
+    wld = world_root / "wld"
+    wld.mkdir()
+    (wld / "1.wld").write_text("#100\nFirst~\nFirst file.~\n1 0 0\nS\n#101\nOnly~\nOnly here.~\n1 0 0\nS\n$\n")
+    (wld / "2.wld").write_text("#102\nThird~\nSecond file.~\n1 0 0\nS\n#100\nAgain~\nDuplicate.~\n1 0 0\nS\n$\n")
+    (wld / "index").write_text("1.wld\n2.wld\n$\n", encoding="ascii")
+    sequential = area_reader.dialects.circle.CircleAreaFile(tmp_path)
+    sequential.load_sections()
+
+    parallel = area_reader.dialects.circle.CircleAreaFile(tmp_path)
+    parallel.load_sections(workers=workers)
+
+    assert parallel.area == sequential.area
+    assert list(parallel.area.rooms) == [100, 101, 102]
+    assert parallel.area.rooms[100].name == "Again"
+    assert parallel.area.rooms[100].source_file == "2.wld"
+
+
+def test_circle_incremental_write_rewrites_only_changed_files(tmp_path):
+    world_root = tmp_path / "lib" / "world"
+    for family in ("zon", "mob", "obj", "shp"):
+        (world_root / family).mkdir(parents=True)
+        (world_root / family / "index").write_text("$\n", encoding="ascii")
+    wld = world_root / "wld"
+    wld.mkdir()
+    (wld / "1.wld").write_text("#100\nFirst~\nFirst file.~\n1 0 0\nS\n$\n")
+    (wld / "2.wld").write_text("#200\nSecond~\nSecond file.~\n1 0 0\nS\n$\n")
+    (wld / "index").write_text("1.wld\n2.wld\n$\n", encoding="ascii")
+    reader = area_reader.dialects.circle.CircleAreaFile(tmp_path)
+    reader.load_sections()
+    reader.write(tmp_path)
+
+    assert reader.write(tmp_path, incremental=True) == []
+
+    reader.area.rooms[200].name = "Renamed"
+    assert reader.write(tmp_path, incremental=True) == ["wld/2.wld"]
+    assert "Renamed~" in (wld / "2.wld").read_text(encoding="latin-1")
+
+    reader.area.rooms[200].source_file = "1.wld"
+    assert reader.write(tmp_path, incremental=True) == ["wld/1.wld", "wld/2.wld"]
+
+    reader.area.indexes["wld"].append("3.wld")
+    reader.area.rooms[200].source_file = "3.wld"
+    assert reader.write(tmp_path, incremental=True) == ["wld/index", "wld/1.wld", "wld/3.wld"]
+    assert len(reader.write(tmp_path / "copy", incremental=True)) == 8
+
+    reloaded = area_reader.dialects.circle.CircleAreaFile(tmp_path)
+    reloaded.load_sections()
+    assert reloaded.file_fingerprints is None
+    assert reloaded.write(tmp_path, incremental=True) == []
+
+
+def test_circle_incremental_write_renders_only_files_whose_records_changed(tmp_path, monkeypatch):
+    root = write_circle_family(
+        tmp_path,
+        "wld",
+        "#100\nFirst~\nNot in canonical form.~\n1 0 0\nS\n\n\n$\n",
+        empty_families=("zon", "mob", "obj", "shp"),
+    )
+    (root / "lib" / "world" / "wld" / "index").write_text("1.wld\n\n$\n", encoding="ascii")
+    reader = area_reader.dialects.circle.CircleAreaFile(root)
+    reader.fingerprint_files = True
+    reader.load_sections()
+    rendered = []
+    render_part = area_reader.dialects.circle._render_part
+    monkeypatch.setattr(
+        area_reader.dialects.circle, "_render_part", lambda part: rendered.append(part) or render_part(part)
+    )
+
+    assert reader.write(root / "lib" / "world", incremental=True) == []
+    assert rendered == []
+
+    reader.area.rooms[100].name = "Renamed"
+    assert reader.write(root / "lib" / "world", incremental=True) == ["wld/1.wld"]
+    assert reader.area.rooms[100] in rendered
+
+
+def test_circle_write_leaves_the_tree_untouched_when_an_encoder_fails(tmp_path):
+    world_root = tmp_path / "lib" / "world"
+    for family in ("zon", "mob", "obj", "shp"):
+        (world_root / family).mkdir(parents=True)
+        (world_root / family / "index").write_text("$\n", encoding="ascii")
+    wld = world_root / "wld"
+    wld.mkdir()
+    (wld / "1.wld").write_text("#100\nFirst~\nFirst file.~\n1 0 0\nS\n$\n")
+    (wld / "2.wld").write_text("#200\nSecond~\nSecond file.~\n1 0 0\nS\n$\n")
+    (wld / "index").write_text("1.wld\n2.wld\n$\n", encoding="ascii")
+    reader = area_reader.dialects.circle.CircleAreaFile(tmp_path)
+    reader.load_sections()
+    before = {path: path.read_bytes() for path in world_root.rglob("*") if path.is_file()}
+
+    reader.area.rooms[100].name = "Renamed"
+    reader.area.rooms[200].name = "Broken~name"
+    with pytest.raises(NativeWriteError, match="cannot contain"):
+        reader.write(tmp_path)
+
+    assert {path: path.read_bytes() for path in world_root.rglob("*") if path.is_file()} == before
@@ -1,16 +1,21 @@
 import json
+import os
+import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
+import area_reader.cache
 import area_reader.cli
 import area_reader.dialects.circle
 import area_reader.dialects.coffeemud
+import area_reader.dialects.godwars
 import area_reader.dialects.merc
 import area_reader.dialects.rom
 import area_reader.dialects.smaug
 import area_reader.dialects.swr
+from conftest import HALL_ROOM, write_circle_family
 
 
 @pytest.mark.parametrize(
@@ -109,3 +114,232 @@ def test_print_area_autodetects_circle_world_tree(tmp_path, capsys):
     area_reader.cli.print_area(tmp_path)
 
     assert isinstance(json.loads(capsys.readouterr().out), dict)
+
+
+def test_iter_records_streams_the_same_records_a_full_load_stores():
+    area_path = Path("test/rom/midgaard.are")
+    loaded = area_reader.cli.load_area(area_path)
+
+    records = list(area_reader.cli.iter_records(area_path))
+    by_section = {}
+    for section_name, record in records:
+        by_section.setdefault(section_name, []).append(record)
+
+    assert by_section["rooms"] == list(loaded.area.rooms.values())
+    assert by_section["mobiles"] == list(loaded.area.mobs.values())
+    assert by_section["objects"] == list(loaded.area.objects.values())
+    assert by_section["resets"] == loaded.area.resets
+    assert by_section["shops"] == loaded.area.shops
+
+
+def test_iter_records_does_not_store_records_on_the_area():
+    reader = area_reader.dialects.rom.RomAreaFile(Path("test/rom/midgaard.are"))
+
+    sections = {section_name for section_name, _ in reader.iter_records(only={"rooms", "area"})}
+
+    assert sections == {"rooms"}
+    assert reader.area.name
+    assert not reader.area.rooms
+
+
+def test_iter_records_streams_fuss_records_and_room_resets(tmp_path):
+    path = tmp_path / "fuss.are"
+    path.write_text(
+        "#FUSSAREA\n#AREADATA\nName SWR Test~\n#ENDAREADATA\n"
+        "#ROOM\nVnum 10\nName Hall~\nReset M 0 5 1 10\n#ENDROOM\n#ENDAREA\n",
+        encoding="latin-1",
+    )
+
+    records = list(area_reader.cli.iter_records(path))
+
+    assert [section_name for section_name, _ in records] == ["rooms", "resets"]
+    assert records[0][1].vnum == 10
+    assert records[1][1] == records[0][1].resets[0]
+
+
+def test_iter_records_walks_loaded_collections_for_tree_dialects(tmp_path):
+    root = write_circle_family(tmp_path, "wld", HALL_ROOM, empty_families=("zon", "mob", "obj", "shp"))
+
+    records = list(area_reader.cli.iter_records(root))
+
+    assert [(section_name, record.vnum) for section_name, record in records] == [("rooms", 100)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many_returns_results_in_input_order_and_collects_errors(workers):
+    paths = [Path("test/rom/midgaard.are"), Path("test/rom/social.are"), Path("test/merc/limbo.are")]
+
+    results = area_reader.cli.load_many(paths, workers=workers)
+
+    assert [result.path for result in results] == paths
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[0].area_file, area_reader.dialects.rom.RomAreaFile)
+    assert results[0].area_file.area == area_reader.cli.load_area(paths[0]).area
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].area_file is None
+    assert isinstance(results[2].area_file, area_reader.dialects.merc.MercAreaFile)
+
+
+def test_load_many_returns_readers_without_their_source_buffers():
+    (result,) = area_reader.cli.load_many([Path("test/rom/midgaard.are")], workers=1)
+
+    assert not area_reader.cache.TRANSIENT_ATTRIBUTES.intersection(vars(result.area_file))
+    assert result.area_file.as_json() == area_reader.cli.load_area("test/rom/midgaard.are").as_json()
+    assert result.area_file.dumps() == area_reader.cli.load_area("test/rom/midgaard.are").dumps()
+
+
+def test_print_records_writes_the_header_then_one_json_object_per_record(capsys):
+    area_path = Path("test/rom/midgaard.are")
+
+    area_reader.cli.print_records(area_path)
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines[0]["section"] == "area"
+    assert lines[0]["record"]["name"] == "Midgaard"
+    assert "rooms" not in lines[0]["record"]
+    assert [line["section"] for line in lines[1:]] == [
+        section_name for section_name, _ in area_reader.cli.iter_records(area_path)
+    ]
+    rooms = [line["record"] for line in lines if line["section"] == "rooms"]
+    assert rooms == list(area_reader.cli.load_area(area_path).as_dict()["rooms"].values())
+
+
+def test_print_records_keeps_fallback_collections_out_of_the_header(tmp_path, capsys):
+    root = write_circle_family(tmp_path, "wld", HALL_ROOM, empty_families=("zon", "mob", "obj", "shp"))
+
+    area_reader.cli.print_records(root)
+
+    header, room = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    indexes = {"zon": [], "wld": ["1.wld"], "mob": [], "obj": [], "shp": []}
+    assert header == {"section": "area", "record": {"indexes": indexes, "shop_headers": {}}}
+    assert room["section"] == "rooms"
+    assert room["record"]["vnum"] == 100
+
+
+def test_main_streams_ndjson_when_asked(monkeypatch):
+    seen = []
+    monkeypatch.setattr(sys, "argv", ["area-reader", "--ndjson", "example.are"])
+    monkeypatch.setattr(area_reader.cli, "print_records", seen.append)
+
+    area_reader.cli.main()
+
+    assert seen == ["example.are"]
+
+
+def test_detect_area_type_reads_past_the_prefix_when_it_is_ambiguous(tmp_path):
+    path = tmp_path / "godwars.are"
+    filler = "".join(f"#{vnum}\nmob~\n" for vnum in range(area_reader.cli.PREFIX_SIZE // 8))
+    path.write_text(f"#AREA Metadata~\n#MOBILES\n{filler}Q\n#0\n#$\n", encoding="latin-1")
+
+    assert area_reader.cli.detect_area_type(path) is area_reader.dialects.godwars.GodWarsAreaFile
+
+
+def test_detect_many_reports_confidence_and_collects_errors(tmp_path):
+    unknown = tmp_path / "unknown.are"
+    unknown.write_text("not an area file\n", encoding="latin-1")
+    paths = [Path("test/rom/midgaard.are"), Path("test/merc/limbo.are"), unknown, tmp_path / "missing.are"]
+
+    detections = area_reader.cli.detect_many(paths)
+
+    assert [detection.path for detection in detections] == paths
+    assert [detection.area_type for detection in detections] == [
+        area_reader.dialects.rom.RomAreaFile,
+        area_reader.dialects.merc.MercAreaFile,
+        None,
+        None,
+    ]
+    assert [detection.confidence for detection in detections] == [0.9, 0.75, 0.0, 0.0]
+    assert isinstance(detections[2].error, ValueError)
+    assert isinstance(detections[3].error, FileNotFoundError)
+    assert [detection.ok for detection in detections] == [True, True, False, False]
+
+
+def test_cli_imports_only_the_detected_dialect():
+    script = (
+        "import sys, area_reader, area_reader.cli\n"
+        "assert not [name for name in sys.modules if name.startswith('area_reader.dialects.')]\n"
+        "area_reader.cli.load_area('test/merc/limbo.are')\n"
+        "print(*sorted(name for name in sys.modules if name.startswith('area_reader.dialects.')))\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True)
+
+    assert result.stdout.split() == ["area_reader.dialects.merc", "area_reader.dialects.rom"]
+
+
+def test_batch_converts_a_directory_and_skips_unchanged_inputs(tmp_path, capsys):
+    source = tmp_path / "area"
+    (source / "merc").mkdir(parents=True)
+    (source / "merc" / "limbo.are").write_bytes(Path("test/merc/limbo.are").read_bytes())
+    (source / "notes.txt").write_text("not an area file\n", encoding="latin-1")
+    (source / "broken.are").write_text("#AREA\nBroken~\n#ROOMS\n#100\n", encoding="latin-1")
+    output = tmp_path / "json"
+
+    assert area_reader.cli.batch_main([str(source), "--out", str(output), "--jobs", "1"]) == 1
+
+    summary, failure = capsys.readouterr().out.splitlines()
+    assert summary.startswith("1 converted, 0 unchanged, 1 skipped, 1 failed in ")
+    assert failure.startswith(f"{source / 'broken.are'}: ")
+    assert not (output / "notes.txt.json").exists()
+    assert not (output / "broken.are.json").exists()
+    converted = json.loads((output / "merc" / "limbo.are.json").read_text(encoding="utf-8"))
+    assert converted == json.loads(area_reader.cli.load_area(source / "merc" / "limbo.are").as_json())
+
+    (source / "broken.are").unlink()
+    assert area_reader.cli.batch_main([str(source / "**" / "*.are"), "--out", str(output / "merc")]) == 0
+    assert capsys.readouterr().out.startswith("0 converted, 1 unchanged, 0 skipped, 0 failed in ")
+
+
+def test_batch_converts_world_trees_as_single_areas(tmp_path, capsys):
+    source = tmp_path / "area"
+    world = write_circle_family(source, "wld", HALL_ROOM, empty_families=("zon", "mob", "obj", "shp")) / "lib" / "world"
+    (source / "limbo.are").write_bytes(Path("test/merc/limbo.are").read_bytes())
+    output = tmp_path / "json"
+
+    assert [path for path, _ in area_reader.cli.batch_conversions(source, output)] == [
+        source / "limbo.are",
+        source / "world",
+    ]
+    assert area_reader.cli.batch_conversions(str(world / "wld" / "*.wld"), output) == [(world, output / "world.json")]
+    assert area_reader.cli.batch_main([str(source), "--out", str(output), "--jobs", "1"]) == 0
+    assert capsys.readouterr().out.startswith("2 converted, 0 unchanged, 0 skipped, 0 failed in ")
+    converted = json.loads((output / "world.json").read_text(encoding="utf-8"))
+    assert converted["rooms"]["100"]["name"] == "Hall"
+
+    (world / "wld" / "1.wld").write_text("#100\nAtrium~\nA hall.\n~\n1 0 0\nS\n$\n", encoding="latin-1")
+    os.utime(world / "wld" / "1.wld", ns=(0, (output / "world.json").stat().st_mtime_ns + 1))
+    assert area_reader.cli.batch_main([str(source), "--out", str(output), "--jobs", "1"]) == 0
+    assert capsys.readouterr().out.startswith("1 converted, 1 unchanged, 0 skipped, 0 failed in ")
+
+
+def test_main_dispatches_batch_arguments(monkeypatch):
+    seen = []
+    monkeypatch.setattr(sys, "argv", ["area-reader", "batch", "area", "--out", "json", "--jobs", "2"])
+    monkeypatch.setattr(area_reader.cli, "_run_batch", lambda parser, args: seen.append(args) or 0)
+
+    with pytest.raises(SystemExit, match="0"):
+        area_reader.cli.main()
+
+    assert [(args.source, args.out, args.jobs, args.force) for args in seen] == [("area", Path("json"), 2, False)]
+
+
+def test_main_show_loads_an_area_named_like_a_command(monkeypatch):
+    seen = []
+    monkeypatch.setattr(sys, "argv", ["area-reader", "show", "--ndjson", "batch"])
+    monkeypatch.setattr(area_reader.cli, "print_records", seen.append)
+
+    area_reader.cli.main()
+
+    assert seen == ["batch"]
+
+
+def test_batch_replaces_outputs_only_once_they_are_complete(tmp_path, monkeypatch):
+    output = tmp_path / "limbo.json"
+    output.write_text("previous", encoding="utf-8")
+    monkeypatch.setattr(area_reader.dialects.merc.MercAreaFile, "as_json", lambda self: "\udc80")
+
+    result = area_reader.cli.convert_area(Path("test/merc/limbo.are"), output)
+
+    assert result.error.startswith("UnicodeEncodeError")
+    assert output.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [output]
@@ -188,3 +188,77 @@ def test_coffeemud_rejects_malformed_residual_xml() -> None:
 
     with pytest.raises(NativeWriteError, match="residual XML"):
         render_record(mob)
+
+
+def test_coffeemud_streams_records_across_repaired_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "stream.cmare"
+    mobs = "".join(
+        f"<MOB><MCLAS>GenMob</MCLAS><MLEVL>{level}</MLEVL><OUTER DATA=kept{level} /><MTEXT>"
+        f"&lt;NAME&gt;mob {level} &amp; friend&lt;/NAME&gt;</MTEXT></MOB>"
+        for level in range(40)
+    )
+    path.write_text(f'<?xml version="1.0"?>\n<MOBS>{mobs}</MOBS>', encoding="latin-1")
+    expected = load_coffeemud(path).area
+    monkeypatch.setattr(area_reader.dialects.coffeemud.CoffeeMudAreaFile, "CHUNK_SIZE", 7)
+    source = area_reader.dialects.coffeemud.CoffeeMudAreaFile(path)
+
+    records = list(source.iter_records())
+
+    assert [section_name for section_name, _ in records] == ["mobiles"] * 40
+    assert [mob for _, mob in records] == expected.mobs
+    assert 'DATA="kept39"' in records[-1][1].outer_residual[0]
+    assert source.area.top_level == "MOBS"
+    assert source.area.mobs == []
+
+
+def test_coffeemud_record_tags_match_case_insensitively_at_every_depth(tmp_path: Path) -> None:
+    single = tmp_path / "single.cmare"
+    single.write_text("<mob><MCLAS>GenMob</MCLAS><MLEVL>4</MLEVL></mob>", encoding="latin-1")
+    catalog = tmp_path / "catalog.cmare"
+    catalog.write_text("<MOBS><mob><MCLAS>GenMob</MCLAS><MLEVL>4</MLEVL></mob></MOBS>", encoding="latin-1")
+
+    records = [
+        list(area_reader.dialects.coffeemud.CoffeeMudAreaFile(path).iter_records()) for path in (single, catalog)
+    ]
+
+    assert [[section_name for section_name, _ in pairs] for pairs in records] == [["mobiles"], ["mobiles"]]
+    assert records[0][0][1].level == records[1][0][1].level == 4
+
+
+def test_coffeemud_parse_document_parses_once_and_unwraps_single_roots(monkeypatch: pytest.MonkeyPatch) -> None:
+    reader = area_reader.dialects.coffeemud.CoffeeMudAreaFile("unused.cmare")
+    parses = []
+    fromstring = area_reader.dialects.coffeemud.ET.fromstring
+    monkeypatch.setattr(
+        area_reader.dialects.coffeemud.ET,
+        "fromstring",
+        lambda text: parses.append(text) or fromstring(text),
+    )
+
+    single = reader.parse_document('<?xml version="1.0"?>\n<NAME>a mob</NAME>\n')
+    multiple = reader.parse_document("<NAME>a mob</NAME><DISP>A mob & friend.</DISP>")
+
+    assert len(parses) == 2
+    assert (single.tag, single.text, single.tail) == ("NAME", "a mob", None)
+    assert multiple.tag == "ROOT"
+    assert [child.tag for child in multiple] == ["NAME", "DISP"]
+
+
+def test_coffeemud_payloads_are_read_from_the_direct_child(tmp_path: Path) -> None:
+    def affect(name: str) -> str:
+        return f"&lt;AFF&gt;&lt;ACLASS&gt;{name}&lt;/ACLASS&gt;&lt;ATEXT /&gt;&lt;/AFF&gt;"
+
+    path = tmp_path / "payloads.cmare"
+    path.write_text(
+        "<MOBS><MOB><MCLAS>GenMob</MCLAS><MLEVL>1</MLEVL><MTEXT>&lt;INVEN&gt;&lt;ITEM&gt;&lt;AFFECS&gt;"
+        f"{affect('Wrong')}&lt;/AFFECS&gt;&lt;/ITEM&gt;&lt;/INVEN&gt;&lt;AFFECSX /&gt;&lt;AFFECS&gt;{affect('Right')}"
+        f"{affect('Last')}&lt;/AFFECS&gt;</MTEXT></MOB></MOBS>",
+        encoding="latin-1",
+    )
+    source = load_coffeemud(path)
+    mob = source.area.mobs[0]
+
+    assert [affect.class_id for affect in mob.affects] == ["Right", "Last"]
+    rendered = source.dumps()
+    assert rendered.count("Wrong") == rendered.count("Right") == rendered.count("Last") == 1
+    assert parse_rendered_coffeemud(tmp_path, rendered).area == source.area
@@ -3,6 +3,8 @@
 from pathlib import Path
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 import area_reader.dialects.circle
 import area_reader.dialects.rom
@@ -72,3 +74,55 @@ def test_circle_record_header_rejects_a_non_numeric_vnum(tmp_path):
 
     with pytest.raises(area_reader.parser.ParseError, match="Expected numeric record header"):
         reader.read_record_header()
+
+
+@given(
+    text=st.text(alphabet="ab \r\n", max_size=60),
+    data=st.data(),
+)
+@settings(max_examples=60, deadline=None)
+def test_line_index_matches_a_linear_scan(text, data):
+    index = data.draw(st.integers(min_value=0, max_value=len(text) + 2))
+    backwards = text[:index]
+
+    location = area_reader.parser.LineIndex(text).location(index)
+
+    assert location == (backwards.count("\n") + 1, backwards[::-1].find("\n"))
+
+
+def test_repeated_errors_reuse_one_line_index_per_buffer(tmp_path):
+    path = write_area(tmp_path, "#MOBILES\n#3000\nguard~\n")
+    reader = area_reader.dialects.rom.RomAreaFile(path)
+    messages = []
+    for index in (9, 15, 21):
+        reader.index = index
+        with pytest.raises(area_reader.parser.ParseError) as caught:
+            reader.parse_fail("boom")
+        messages.append(str(caught.value))
+        assert reader.line_index.data is reader.data
+    line_index = reader.line_index
+
+    reader.index = 0
+    assert reader.location() == (1, -1)
+    assert reader.line_index is line_index
+    assert [message.split(" in section")[0].split(" ", 1)[1] for message in messages] == [
+        "line 2 col 0",
+        "line 3 col 0",
+        "line 3 col 6",
+    ]
+
+
+def test_circle_errors_rebuild_the_line_index_for_each_file(tmp_path):
+    first = tmp_path / "first.wld"
+    first.write_text("#1\n", encoding="latin-1")
+    second = tmp_path / "second.wld"
+    second.write_text("\n\n#x\n", encoding="latin-1")
+    reader = area_reader.dialects.circle.CircleAreaFile(tmp_path)
+    reader.open_circle_file(first)
+    assert reader.location() == (1, -1)
+    first_index = reader.line_index
+    reader.open_circle_file(second)
+
+    with pytest.raises(area_reader.parser.ParseError, match=r"second\.wld line 3 col 2: Expected numeric"):
+        reader.read_record_header()
+    assert reader.line_index is not first_index
@@ -251,3 +251,37 @@ def test_save_as_json_uses_the_same_enum_safe_representation(tmp_path):
     saved = json.loads((tmp_path / "enum-area.json").read_text())
     assert saved == json.loads(json.dumps(area_file.as_dict()))
     assert saved["mobs"]["1"]["act"] == "ROM_ACT_TYPES.IS_NPC|SENTINEL"
+
+
+def test_as_dict_reuses_the_module_converter(monkeypatch):
+    def refuse_to_build(self, *args, **kwargs):
+        raise AssertionError("as_dict must not build a converter per call")
+
+    area_file = area_reader.dialects.rom.RomAreaFile("test/rom/midgaard.are")
+    area_file.load_sections()
+    monkeypatch.setattr(area_reader.serialization.EnumNameConverter, "__init__", refuse_to_build)
+
+    assert area_file.as_dict()["name"] == "Midgaard"
+
+
+def test_unstructure_many_matches_each_area_as_dict():
+    area_files = [area_reader.dialects.rom.RomAreaFile(f"test/rom/{name}.are") for name in ("midgaard", "air")]
+    for area_file in area_files:
+        area_file.load_sections()
+
+    result = area_reader.serialization.unstructure_many(area_file.area for area_file in area_files)
+
+    assert result == [area_file.as_dict() for area_file in area_files]
+
+
+def test_enum_names_are_cached_per_class_and_value():
+    area_reader.serialization.enum_name.cache_clear()
+    converter = area_reader.serialization.CONVERTER
+
+    first = converter.unstructure(constants.WEAR_FLAGS.TAKE | constants.WEAR_FLAGS.FINGER)
+    again = converter.unstructure(constants.WEAR_FLAGS.TAKE | constants.WEAR_FLAGS.FINGER)
+    same_value = converter.unstructure(constants.EXIT_FLAGS(int(constants.WEAR_FLAGS.TAKE)))
+
+    assert first == again == "WEAR_FLAGS.TAKE|FINGER"
+    assert same_value.startswith("EXIT_FLAGS.")
+    assert area_reader.serialization.enum_name.cache_info().hits == 1
@@ -137,3 +137,66 @@ def test_fread_number_rejects_invalid_composed_terms(left, invalid_right):
 
     with pytest.raises(area_reader.parser.ParseError, match="Expected number"):
         reader.read_number()
+
+
+bare_word = st.text(
+    alphabet=string.ascii_letters + string.digits + "'\".,!?-_",
+    min_size=1,
+    max_size=20,
+).filter(lambda word: word[0] not in "'\"")
+
+
+@given(word=bare_word, leading_whitespace=st.sampled_from(("", " ", "\t", "\n", "\r\n ")))
+@settings(max_examples=40, deadline=None)
+def test_fread_word_reads_bare_words_up_to_whitespace(word, leading_whitespace):
+    reader = reader_for(f"{leading_whitespace}{word} tail")
+
+    assert reader.read_word() == word
+    assert reader.data[reader.index] == " "
+
+
+@given(payload=st.text(alphabet=string.ascii_letters + " \t", max_size=20), quote=st.sampled_from(("'", '"')))
+@settings(max_examples=40, deadline=None)
+def test_fread_word_reads_quoted_words_including_whitespace(payload, quote):
+    reader = reader_for(f"  {quote}{payload}{quote}rest")
+
+    assert reader.read_word() == payload
+    assert reader.read_word() == "rest"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("A", 1),
+        ("AB|C", 7),
+        ("-A|B", -3),
+        ("A5", 15),
+        ("+-3", -3),
+        ("A&B", 1 | (2 << 32)),
+        ("12 C", 12),
+    ],
+)
+def test_fread_flag_composes_letters_digits_and_banks(text, expected):
+    reader = reader_for(text)
+
+    assert reader.read_flag() == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "method", "message"),
+    [
+        ("1 2\n  3 x", "read_number", "line 2 col 4 in section N/A: Expected number"),
+        ("1 2\n  3 -x", "read_number", "line 2 col 5 in section N/A: Expected number"),
+        ("1\n2|\nx", "read_number", "line 3 col 0 in section N/A: Expected number"),
+        ("ab\ncd", "read_string", "line 2 col 2 in section N/A: Unterminated string"),
+        ("\n 'quoted", "read_word", "line 2 col 8 in section N/A: Unterminated quoted word"),
+    ],
+)
+def test_token_errors_report_the_cursor_position(text, method, message):
+    reader = reader_for(text)
+
+    with pytest.raises(area_reader.parser.ParseError) as caught:
+        while True:
+            getattr(reader, method)()
+
+    assert str(caught.value).endswith(message)
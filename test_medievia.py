@@ -1,9 +1,12 @@
 from pathlib import Path
 
+import pytest
+
 import area_reader
 import area_reader.cli
 from area_reader.dialects.medievia import MedieviaAreaFile
 from area_reader.model import Dice
+from area_reader.native import NativeWriteError
 
 ZONE = """#1
 Test Zone~
@@ -196,6 +199,37 @@ def test_medievia_native_write_round_trip(tmp_path):
     assert (destination / "lib" / "wld" / "Test_Zone").is_file()
 
 
+def test_medievia_write_tree_refuses_invalid_trees_before_writing(tmp_path):
+    source = load_fixture(write_fixture(tmp_path / "source"))
+    next(iter(source.area.rooms.values())).source_file = "Missing_Zone"
+    destination = tmp_path / "destination"
+
+    with pytest.raises(NativeWriteError, match="unknown world file"):
+        source.write_tree(destination)
+
+    assert not destination.exists()
+
+
+def test_medievia_incremental_write_skips_unchanged_files(tmp_path):
+    root = write_fixture(tmp_path / "source")
+    source = MedieviaAreaFile(root)
+    source.fingerprint_files = True
+    source.load_sections()
+    canonical = [path for path, text in source.dumps().items() if (root / "lib" / path).read_text("latin-1") != text]
+
+    assert canonical
+    assert source.write(root, incremental=True) == []
+
+    source.area.mobs[next(iter(source.area.mobs))].short_desc = "a renamed keeper"
+    assert source.write(root, incremental=True) == ["medievia.mob"]
+    assert load_fixture(root).area == source.area
+
+    unfingerprinted = load_fixture(write_fixture(tmp_path / "copy"))
+    assert unfingerprinted.file_fingerprints is None
+    assert unfingerprinted.write(tmp_path / "copy", incremental=True) == canonical
+    assert unfingerprinted.write(tmp_path / "copy", incremental=True) == []
+
+
 def test_detects_medievia_game_and_lib_roots(tmp_path):
     root = write_fixture(tmp_path / "Medievia")
 
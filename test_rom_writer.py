@@ -4,6 +4,7 @@ import pytest
 
 import area_reader.dialects.rom
 import area_reader.model
+import area_reader.native
 import area_reader.parser
 from area_reader import constants
 from area_reader.native import NativeWriteError, render_record
@@ -81,6 +82,34 @@ def test_rom_write_uses_the_canonical_rendering(tmp_path: Path) -> None:
     assert load_rom(output).area == source.area
 
 
+def test_rom_write_keeps_the_existing_file_when_an_encoder_fails(tmp_path: Path) -> None:
+    source = load_rom(Path("test/rom/midgaard.are"))
+    output = tmp_path / "written.are"
+    output.write_text("previous contents", encoding="latin-1")
+    next(reversed(source.area.rooms.values())).name = "Broken~name"
+
+    with pytest.raises(NativeWriteError):
+        source.write(output)
+
+    assert output.read_text(encoding="latin-1") == "previous contents"
+    assert [path.name for path in tmp_path.iterdir()] == ["written.are"]
+
+
+def test_rom_write_to_streams_one_record_per_write() -> None:
+    source = load_rom(Path("test/rom/midgaard.are"))
+    writes = []
+
+    class Stream:
+        def writelines(self, chunks):
+            writes.extend(chunks)
+
+    source.write_to(Stream())
+
+    assert "".join(writes) == source.dumps()
+    assert render_record(next(iter(source.area.rooms.values()))) in writes
+    assert max(map(len, writes)) < len(source.dumps()) // 20
+
+
 def test_rom_reset_preserves_if_flag_and_comment(tmp_path: Path) -> None:
     path = tmp_path / "reset.are"
     path.write_text(
@@ -206,3 +235,27 @@ def test_rom_mobprog_annotations_are_bidirectional(tmp_path: Path) -> None:
 def test_rom_annotations_reject_unrepresentable_models(record: object) -> None:
     with pytest.raises(NativeWriteError):
         render_record(record)
+
+
+def test_render_plans_are_compiled_once_per_class_and_section() -> None:
+    area_file = area_reader.dialects.rom.RomAreaFile(Path("test/rom/midgaard.are"))
+    area_file.load_sections()
+    exit = next(room.exits[0] for room in area_file.area.rooms.values() if room.exits)
+
+    plan = area_reader.native.render_plan(type(exit))
+
+    assert area_reader.native.render_plan(type(exit)) is plan
+    orders = [native.order for _, native in plan.steps]
+    assert orders == sorted(orders)
+    assert plan.render(exit) == plan.render_checked(exit) == render_record(exit)
+
+
+def test_rendering_failures_still_name_the_nested_field() -> None:
+    room = area_reader.model.Room(
+        vnum=1,
+        name="Room",
+        exits=[area_reader.model.Exit(door=0, exit_info=constants.EXIT_FLAGS.CLOSED)],
+    )
+
+    with pytest.raises(NativeWriteError, match=r"^Room\.exits: Exit\.exit_info: ROM exit flags"):
+        render_record(room)
@@ -155,3 +155,35 @@ S
     reparsed = parse_rendered_smaug(tmp_path, area_file.dumps())
 
     assert reparsed.area == area_file.area
+
+
+def test_smaug_program_blocks_are_scanned_per_block(tmp_path: Path) -> None:
+    path = tmp_path / "programs.are"
+    path.write_text(
+        """#AREA Programs~
+#ROOMS
+#3
+A room~
+A room is here.~
+0 1 2 3 4 5 6
+> rand_prog 50~
+say random
+~
+> 'speech_prog' p hello~
+say quoted
+~
+|
+S
+#0
+#$
+""",
+        encoding="latin-1",
+    )
+    area_file = load_smaug(path)
+
+    programs = area_file.area.rooms[3].programs
+    assert [(program.trigger, program.argument, program.commands) for program in programs] == [
+        ("rand_prog", "50", "say random\n"),
+        ("speech_prog", "p hello", "say quoted\n"),
+    ]
+    assert parse_rendered_smaug(tmp_path, area_file.dumps()).area == area_file.area
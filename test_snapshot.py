@@ -0,0 +1,116 @@
+import enum
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+from attr import attr, attributes
+
+import area_reader.cli
+import area_reader.dialects.coffeemud
+import area_reader.snapshot
+from area_reader import constants
+from area_reader.model import ExtraDescription
+from test_tba_grammar import write_tba_world
+
+
+@attributes
+class Sample:
+    value = attr(default=None)
+
+
+def loaded_areas(directory):
+    return [
+        result.area_file.area
+        for result in area_reader.cli.load_many(sorted(Path(directory).glob("*.are")), 1)
+        if result.ok
+    ]
+
+
+@pytest.mark.parametrize("directory", ["test/rom", "test/merc"])
+def test_corpus_snapshot_loads_equal_models(tmp_path, directory):
+    areas = loaded_areas(directory)
+    path = tmp_path / "corpus.snapshot"
+
+    area_reader.snapshot.dump_snapshot(areas, path)
+
+    assert area_reader.snapshot.load_snapshot(path) == areas
+
+
+def test_tree_and_xml_models_round_trip(tmp_path):
+    tba = area_reader.cli.load_area(write_tba_world(tmp_path))
+    path = tmp_path / "residual.cmare"
+    path.write_text(
+        "<MOBS><MOB><MCLAS>GenMob</MCLAS><MLEVL>1</MLEVL><OUTER DATA=kept /><MTEXT>"
+        "&lt;NAME&gt;a residual mob&lt;/NAME&gt;</MTEXT></MOB></MOBS>",
+        encoding="latin-1",
+    )
+    coffee = area_reader.dialects.coffeemud.CoffeeMudAreaFile(path)
+    coffee.load_sections()
+
+    for area in (tba.area, coffee.area):
+        assert area_reader.snapshot.loads_snapshot(area_reader.snapshot.dumps_snapshot(area)) == area
+
+
+def test_mixed_columns_keep_every_value_and_type():
+    samples = [
+        ExtraDescription(keyword=None, description=(1, "two")),
+        ExtraDescription(keyword=True, description=[1 << 70, -(1 << 70)]),
+        ExtraDescription(keyword=2.5, description=OrderedDict([("b", 1), ("a", None)])),
+        ExtraDescription(keyword="☃", description={3: constants.EXIT_FLAGS.ISDOOR | constants.EXIT_FLAGS.CLOSED}),
+        ExtraDescription(keyword=ExtraDescription(), description=[]),
+    ]
+
+    loaded = area_reader.snapshot.loads_snapshot(area_reader.snapshot.dumps_snapshot(samples))
+
+    assert loaded == samples
+    assert [type(sample.keyword) for sample in loaded] == [type(sample.keyword) for sample in samples]
+    assert [type(sample.description) for sample in loaded] == [type(sample.description) for sample in samples]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"nope", "Truncated snapshot header"),
+        (b"NOTSNP\x01\x00", "Not an area snapshot"),
+        (area_reader.snapshot.HEADER.pack(b"ARSNAP", 99), "Unsupported snapshot format version 99"),
+        (area_reader.snapshot.dumps_snapshot([1])[:-1], "Truncated snapshot"),
+        (area_reader.snapshot.dumps_snapshot([1]) + b"\0", "Trailing data"),
+    ],
+)
+def test_malformed_snapshots_are_rejected(data, message):
+    with pytest.raises(area_reader.snapshot.SnapshotError, match=message):
+        area_reader.snapshot.loads_snapshot(data)
+
+
+def test_snapshots_only_resolve_area_reader_classes():
+    data = area_reader.snapshot.dumps_snapshot(Sample())
+
+    with pytest.raises(area_reader.snapshot.SnapshotError, match="untrusted class test_snapshot:Sample"):
+        area_reader.snapshot.loads_snapshot(data)
+
+
+@pytest.mark.parametrize(
+    ("module", "qualname", "message"),
+    [
+        ("area_reader.snapshot", "os.system", "nested name area_reader.snapshot:os.system"),
+        ("area_reader.snapshot", "OrderedDict", "not an area_reader class"),
+        ("area_reader.snapshot", "dumps_snapshot", "not an area_reader class"),
+        ("area_reader.missing", "Anything", "not an area_reader class"),
+        ("area_reader.model", "ExtraDescription", "uses area_reader.model:ExtraDescription as a enum class"),
+    ],
+)
+def test_snapshot_class_refs_cannot_reach_other_callables(module, qualname, message):
+    class Crafted(enum.Enum):
+        COMMAND = "echo crafted"
+
+    Crafted.__module__ = module
+    Crafted.__qualname__ = qualname
+    data = area_reader.snapshot.dumps_snapshot([Crafted.COMMAND])
+
+    with pytest.raises(area_reader.snapshot.SnapshotError, match=message):
+        area_reader.snapshot.loads_snapshot(data)
+
+
+def test_unsupported_values_are_rejected():
+    with pytest.raises(area_reader.snapshot.SnapshotError, match="Cannot snapshot set values"):
+        area_reader.snapshot.dumps_snapshot({1, 2})
@@ -107,3 +107,27 @@ def test_swr_mobile_rejects_non_uniform_armor_class() -> None:
 
     with pytest.raises(NativeWriteError):
         render_record(mob)
+
+
+def test_fuss_key_tables_keep_unknown_keys_and_resolve_per_class(tmp_path: Path) -> None:
+    path = tmp_path / "keys.are"
+    path.write_text(
+        "#FUSSAREA\n#AREADATA\nName Keys~\n#ENDAREADATA\n\n"
+        "#OBJECT\nVnum 7\nShort a wand~\nSpells 'armor'\nGlow 3 4\nLore tilde text~\n#ENDOBJECT\n\n#ENDAREA\n",
+        encoding="latin-1",
+    )
+
+    class ShoutingSwrAreaFile(area_reader.dialects.swr.SwrAreaFile):
+        def read_fuss_line(self):
+            return super().read_fuss_line().upper()
+
+    item = load_swr(path).area.objects[7]
+    shouting = ShoutingSwrAreaFile(path)
+    shouting.load_sections()
+
+    assert item.spells == "'armor'"
+    assert [(unknown.key, unknown.value, unknown.tilde) for unknown in item.unknown] == [
+        ("Glow", "3 4", False),
+        ("Lore", "tilde text", True),
+    ]
+    assert shouting.area.objects[7].spells == "'ARMOR'"
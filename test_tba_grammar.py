@@ -203,3 +203,15 @@ def test_loading_actual_tba_world_when_available():
     assert reader.area.shops
     assert reader.area.triggers
     assert reader.area.quests
+
+
+def test_tba_parallel_load_matches_a_sequential_load(tmp_path):
+    root = write_tba_world(tmp_path)
+    sequential = area_reader.TbaAreaFile(root)
+    sequential.load_sections()
+
+    parallel = area_reader.TbaAreaFile(root)
+    parallel.load_sections(workers=2)
+
+    assert parallel.area == sequential.area
+    assert parallel.area.triggers[900].source_file == "1.trg"